@@ -0,0 +1,239 @@
+"""
+Benchmark page-object operations terhadap local Wikipedia stand-in
+
+Usage:
+    python -m benchmarks.run                      # run dan bandingkan dengan baseline
+    python -m benchmarks.run --update-baseline    # simpan hasil sebagai baseline baru
+    python -m benchmarks.run --only home_page.open --iterations 50
+
+Setiap operasi dijalankan berulang kali. Hasilnya berupa latency p50/p95/p99
+dan jumlah WebDriver command per operasi. Run gagal (exit code 1) jika p95
+lebih lambat dari baseline * (1 + threshold) atau jumlah command bertambah.
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+import time
+
+from pages.article_page import ArticlePage
+from pages.base_page import BasePage
+from pages.home_pages import HomePage
+from pages.search_page import SearchPage
+from utils.config import Config
+from utils.driver_factory import DriverFactory
+from utils.instrumentation import CommandRecorder
+from utils.local_server import WikipediaStandIn
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+RESULTS_FILE = "reports/benchmarks.json"
+COMMANDS_FILE = "reports/benchmark_commands.json"
+ARTICLE_PATH = "/wiki/Python_(programming_language)"
+# Query dengan recording search-redirect dan Special:Search di stand-in
+SEARCH_KEYWORD = "list programming languages"
+
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile
+
+    Args:
+        values (list): Data
+        pct (float): Percentile 0-100
+
+    Returns:
+        float: Nilai percentile
+    """
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+# ========== Operations ==========
+# Setiap operasi: setup(ctx) tidak diukur, run(ctx) diukur.
+
+def _startup_run(ctx):
+    DriverFactory.get_driver(ctx["browser"]).quit()
+
+
+def _find_element_setup(ctx):
+    HomePage(ctx["driver"]).open()
+
+
+def _find_element_run(ctx):
+    BasePage(ctx["driver"]).find_element(HomePage.SEARCH_INPUT)
+
+
+def _cached_attribute_run(ctx):
+    # Setelah iterasi pertama element diambil dari element cache
+    BasePage(ctx["driver"]).get_attribute(HomePage.SEARCH_INPUT, "name")
+
+
+def _home_open_run(ctx):
+    HomePage(ctx["driver"]).open()
+
+
+def _search_setup(ctx):
+    HomePage(ctx["driver"]).open()
+
+
+def _search_run(ctx):
+    SearchPage(ctx["driver"]).search(SEARCH_KEYWORD)
+
+
+def _toc_setup(ctx):
+    page = ArticlePage(ctx["driver"])
+    page.open_url(ctx["stand_in"].url_for("en.wikipedia.org", ARTICLE_PATH))
+    page.wait_for_page_load()
+
+
+def _toc_run(ctx):
+    ArticlePage(ctx["driver"]).get_toc_items()
+
+
+OPERATIONS = {
+    "driver_factory.get_driver": {"setup": None, "run": _startup_run, "iterations": 3},
+    "base_page.find_element": {"setup": _find_element_setup, "run": _find_element_run, "setup_once": True},
+    "base_page.cached_attribute": {"setup": _find_element_setup, "run": _cached_attribute_run, "setup_once": True},
+    "home_page.open": {"setup": None, "run": _home_open_run},
+    "search_page.search": {"setup": _search_setup, "run": _search_run},
+    "article_page.get_toc_items": {"setup": _toc_setup, "run": _toc_run, "setup_once": True},
+}
+
+
+def run_operation(name, operation, ctx, recorder, iterations):
+    """
+    Jalankan satu operasi berulang kali
+
+    Returns:
+        dict: p50, p95, p99 (detik), commands (rata-rata per iterasi), iterations
+    """
+    iterations = operation.get("iterations", iterations)
+    setup = operation["setup"]
+    if setup and operation.get("setup_once"):
+        setup(ctx)
+
+    timings, commands = [], []
+    for _ in range(iterations):
+        if setup and not operation.get("setup_once"):
+            setup(ctx)
+        before = recorder.total_commands
+        recorder.current_test = name
+        start = time.perf_counter()
+        operation["run"](ctx)
+        timings.append(time.perf_counter() - start)
+        commands.append(recorder.total_commands - before)
+        recorder.current_test = None
+
+    result = {
+        "p50": percentile(timings, 50),
+        "p95": percentile(timings, 95),
+        "p99": percentile(timings, 99),
+        "commands": sum(commands) / len(commands),
+        "iterations": iterations,
+    }
+    logger.info("%s: p50=%.1fms p95=%.1fms", name, result["p50"] * 1000, result["p95"] * 1000)
+    return result
+
+
+def compare(results, baseline, threshold):
+    """
+    Bandingkan hasil dengan baseline
+
+    Returns:
+        list: Pesan regresi, kosong jika tidak ada
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        limit = base["p95"] * (1 + threshold)
+        if result["p95"] > limit:
+            regressions.append(
+                f"{name}: p95 {result['p95'] * 1000:.1f}ms > {limit * 1000:.1f}ms "
+                f"(baseline {base['p95'] * 1000:.1f}ms + {threshold:.0%})"
+            )
+        if result["commands"] > base["commands"]:
+            regressions.append(f"{name}: {result['commands']:.1f} commands > baseline {base['commands']:.1f}")
+    return regressions
+
+
+def print_report(results):
+    print(f"{'operation':<32}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'commands':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<32}{result['p50'] * 1000:>10.1f}{result['p95'] * 1000:>10.1f}"
+            f"{result['p99'] * 1000:>10.1f}{result['commands']:>10.1f}"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark page-object operations")
+    parser.add_argument("--browser", default=Config.BROWSER)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--only", action="append", help="Nama operasi (boleh diulang)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Toleransi p95 terhadap baseline (0.2 = 20%%)")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--record", action="store_true", help="Rekam halaman yang belum ada di recordings")
+    parser.add_argument("--launch-profile", choices=DriverFactory.LAUNCH_PROFILES, default=Config.LAUNCH_PROFILE,
+                        help="Bandingkan startup dan navigasi antar launch profile")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    stand_in = WikipediaStandIn(record=args.record).start()
+    Config.LAUNCH_PROFILE = args.launch_profile
+    Config.HEADLESS = Config.HEADLESS or args.headless
+    Config.BASE_URL = stand_in.url_for("www.wikipedia.org")
+    Config.EN_WIKIPEDIA_URL = stand_in.url_for("en.wikipedia.org")
+
+    driver = DriverFactory.get_driver(args.browser)
+    recorder = CommandRecorder()
+    recorder.instrument(driver)
+    ctx = {"driver": driver, "browser": args.browser, "stand_in": stand_in}
+
+    names = args.only or list(OPERATIONS)
+    results = {}
+    try:
+        for name in names:
+            results[name] = run_operation(name, OPERATIONS[name], ctx, recorder, args.iterations)
+    finally:
+        driver.quit()
+        stand_in.stop()
+
+    print_report(results)
+    os.makedirs(os.path.dirname(RESULTS_FILE), exist_ok=True)
+    with open(RESULTS_FILE, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    recorder.save(COMMANDS_FILE)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except OSError:
+        print(f"No baseline at {args.baseline}, run with --update-baseline first")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
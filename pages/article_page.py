@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
+from utils.config import Config
 import logging
 
 class ArticlePage(BasePage):
@@ -20,26 +21,35 @@ class ArticlePage(BasePage):
     ARTICLE_CONTENT = (By.CSS_SELECTOR, ".mw-parser-output")
     ARTICLE_PARAGRAPHS = (By.CSS_SELECTOR, ".mw-parser-output > p")
     
+    READY_LOCATORS = (ARTICLE_TITLE, ARTICLE_PARAGRAPHS)
+    
+    URL_PATTERN = r"/wiki/(?!Special:)[^?#]+"
+    PERFORMANCE_BUDGET = {"lcp": 2500, "cls": 0.1}
+    
+    @staticmethod
+    def url_for(title):
+        """Return URL artikel English Wikipedia untuk judul, mis. 'World War II'"""
+        return f"{Config.EN_WIKIPEDIA_URL}wiki/{title.replace(' ', '_')}"
+    
     def get_article_title(self):
         title = self.get_text(self.ARTICLE_TITLE)
-        self.logger.info(f"article title {title}")
+        self.logger.info("article title %s", title)
         return title
     
     def is_article_loaded(self):
         is_loaded = self.is_element_visible(self.ARTICLE_SUBTITLE)
-        self.logger.debug(f"article loaded {is_loaded}")
+        self.logger.debug("article loaded %s", is_loaded)
         return is_loaded
     
     def get_first_paragraph(self):
         """
         Get first non-empty paragraph text
         """
-        paragraphs = self.find_elements(self.ARTICLE_PARAGRAPHS)
+        paragraphs = self.get_texts(self.ARTICLE_PARAGRAPHS)
 
-        for p in paragraphs:
-            text = p.text.strip()
+        for text in paragraphs:
             if text:
-                self.logger.info(f"First paragraph: {text[:80]}...")
+                self.logger.info("First paragraph: %s...", text[:80])
                 return text
 
         self.logger.warning("No non-empty paragraph found")
@@ -55,21 +65,20 @@ class ArticlePage(BasePage):
     
     def get_toc_title(self):
         title = self.get_text(self.TOC_TITLE)
-        self.logger.info(f"table of contents title {title}")
+        self.logger.info("table of contents title %s", title)
         return title
     
     def get_toc_items(self):
-        links = self.find_elements(self.TOC_LINKS)
-        toc_items = [link.text for link in links]
-        self.logger.info(f"table of contents items: {toc_items}")
+        toc_items = self.get_texts(self.TOC_LINKS)
+        self.logger.info("table of contents items: %s", toc_items)
         return toc_items
     
     def click_toc_item(self, item_text):
-        links = self.find_elements(self.TOC_LINKS)
-        for link in links:
-            if link.text.strip().lower() == item_text.strip().lower():
+        links = self.get_texts(self.TOC_LINKS, with_elements=True)
+        for text, link in links:
+            if text.lower() == item_text.strip().lower():
                 link.click()
-                self.logger.info(f"clicked TOC item: {item_text}")
+                self.logger.info("clicked TOC item: %s", item_text)
                 return
         raise ValueError(f"TOC item '{item_text}' not found")
     
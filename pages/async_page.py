@@ -0,0 +1,166 @@
+"""
+Async page objects untuk menjalankan banyak browser session dari satu event loop
+
+Selenium WebDriver client bersifat blocking, jadi setiap driver mendapat satu
+executor thread sendiri: semua command untuk driver tersebut tetap berurutan
+(seperti di page object sync), sementara driver lain berjalan bersamaan.
+Selama menunggu HTTP round trip ke driver, GIL dilepas sehingga puluhan
+session bisa dikontrol dari satu proses.
+
+Usage:
+    async with pool.session() as driver:
+        article = AsyncArticlePage(driver)
+        await article.open_url(url)
+        title = await article.get_article_title()
+
+Setiap method public page object sync tersedia sebagai coroutine dengan nama
+yang sama. Attribute lain (property, locator, konstanta) tidak ikut; akses
+lewat page sync di attribute page.
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from pages.article_page import ArticlePage
+from pages.home_pages import HomePage
+from pages.search_page import SearchPage
+from pages.search_result import SearchResult
+
+_executors = weakref.WeakKeyDictionary()
+
+
+def executor_for(driver):
+    """
+    Return executor satu thread milik driver, dibuat saat pertama dipakai
+
+    Args:
+        driver: WebDriver instance
+
+    Returns:
+        ThreadPoolExecutor: Executor dengan max_workers=1
+    """
+    executor = _executors.get(driver)
+    if executor is None:
+        executor = _executors[driver] = ThreadPoolExecutor(max_workers=1, thread_name_prefix="driver")
+        weakref.finalize(driver, executor.shutdown, wait=False)
+    return executor
+
+
+async def run_on_driver(driver, func, *args, **kwargs):
+    """
+    Jalankan function blocking di executor thread driver
+
+    Args:
+        driver: WebDriver instance
+        func (callable): Function yang memakai driver
+
+    Returns:
+        Return value dari func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor_for(driver), functools.partial(func, *args, **kwargs))
+
+
+def _async_method(name, func):
+    """Coroutine yang menjalankan method page sync dengan nama name di executor driver"""
+
+    @functools.wraps(func)
+    async def method(self, *args, **kwargs):
+        return await run_on_driver(self.driver, getattr(self.page, name), *args, **kwargs)
+
+    return method
+
+
+class AsyncPage:
+    """Async wrapper untuk page object sync, di-set lewat PAGE_CLASS"""
+
+    PAGE_CLASS = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.PAGE_CLASS is None:
+            return
+        # Method public didefinisikan di class, jadi nama yang salah langsung AttributeError.
+        # Staticmethod (mis. url_for) tidak memakai driver, panggil dari page class sync.
+        for name, func in inspect.getmembers(cls.PAGE_CLASS, inspect.isfunction):
+            if name.startswith("_") or name in cls.__dict__:
+                continue
+            if isinstance(inspect.getattr_static(cls.PAGE_CLASS, name), staticmethod):
+                continue
+            setattr(cls, name, _async_method(name, func))
+
+    def __init__(self, driver):
+        """
+        Initialize AsyncPage
+
+        Args:
+            driver: WebDriver instance
+        """
+        self.driver = driver
+        self.page = self.PAGE_CLASS(driver)
+
+
+class AsyncHomePage(AsyncPage):
+    PAGE_CLASS = HomePage
+
+
+class AsyncSearchPage(AsyncPage):
+    PAGE_CLASS = SearchPage
+
+
+class AsyncSearchResult(AsyncPage):
+    PAGE_CLASS = SearchResult
+
+
+class AsyncArticlePage(AsyncPage):
+    PAGE_CLASS = ArticlePage
+
+
+class AsyncDriverPool:
+    """Checkout/checkin DriverPool tanpa memblokir event loop"""
+
+    def __init__(self, pool):
+        """
+        Initialize AsyncDriverPool
+
+        Args:
+            pool (DriverPool): Pool yang dibungkus, ukurannya membatasi jumlah session bersamaan
+        """
+        self.pool = pool
+
+    @contextlib.asynccontextmanager
+    async def session(self, timeout=None):
+        """
+        Async context manager yang meminjam satu driver dari pool
+
+        Args:
+            timeout (int): Berapa lama menunggu jika semua session sedang dipakai
+        """
+        driver = await asyncio.to_thread(self.pool.checkout, timeout)
+        try:
+            yield driver
+        finally:
+            await run_on_driver(driver, self.pool.checkin, driver)
+
+    async def map(self, func, items, timeout=None):
+        """
+        Jalankan coroutine func(driver, item) untuk setiap item secara bersamaan
+
+        Jumlah yang benar-benar berjalan bersamaan dibatasi ukuran pool.
+
+        Args:
+            func (callable): Coroutine function yang menerima (driver, item)
+            items (iterable): Data, mis. Config.POPULAR_ARTICLES
+
+        Returns:
+            list: Hasil func dengan urutan yang sama dengan items
+        """
+        async def run(item):
+            async with self.session(timeout) as driver:
+                return await func(driver, item)
+
+        return await asyncio.gather(*(run(item) for item in items))
@@ -1,12 +1,54 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException, NoSuchElementException, StaleElementReferenceException, JavascriptException,
+    InvalidCookieDomainException, WebDriverException
+)
+from pages.element_cache import ElementCache
+from pages.scripts import (
+    QUERY_MANY_JS, GET_TEXTS_JS, GET_ATTRIBUTES_JS, OBSERVE_CONDITION_JS, PAGE_READY_JS,
+    MARK_NAVIGATION_PENDING_JS, PERFORMANCE_METRICS_JS, SNAPSHOT_STATE_JS, RESTORE_STORAGE_JS
+)
+from pages.session_state import state_cache
+from utils.artifacts import artifact_pipeline
 from utils.config import Config
+from utils.event_streams import EventStreams
+from utils.performance_metrics import performance_metrics
+from utils.tracing import tracer, trace_methods
 import logging
+import re
+import time
+
+
+def document_ready(driver):
+    """Condition untuk wait: document.readyState complete"""
+    return driver.execute_script("return document.readyState") == "complete"
+
+
+# Method yang sudah mencatat span "wait" sendiri
+_SELF_TRACED = ("wait_until", "observe_until")
+
+# Page object classes dengan URL_PATTERN, untuk memilih budget halaman tujuan navigasi
+_PAGE_CLASSES = []
+
 
 class BasePage:
     
+    # Locator yang harus present sebelum halaman dianggap siap dipakai.
+    # Kosong berarti menunggu document.readyState complete.
+    READY_LOCATORS = ()
+    
+    # Regex URL halaman ini dan batas performance metrics (lihat utils.performance_metrics),
+    # mis. {"lcp": 2500}. Dicek setiap navigasi saat Config.COLLECT_PERFORMANCE_METRICS aktif.
+    URL_PATTERN = None
+    PERFORMANCE_BUDGET = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, exclude=_SELF_TRACED)
+        if "URL_PATTERN" in cls.__dict__ and cls.URL_PATTERN:
+            _PAGE_CLASSES.append(cls)
+    
     def __init__(self, driver):
         """
         Initialize BasePage
@@ -15,14 +57,138 @@ class BasePage:
             driver: WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, Config.EXPLICIT_WAIT)
         self.actions = ActionChains(driver)
         self.logger = logging.getLogger(__name__)
+        self.wait_log = []
+    
+    @property
+    def element_cache(self):
+        """ElementCache yang dibagi semua page object di driver ini, None jika nonaktif"""
+        if not Config.ELEMENT_CACHE:
+            return None
+        return ElementCache.for_driver(self.driver)
+    
+    @property
+    def events(self):
+        """EventStreams (console, network, navigation) driver ini, None jika Config.EVENT_STREAMS nonaktif"""
+        return EventStreams.for_driver(self.driver)
+    
+    # ========== Wait Engine ==========
+    
+    def wait_until(self, condition, timeout=None, description=None):
+        """
+        Wait hingga condition bernilai truthy, polling dengan exponential backoff
+        
+        Condition dicek sekali tanpa delay (fast path untuk element yang sudah ada),
+        lalu interval polling naik dari WAIT_POLL_INITIAL hingga WAIT_POLL_MAX.
+        Setiap call dicatat di self.wait_log (description, elapsed, polls, success).
+        
+        Args:
+            condition (callable): Function yang menerima driver, seperti expected_conditions
+            timeout (float): Custom timeout, 0 berarti hanya satu kali check
+            description (str): Keterangan untuk log dan error message
+            
+        Returns:
+            Value truthy terakhir dari condition
+            
+        Raises:
+            TimeoutException: Jika condition tidak terpenuhi sebelum timeout
+        """
+        wait_time = Config.EXPLICIT_WAIT if timeout is None else timeout
+        description = description or getattr(condition, "__name__", repr(condition))
+        start = time.monotonic()
+        deadline = start + wait_time
+        interval = Config.WAIT_POLL_INITIAL
+        polls = 0
+        
+        with tracer.span(f"wait {description}", "wait", timeout=wait_time):
+            while True:
+                polls += 1
+                try:
+                    with tracer.span("poll", "wait", poll=polls):
+                        value = condition(self.driver)
+                    if value:
+                        self._record_wait(description, start, polls, True)
+                        return value
+                except (NoSuchElementException, StaleElementReferenceException):
+                    pass
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._record_wait(description, start, polls, False)
+                    raise TimeoutException(f"Timed out after {wait_time}s waiting for {description}")
+                time.sleep(min(interval, remaining))
+                interval = min(interval * Config.WAIT_POLL_BACKOFF, Config.WAIT_POLL_MAX)
+    
+    def observe_until(self, kind, locator=None, timeout=None, description=None):
+        """
+        Wait memakai MutationObserver di browser, satu execute_async_script call
+        
+        Script return segera setelah condition terpenuhi, tanpa polling lewat
+        WebDriver. Jika script terputus (mis. karena navigasi), sisa waktu
+        dilanjutkan dengan wait_until.
+        
+        Args:
+            kind (str): "visible", "invisible", atau "ready" (document.readyState complete)
+            locator (tuple): Tuple of (By.TYPE, "value"), tidak dipakai untuk "ready"
+            timeout (float): Custom timeout
+            description (str): Keterangan untuk log dan error message
+            
+        Raises:
+            TimeoutException: Jika condition tidak terpenuhi sebelum timeout
+        """
+        wait_time = Config.EXPLICIT_WAIT if timeout is None else timeout
+        description = description or f"{kind} {locator or ''}".strip()
+        by, value = locator or (None, None)
+        start = time.monotonic()
+        
+        try:
+            with tracer.span(f"observe {description}", "wait", timeout=wait_time):
+                result = self.driver.execute_async_script(OBSERVE_CONDITION_JS, kind, by, value, int(wait_time * 1000))
+        except (JavascriptException, TimeoutException) as e:
+            self.logger.debug("Observer wait terputus (%s), fallback ke polling", e.__class__.__name__)
+            remaining = max(wait_time - (time.monotonic() - start), 0)
+            return self.wait_until(self._observer_fallbacks[kind](locator), remaining, description)
+        
+        self._record_wait(description, start, 1, bool(result))
+        if not result:
+            raise TimeoutException(f"Timed out after {wait_time}s waiting for {description}")
+        return True
+    
+    _observer_fallbacks = {
+        "visible": EC.visibility_of_element_located,
+        "invisible": EC.invisibility_of_element_located,
+        "ready": lambda locator: document_ready,
+    }
+    
+    def _record_wait(self, description, start, polls, success):
+        elapsed = time.monotonic() - start
+        self.wait_log.append({
+            "description": description,
+            "elapsed": elapsed,
+            "polls": polls,
+            "success": success,
+        })
+        self.logger.debug("Waited %.3fs (%s polls, success=%s) for %s", elapsed, polls, success, description)
+    
+    def get_total_wait_time(self):
+        """
+        Return total waktu yang dihabiskan untuk wait oleh page object ini
+        
+        Returns:
+            float: Total detik
+        """
+        return sum(entry["elapsed"] for entry in self.wait_log)
+    
+    # ========== Element Methods ==========
         
     def find_element(self, locator):
         """
         Find dan return single element
         
+        Selalu lookup baru: element dipakai caller di luar stale retry
+        _with_element, jadi tidak diambil dari element cache.
+        
         Args:
             locator (tuple): Tuple of (By.TYPE, "value")
             
@@ -30,17 +196,31 @@ class BasePage:
             WebElement: Element yang ditemukan
         """
         try:
-            element = self.wait.until(EC.presence_of_element_located(locator))
-            self.logger.debug(f"Element ditemukan {locator}")
+            element = self.wait_until(EC.presence_of_element_located(locator), description=f"presence of {locator}")
+            self.logger.debug("Element ditemukan %s", locator)
             return element
         except TimeoutException:
-            self.logger.error(f"element tidak ditemukan{locator}")
+            self.logger.error("element tidak ditemukan%s", locator)
             return []
+    
+    def _find_cached_element(self, locator):
+        """Find element lewat element cache, hanya untuk _with_element (ada stale retry)"""
+        cache = self.element_cache
+        key = ("one", tuple(locator))
+        element = cache.get(key) if cache is not None else None
+        if element is None:
+            element = self.find_element(locator)
+            if cache is not None and element:
+                cache.put(key, element)
+        return element
             
     def find_elements(self, locator):
         """
         Find dan return multiple elements
         
+        Tidak memakai element cache: list bisa bertambah oleh JavaScript
+        halaman (hasil search, typeahead) tanpa WebDriver command.
+        
         Args:
             locator (tuple): Tuple of (By.TYPE, "value")
             
@@ -48,11 +228,11 @@ class BasePage:
             list: List of WebElements
         """
         try:
-            elements = self.wait.until(EC.presence_of_all_elements_located(locator))
-            self.logger.debug(f"Ditemukan {len(elements)} elements: {locator}")
+            elements = self.wait_until(EC.presence_of_all_elements_located(locator), description=f"presence of all {locator}")
+            self.logger.debug("Ditemukan %s elements: %s", len(elements), locator)
             return elements
         except TimeoutException:
-            self.logger.error(f"Elements tidak ditemukan: {locator}")
+            self.logger.error("Elements tidak ditemukan: %s", locator)
             return []
         
     def click(self, locator):
@@ -63,12 +243,18 @@ class BasePage:
             locator (tuple): Tuple of (By.TYPE, "value")
         """
         try:
-            element = self.wait.until(EC.element_to_be_clickable(locator))
-            element.click()
-            self.logger.debug(f"Clicked element{locator}")
+            try:
+                element = self.wait_until(EC.element_to_be_clickable(locator), description=f"clickable {locator}")
+                element.click()
+            except StaleElementReferenceException:
+                self.logger.debug("Element stale sebelum click, lookup ulang %s", locator)
+                element = self.wait_until(EC.element_to_be_clickable(locator), description=f"clickable {locator}")
+                element.click()
+            self.logger.debug("Clicked element%s", locator)
         except TimeoutException:
-            self.logger.error(f"Element tidak Clickable: {locator}")
+            self.logger.error("Element tidak Clickable: %s", locator)
             raise
+        self.collect_performance_metrics()
         
     def input_text(self, locator, text):
         """
@@ -78,10 +264,12 @@ class BasePage:
             locator (tuple): Tuple of (By.TYPE, "value")
             text (str): Text yang akan di-input
         """
-        element = self.find_element(locator)
-        element.clear()
-        element.send_keys(text)
-        self.logger.debug(f"input text '{text}' ke element: {locator}")
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        
+        self._with_element(locator, type_text)
+        self.logger.debug("input text '%s' ke element: %s", text, locator)
         
     def get_text(self, locator):
         """
@@ -93,9 +281,8 @@ class BasePage:
         Returns:
             str: Text dari element
         """
-        element = self.find_element(locator)
-        text = element.text
-        self.logger.debug(f"Get Text dari {locator}: {text}")
+        text = self._with_element(locator, lambda element: element.text)
+        self.logger.debug("Get Text dari %s: %s", locator, text)
         return text
     
     def get_attribute(self, locator, attribute_name):
@@ -109,11 +296,95 @@ class BasePage:
         Returns:
             str: Value dari attribute
         """
-        element = self.find_element(locator)
-        value = element.get_attribute(attribute_name)
-        self.logger.debug(f"Get Atribute '{attribute_name}' dari {locator}: {value}")
+        value = self._with_element(locator, lambda element: element.get_attribute(attribute_name))
+        self.logger.debug("Get Atribute '%s' dari %s: %s", attribute_name, locator, value)
         return value
     
+    def _with_element(self, locator, action):
+        """
+        Jalankan action(element); jika element stale, lookup ulang sekali lalu retry
+        
+        Args:
+            locator (tuple): Tuple of (By.TYPE, "value")
+            action (callable): Function yang menerima WebElement
+            
+        Returns:
+            Return value dari action
+        """
+        try:
+            return action(self._find_cached_element(locator))
+        except StaleElementReferenceException:
+            self.logger.debug("Element stale, lookup ulang %s", locator)
+            if self.element_cache is not None:
+                self.element_cache.discard(("one", tuple(locator)))
+            return action(self._find_cached_element(locator))
+    
+    def query_many(self, locators, attributes=None):
+        """
+        Resolve beberapa locator sekaligus dalam satu execute_script round trip
+        
+        Args:
+            locators (dict): {name: (By.TYPE, "value")}
+            attributes (list): Nama attribute yang diambil dari element pertama
+            
+        Returns:
+            dict: {name: {"present", "count", "visible", "text", "attributes"}}
+                  Nilai visible, text, dan attributes berasal dari element pertama
+        """
+        queries = [[name, by, value] for name, (by, value) in locators.items()]
+        result = self.driver.execute_script(QUERY_MANY_JS, queries, list(attributes or []))
+        self.logger.debug("Queried %s locators in one round trip", len(queries))
+        return result
+    
+    def get_texts(self, locator, with_elements=False):
+        """
+        Get text dari semua element yang cocok dengan locator dalam satu script call
+        
+        Args:
+            locator (tuple): Tuple of (By.TYPE, "value")
+            with_elements (bool): Jika True, return pasangan (text, WebElement)
+            
+        Returns:
+            list: List of text, atau list of (text, WebElement)
+        """
+        by, value = locator
+        result = self._wait_for_bulk(GET_TEXTS_JS, by, value, with_elements)
+        self.logger.debug("Get %s texts dari %s", len(result['values']), locator)
+        if with_elements:
+            return list(zip(result["values"], result["elements"]))
+        return result["values"]
+    
+    def get_attributes(self, locator, names, with_elements=False):
+        """
+        Get beberapa attribute dari semua element yang cocok dengan locator dalam satu script call
+        
+        Args:
+            locator (tuple): Tuple of (By.TYPE, "value")
+            names (list): Nama attribute
+            with_elements (bool): Jika True, return pasangan (attributes, WebElement)
+            
+        Returns:
+            list: List of dict {attribute: value}, atau list of (dict, WebElement)
+        """
+        by, value = locator
+        result = self._wait_for_bulk(GET_ATTRIBUTES_JS, by, value, list(names), with_elements)
+        self.logger.debug("Get attributes %s dari %s elements: %s", names, len(result['values']), locator)
+        if with_elements:
+            return list(zip(result["values"], result["elements"]))
+        return result["values"]
+    
+    def _wait_for_bulk(self, script, *args):
+        """Jalankan bulk script hingga minimal satu element ditemukan (seperti find_elements)"""
+        def has_values(driver):
+            result = driver.execute_script(script, *args)
+            return result if result["values"] else False
+        
+        try:
+            return self.wait_until(has_values, description=f"values of {args[:2]}")
+        except TimeoutException:
+            self.logger.error("Elements tidak ditemukan: %s", args[:2])
+            return {"values": [], "elements": []}
+    
     def is_element_visible(self, locator, timeout=None):
         """
         Check apakah element visible
@@ -126,17 +397,18 @@ class BasePage:
             bool: True jika visible, False jika tidak
         """
         try:
-            wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.visibility_of_element_located(locator))
-            self.logger.debug(f"Element Visible: {locator}")
+            if Config.WAIT_MODE == "observer":
+                self.observe_until("visible", locator, timeout, f"visibility of {locator}")
+            else:
+                self.wait_until(EC.visibility_of_element_located(locator), timeout, f"visibility of {locator}")
+            self.logger.debug("Element Visible: %s", locator)
             return True
         except TimeoutException:
-            self.logger.debug(f"Element tidak Visible {locator}")
+            self.logger.debug("Element tidak Visible %s", locator)
             return False
     def is_element_present(self, locator):
         """
-        Check apakah element present di DOM
+        Check apakah element present di DOM (satu kali check, tanpa wait)
         
         Args:
         locator (tuple): Tuple of (By.TYPE, "value")
@@ -158,10 +430,11 @@ class BasePage:
             locator (tuple): Tuple of (By.TYPE, "value")
             timeout (int): Custom timeout
         """
-        wait_time = timeout if timeout else Config.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.invisibility_of_element_located(locator))
-        self.logger.debug(f"Element sudah hilang {locator}")
+        if Config.WAIT_MODE == "observer":
+            self.observe_until("invisible", locator, timeout, f"invisibility of {locator}")
+        else:
+            self.wait_until(EC.invisibility_of_element_located(locator), timeout, f"invisibility of {locator}")
+        self.logger.debug("Element sudah hilang %s", locator)
         
     # ========== Navigation Methods ==========
     
@@ -172,8 +445,41 @@ class BasePage:
         Args:
             url (str): URL yang akan dibuka
         """
+        if Config.PAGE_LOAD_STRATEGY == "none":
+            # get() langsung return, tandai dokumen lama agar readiness check tidak salah
+            self.driver.execute_script(MARK_NAVIGATION_PENDING_JS)
         self.driver.get(url)
-        self.logger.info(f"Opened URL {url}")
+        self.logger.info("Opened URL %s", url)
+        self.collect_performance_metrics()
+    
+    def collect_performance_metrics(self):
+        """
+        Ukur navigasi terakhir (timing, paint, LCP, CLS, resources) dalam satu script call
+        
+        Tidak melakukan apa pun jika Config.COLLECT_PERFORMANCE_METRICS nonaktif
+        atau dokumen belum berganti sejak pengukuran sebelumnya (click tanpa navigasi).
+        Budget diambil dari page object yang URL_PATTERN-nya cocok dengan URL tujuan,
+        atau dari page object ini.
+        
+        Returns:
+            dict: Record metrics, atau None jika tidak ada navigasi baru
+        """
+        if not Config.COLLECT_PERFORMANCE_METRICS:
+            return None
+        try:
+            metrics = self.driver.execute_async_script(
+                PERFORMANCE_METRICS_JS,
+                performance_metrics.last_time_origin(self.driver),
+                int(Config.PAGE_LOAD_TIMEOUT * 1000),
+            )
+        except (JavascriptException, TimeoutException) as e:
+            self.logger.debug("Performance metrics tidak bisa diambil: %s", e.__class__.__name__)
+            return None
+        if not metrics:
+            return None
+        
+        page = next((cls for cls in _PAGE_CLASSES if re.search(cls.URL_PATTERN, metrics["url"])), type(self))
+        return performance_metrics.record(self.driver, page.__name__, metrics, page.PERFORMANCE_BUDGET)
     
     def get_current_url(self):
         return self.driver.current_url
@@ -196,9 +502,8 @@ class BasePage:
         Args:
             locator (tuple): Tuple of (By.TYPE, "value")
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        self.logger.debug(f"Scrolled to element: {locator}")
+        self._with_element(locator, lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element))
+        self.logger.debug("Scrolled to element: %s", locator)
         
     def scroll_to_bottom(self):
         """Scroll ke bottom page"""
@@ -210,30 +515,137 @@ class BasePage:
         self.driver.execute_script("window.scrollTo(0, 0);")
         self.logger.debug("Scrolled to top")
     
+    # ========== State Methods ==========
+    
+    def save_state(self, name):
+        """
+        Simpan URL, cookies, localStorage dan posisi scroll halaman saat ini ke state_cache
+        
+        Args:
+            name (str): Nama state, mis. "article:Python (programming language)"
+            
+        Returns:
+            dict: Snapshot state
+        """
+        state = self._capture_state()
+        state["page"] = type(self).__name__
+        state_cache.put(name, state)
+        self.logger.debug("State saved: %s (%s)", name, state["url"])
+        return state
+    
+    def restore_state(self, name):
+        """
+        Restore state dari state_cache dengan langsung membuka URL-nya
+        
+        State yang expired atau gagal di-restore (page tidak siap) dihapus dari cache.
+        
+        Args:
+            name (str): Nama state
+            
+        Returns:
+            bool: True jika state di-restore, False jika tidak ada state yang valid
+        """
+        state = state_cache.get(name)
+        if state is None:
+            return False
+        try:
+            self._apply_state(state)
+        except WebDriverException as e:
+            state_cache.discard(name)
+            self.logger.warning("Restore state %s gagal (%s), state dihapus", name, e.__class__.__name__)
+            return False
+        self.logger.info("State restored: %s", name)
+        return True
+    
+    def ensure_state(self, name, build):
+        """
+        Restore state jika ada di cache, jika tidak bangun lewat build() lalu simpan
+        
+        Args:
+            name (str): Nama state
+            build (callable): Alur UI yang menghasilkan state, mis. open homepage lalu search
+            
+        Returns:
+            bool: True jika state di-restore dari cache, False jika dibangun ulang
+        """
+        if self.restore_state(name):
+            return True
+        build()
+        self.wait_for_page_load()
+        self.save_state(name)
+        return False
+    
+    def _capture_state(self):
+        state = self.driver.execute_script(SNAPSHOT_STATE_JS)
+        state["cookies"] = self.driver.get_cookies()
+        return state
+    
+    def _apply_state(self, state):
+        if state["cookies"] or state["local_storage"]:
+            if self.driver.execute_script("return location.origin") != state["origin"]:
+                # Cookies dan localStorage hanya bisa di-set dari dokumen di origin yang sama
+                self.driver.get(state["origin"] + Config.STATE_BOOTSTRAP_PATH)
+            for cookie in state["cookies"]:
+                try:
+                    self.driver.add_cookie(cookie)
+                except InvalidCookieDomainException:
+                    self.logger.debug("Cookie %s dilewati (domain %s)", cookie.get("name"), cookie.get("domain"))
+            self.driver.execute_script(RESTORE_STORAGE_JS, state["local_storage"])
+        
+        self.open_url(state["url"])
+        self.wait_for_page_load()
+        if any(state["scroll"]):
+            self.driver.execute_script("window.scrollTo(arguments[0], arguments[1]);", *state["scroll"])
+    
     # ========== Wait Methods ==========
     
     def wait_for_page_load(self, timeout=None):
         """
-        Wait hingga page fully loaded
+        Wait hingga page siap dipakai
+        
+        Jika page object punya READY_LOCATORS, tunggu hingga semua locator present
+        (cocok dengan pageLoadStrategy eager/none). Jika tidak, tunggu
+        document.readyState complete.
         
         Args:
             timeout (int): Custom timeout
         """
-        wait_time = timeout if timeout else Config.PAGE_LOAD_TIMEOUT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        wait_time = Config.PAGE_LOAD_TIMEOUT if timeout is None else timeout
+        if self.READY_LOCATORS:
+            locators = [list(locator) for locator in self.READY_LOCATORS]
+            self.wait_until(
+                lambda driver: driver.execute_script(PAGE_READY_JS, locators),
+                wait_time,
+                f"{type(self).__name__} ready",
+            )
+        elif Config.WAIT_MODE == "observer":
+            self.observe_until("ready", timeout=wait_time, description="document.readyState complete")
+        else:
+            self.wait_until(document_ready, wait_time, "document.readyState complete")
         self.logger.debug("Page fully loaded")
     
     # ========== Screenshot Methods ==========
     
-    def take_screenshot(self, filename):
+    def take_screenshot(self, filename, wait=True):
         """
-        Take screenshot
+        Take screenshot, decode dan write file dilakukan di background thread
         
         Args:
             filename (str): Nama file screenshot
+            wait (bool): Jika True, tunggu file selesai ditulis sebelum return
+            
+        Returns:
+            str: Path file screenshot, file sudah ada saat return (wait=True)
+            Future: Selesai dengan path file setelah file ditulis (wait=False)
         """
         filepath = f"{Config.SCREENSHOT_PATH}{filename}.png"
-        self.driver.save_screenshot(filepath)
-        self.logger.info(f"Screenshot saved: {filepath}")
-        return filepath
\ No newline at end of file
+        future = artifact_pipeline.save_screenshot(self.driver.get_screenshot_as_base64(), filepath)
+        if not wait:
+            self.logger.info("Screenshot queued: %s", filepath)
+            return future
+        future.result()
+        self.logger.info("Screenshot saved: %s", filepath)
+        return filepath
+
+
+trace_methods(BasePage, exclude=_SELF_TRACED)
\ No newline at end of file
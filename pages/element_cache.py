@@ -0,0 +1,86 @@
+"""
+Cache WebElement per driver, di-key dengan locator
+
+Semua page object yang memakai driver yang sama berbagi satu cache, jadi
+SEARCH_INPUT yang sudah ditemukan HomePage dipakai ulang oleh SearchPage.
+Hanya single element yang dipakai lewat BasePage._with_element (get_text,
+input_text, get_attribute, ...) yang di-cache. find_element dan
+find_elements selalu lookup baru: element-nya dipakai di luar stale retry,
+dan list bisa bertambah oleh JavaScript halaman tanpa WebDriver command.
+Cache memantau driver.execute sehingga tidak butuh round trip tambahan:
+navigasi (get, back, forward, refresh) dan pindah window/frame mengosongkan
+cache. Click, send keys dan actions tidak: element tetap dipakai ulang antar
+interaksi. Jika interaksi atau JavaScript halaman mengganti element (termasuk
+click yang pindah halaman), BasePage melakukan lookup ulang sekali saat
+StaleElementReferenceException.
+"""
+
+import weakref
+from selenium.webdriver.remote.command import Command
+
+
+_INVALIDATING_COMMANDS = {
+    Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH,
+    Command.SWITCH_TO_WINDOW, Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME,
+    Command.CLOSE, Command.NEW_WINDOW,
+}
+
+_caches = weakref.WeakKeyDictionary()
+
+
+class ElementCache:
+    """Element hasil lookup untuk dokumen yang sedang dibuka"""
+
+    def __init__(self, driver):
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+
+        original_execute = driver.execute
+
+        def invalidating_execute(driver_command, params=None):
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                if driver_command in _INVALIDATING_COMMANDS:
+                    self.invalidate()
+
+        driver.execute = invalidating_execute
+
+    @staticmethod
+    def for_driver(driver):
+        """
+        Return cache milik driver, dibuat saat pertama dipakai
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            ElementCache: Cache driver, atau None jika driver tidak punya execute (mis. StaticDriver)
+        """
+        cache = _caches.get(driver)
+        if cache is None and hasattr(driver, "execute"):
+            cache = _caches[driver] = ElementCache(driver)
+        return cache
+
+    def get(self, key):
+        """Return element untuk key, None jika belum ada di generation ini"""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+
+    def discard(self, key):
+        self._entries.pop(key, None)
+
+    def invalidate(self):
+        """Kosongkan cache, dipanggil saat navigasi atau pindah window/frame"""
+        if self._entries:
+            self._entries.clear()
+        self.generation += 1
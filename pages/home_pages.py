@@ -3,6 +3,7 @@ Page Object Model untuk Wikipedia Homepage (wikipedia.org)
 """
 
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 from utils.config import Config
 import logging
@@ -55,6 +56,13 @@ class HomePage(BasePage):
     # Other languages section
     OTHER_LANGUAGES_SECTION = (By.CSS_SELECTOR, ".other-projects")
     
+    # Readiness: search input dan language links sudah ada
+    READY_LOCATORS = (SEARCH_INPUT, LANGUAGE_LINKS)
+    
+    # Performance budget (ms, CLS tanpa satuan) untuk portal www.wikipedia.org
+    URL_PATTERN = r"www\.wikipedia\.org/?(?:[?#].*)?$"
+    PERFORMANCE_BUDGET = {"lcp": 2500, "cls": 0.1}
+    
     # ========== Page Actions ==========
     
     def open(self):
@@ -63,7 +71,7 @@ class HomePage(BasePage):
         """
         self.open_url(self.url)
         self.wait_for_page_load()
-        self.logger.info(f"Opened Wikipedia homepage: {self.url}")
+        self.logger.info("Opened Wikipedia homepage: %s", self.url)
     
     def get_page_title(self):
         """
@@ -73,7 +81,7 @@ class HomePage(BasePage):
             str: Page title
         """
         title = self.get_title()
-        self.logger.debug(f"Page title: {title}")
+        self.logger.debug("Page title: %s", title)
         return title
     
     def is_logo_displayed(self):
@@ -84,7 +92,7 @@ class HomePage(BasePage):
             bool: True jika logo visible
         """
         is_displayed = self.is_element_visible(self.WIKIPEDIA_LOGO)
-        self.logger.debug(f"Logo displayed: {is_displayed}")
+        self.logger.debug("Logo displayed: %s", is_displayed)
         return is_displayed
     
     def get_subtitle_text(self):
@@ -95,7 +103,7 @@ class HomePage(BasePage):
             str: Subtitle text
         """
         subtitle = self.get_text(self.SITE_SUBTITLE)
-        self.logger.debug(f"Subtitle: {subtitle}")
+        self.logger.debug("Subtitle: %s", subtitle)
         return subtitle
     
     # ========== Search Methods ==========
@@ -108,7 +116,7 @@ class HomePage(BasePage):
             search_text (str): Text untuk search
         """
         self.input_text(self.SEARCH_INPUT, search_text)
-        self.logger.info(f"Entered search text: {search_text}")
+        self.logger.info("Entered search text: %s", search_text)
     
     def click_search_button(self):
         """
@@ -126,7 +134,7 @@ class HomePage(BasePage):
         """
         self.enter_search_text(search_text)
         self.click_search_button()
-        self.logger.info(f"Performed search: {search_text}")
+        self.logger.info("Performed search: %s", search_text)
     
     def is_search_input_displayed(self):
         """
@@ -147,7 +155,7 @@ class HomePage(BasePage):
             list: List of WebElements untuk language links
         """
         links = self.find_elements(self.LANGUAGE_LINKS)
-        self.logger.debug(f"Found {len(links)} language links")
+        self.logger.debug("Found %s language links", len(links))
         return links
     
     def get_language_count(self):
@@ -158,7 +166,7 @@ class HomePage(BasePage):
             int: Jumlah bahasa
         """
         count = len(self.get_all_language_links())
-        self.logger.debug(f"Language count: {count}")
+        self.logger.debug("Language count: %s", count)
         return count
     
     def click_english_link(self):
@@ -191,7 +199,7 @@ class HomePage(BasePage):
         """
         locator = (By.XPATH, f"//a[@id='js-link-box-{lang_code}']")
         self.click(locator)
-        self.logger.info(f"Clicked language link: {lang_code}")
+        self.logger.info("Clicked language link: %s", lang_code)
     
     def is_language_available(self, lang_code):
         """
@@ -205,7 +213,7 @@ class HomePage(BasePage):
         """
         locator = (By.XPATH, f"//a[@id='js-link-box-{lang_code}']")
         is_available = self.is_element_present(locator)
-        self.logger.debug(f"Language {lang_code} available: {is_available}")
+        self.logger.debug("Language %s available: %s", lang_code, is_available)
         return is_available
     
     def get_language_link_text(self, lang_code):
@@ -220,7 +228,7 @@ class HomePage(BasePage):
         """
         locator = (By.XPATH, f"//a[@id='js-link-box-{lang_code}']")
         text = self.get_text(locator)
-        self.logger.debug(f"Language {lang_code} text: {text}")
+        self.logger.debug("Language %s text: %s", lang_code, text)
         return text
     
     # ========== Verification Methods ==========
@@ -232,19 +240,30 @@ class HomePage(BasePage):
         Returns:
             bool: True jika homepage loaded successfully
         """
+        # Check multiple elements untuk memastikan page loaded, satu round trip per polling
+        locators = {
+            "logo": self.WIKIPEDIA_LOGO,
+            "search_input": self.SEARCH_INPUT,
+            "language_links": self.LANGUAGE_LINKS,
+        }
+        
+        def all_loaded(driver):
+            state = self.query_many(locators)
+            return (
+                state["logo"]["visible"]
+                and state["search_input"]["visible"]
+                and state["language_links"]["count"] > 0
+            )
+        
         try:
-            # Check multiple elements untuk memastikan page loaded
-            checks = [
-                self.is_logo_displayed(),
-                self.is_search_input_displayed(),
-                self.get_language_count() > 0
-            ]
-            
-            result = all(checks)
-            self.logger.info(f"Homepage verification: {result}")
+            result = self.wait_until(all_loaded, description="homepage elements loaded")
+            self.logger.info("Homepage verification: %s", result)
             return result
+        except TimeoutException:
+            self.logger.info("Homepage verification: False")
+            return False
         except Exception as e:
-            self.logger.error(f"Homepage verification failed: {str(e)}")
+            self.logger.error("Homepage verification failed: %s", e)
             return False
     
     def get_popular_languages(self):
@@ -255,6 +274,8 @@ class HomePage(BasePage):
             list: List of language codes
         """
         popular_langs = ['en', 'es', 'de', 'fr', 'ja', 'ru', 'it', 'zh', 'pt', 'ar']
-        available_langs = [lang for lang in popular_langs if self.is_language_available(lang)]
-        self.logger.debug(f"Available popular languages: {available_langs}")
+        locators = {lang: (By.XPATH, f"//a[@id='js-link-box-{lang}']") for lang in popular_langs}
+        state = self.query_many(locators)
+        available_langs = [lang for lang in popular_langs if state[lang]["present"]]
+        self.logger.debug("Available popular languages: %s", available_langs)
         return available_langs
\ No newline at end of file
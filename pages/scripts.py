@@ -0,0 +1,258 @@
+"""
+JavaScript snippets yang dijalankan lewat execute_script
+
+Setiap snippet menyelesaikan beberapa lookup dalam satu WebDriver round trip.
+Locator dikirim sebagai pasangan (By.TYPE, "value") yang sama dengan page objects.
+"""
+
+# Helper untuk resolve locator Selenium di dalam browser
+LOCATOR_HELPERS_JS = """
+function __findAll(by, value, root) {
+    root = root || document;
+    switch (by) {
+        case "css selector":
+            return Array.from(root.querySelectorAll(value));
+        case "id":
+            return Array.from(root.querySelectorAll("[id=\\"" + CSS.escape(value) + "\\"]"));
+        case "name":
+            return Array.from(root.querySelectorAll("[name=\\"" + CSS.escape(value) + "\\"]"));
+        case "class name":
+            return Array.from(root.querySelectorAll("." + CSS.escape(value)));
+        case "tag name":
+            return Array.from(root.querySelectorAll(value));
+        case "xpath":
+            var snapshot = document.evaluate(value, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+            return nodes;
+        case "link text":
+            return Array.from(root.querySelectorAll("a")).filter(function (a) {
+                return a.innerText.trim() === value;
+            });
+        case "partial link text":
+            return Array.from(root.querySelectorAll("a")).filter(function (a) {
+                return a.innerText.indexOf(value) !== -1;
+            });
+    }
+    throw new Error("Unsupported locator strategy: " + by);
+}
+
+function __isVisible(el) {
+    if (!el.isConnected) return false;
+    var style = window.getComputedStyle(el);
+    if (style.display === "none" || style.visibility === "hidden" || style.opacity === "0") return false;
+    var rects = el.getClientRects();
+    return rects.length > 0 && (rects[0].width > 0 || rects[0].height > 0);
+}
+
+function __textOf(el) {
+    return __isVisible(el) ? el.innerText.trim() : "";
+}
+"""
+
+# arguments[0]: [[name, by, value], ...], arguments[1]: [attribute names]
+QUERY_MANY_JS = LOCATOR_HELPERS_JS + """
+var queries = arguments[0], attributes = arguments[1] || [];
+var result = {};
+queries.forEach(function (query) {
+    var elements = __findAll(query[1], query[2]);
+    var first = elements[0];
+    var attrs = {};
+    attributes.forEach(function (attr) {
+        attrs[attr] = first ? first.getAttribute(attr) : null;
+    });
+    result[query[0]] = {
+        present: elements.length > 0,
+        count: elements.length,
+        visible: first ? __isVisible(first) : false,
+        text: first ? __textOf(first) : "",
+        attributes: attrs
+    };
+});
+return result;
+"""
+
+# arguments[0]: by, arguments[1]: value, arguments[2]: with_elements
+GET_TEXTS_JS = LOCATOR_HELPERS_JS + """
+var elements = __findAll(arguments[0], arguments[1]);
+return {
+    values: elements.map(__textOf),
+    elements: arguments[2] ? elements : null
+};
+"""
+
+# arguments[0]: by, arguments[1]: value, arguments[2]: [attribute names], arguments[3]: with_elements
+GET_ATTRIBUTES_JS = LOCATOR_HELPERS_JS + """
+var elements = __findAll(arguments[0], arguments[1]), names = arguments[2];
+return {
+    values: elements.map(function (el) {
+        var attrs = {};
+        names.forEach(function (name) { attrs[name] = el.getAttribute(name); });
+        return attrs;
+    }),
+    elements: arguments[3] ? elements : null
+};
+"""
+
+# Async script: arguments[0]: kind (visible, invisible, ready), arguments[1]: by,
+# arguments[2]: value, arguments[3]: timeout ms. Callback dipanggil dengan true
+# segera setelah condition terpenuhi, atau false saat timeout.
+OBSERVE_CONDITION_JS = LOCATOR_HELPERS_JS + """
+var kind = arguments[0], by = arguments[1], value = arguments[2], timeoutMs = arguments[3];
+var done = arguments[arguments.length - 1];
+var finished = false, mutationObserver = null, intersectionObserver = null, observed = null, timer = null;
+var events = ["readystatechange", "transitionend", "animationend"];
+
+function check() {
+    if (kind === "ready") return document.readyState === "complete";
+    var first = __findAll(by, value)[0];
+    if (first && first !== observed && intersectionObserver) {
+        // Perubahan layout tanpa mutation (mis. stylesheet selesai load) tetap terdeteksi
+        intersectionObserver.observe(first);
+        observed = first;
+    }
+    if (kind === "visible") return !!first && __isVisible(first);
+    if (kind === "invisible") return !first || !__isVisible(first);
+    throw new Error("Unsupported condition: " + kind);
+}
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    clearTimeout(timer);
+    if (mutationObserver) mutationObserver.disconnect();
+    if (intersectionObserver) intersectionObserver.disconnect();
+    events.forEach(function (name) { document.removeEventListener(name, onChange, true); });
+    done(result);
+}
+
+function onChange() {
+    if (check()) finish(true);
+}
+
+if (check()) {
+    done(true);
+} else {
+    mutationObserver = new MutationObserver(onChange);
+    mutationObserver.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    if (kind !== "ready" && window.IntersectionObserver) {
+        intersectionObserver = new IntersectionObserver(onChange);
+        check();
+    }
+    events.forEach(function (name) { document.addEventListener(name, onChange, true); });
+    timer = setTimeout(function () { finish(check()); }, timeoutMs);
+}
+"""
+
+# arguments[0]: [[by, value], ...]. True jika navigasi dari open_url sudah selesai
+# (marker dari dokumen lama hilang) dan semua locator present.
+PAGE_READY_JS = LOCATOR_HELPERS_JS + """
+if (window.__wikiNavigationPending) return false;
+return arguments[0].every(function (locator) {
+    return __findAll(locator[0], locator[1]).length > 0;
+});
+"""
+
+MARK_NAVIGATION_PENDING_JS = "window.__wikiNavigationPending = true;"
+
+# Async script: arguments[0]: performance.timeOrigin dari pengukuran sebelumnya,
+# arguments[1]: timeout ms. Callback dipanggil dengan null jika dokumen belum
+# berganti (click tanpa navigasi), atau dengan metrics setelah load event.
+PERFORMANCE_METRICS_JS = """
+var lastOrigin = arguments[0], timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+if (performance.timeOrigin === lastOrigin) {
+    done(null);
+    return;
+}
+var deadline = Date.now() + timeoutMs;
+
+function round(value) {
+    return value ? Math.round(value * 10) / 10 : null;
+}
+
+function buffered(type) {
+    if ((PerformanceObserver.supportedEntryTypes || []).indexOf(type) === -1) return null;
+    var observer = new PerformanceObserver(function () {});
+    observer.observe({type: type, buffered: true});
+    var entries = observer.takeRecords();
+    observer.disconnect();
+    return entries;
+}
+
+function cumulativeLayoutShift(entries) {
+    // Session window terbesar: jarak antar shift < 1s, panjang window < 5s
+    var max = 0, current = 0, first = null, last = null;
+    entries.filter(function (e) { return !e.hadRecentInput; }).forEach(function (e) {
+        if (first !== null && e.startTime - last < 1000 && e.startTime - first < 5000) {
+            current += e.value;
+        } else {
+            current = e.value;
+            first = e.startTime;
+        }
+        last = e.startTime;
+        max = Math.max(max, current);
+    });
+    return Math.round(max * 10000) / 10000;
+}
+
+function collect() {
+    var nav = performance.getEntriesByType("navigation")[0] || {};
+    var paints = {};
+    performance.getEntriesByType("paint").forEach(function (e) { paints[e.name] = e.startTime; });
+    var resources = performance.getEntriesByType("resource");
+    var lcpEntries = buffered("largest-contentful-paint");
+    var shiftEntries = buffered("layout-shift");
+    done({
+        url: location.href,
+        time_origin: performance.timeOrigin,
+        ttfb: round(nav.responseStart),
+        dom_content_loaded: round(nav.domContentLoadedEventEnd),
+        load: round(nav.loadEventEnd),
+        fcp: round(paints["first-contentful-paint"]),
+        lcp: lcpEntries && lcpEntries.length ? round(lcpEntries[lcpEntries.length - 1].startTime) : null,
+        cls: shiftEntries ? cumulativeLayoutShift(shiftEntries) : null,
+        resources: resources.length,
+        transfer_size: resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, nav.transferSize || 0)
+    });
+}
+
+(function waitForLoad() {
+    var nav = performance.getEntriesByType("navigation")[0];
+    if ((document.readyState === "complete" && (!nav || nav.loadEventEnd > 0)) || Date.now() > deadline) {
+        collect();
+    } else {
+        setTimeout(waitForLoad, 50);
+    }
+})();
+"""
+
+# arguments[0]: URL. Mulai navigasi tanpa menunggu load (dipakai fan-out multi tab);
+# marker dari dokumen lama membuat PAGE_READY_JS false sampai dokumen baru aktif.
+START_NAVIGATION_JS = MARK_NAVIGATION_PENDING_JS + " window.location.href = arguments[0];"
+
+# Snapshot state halaman untuk BasePage.save_state; localStorage tidak bisa diakses di about:blank
+SNAPSHOT_STATE_JS = """
+var storage = {};
+try {
+    for (var i = 0; i < localStorage.length; i++) {
+        var key = localStorage.key(i);
+        storage[key] = localStorage.getItem(key);
+    }
+} catch (e) {}
+return {
+    url: location.href,
+    origin: location.origin,
+    local_storage: storage,
+    scroll: [window.scrollX, window.scrollY]
+};
+"""
+
+# arguments[0]: object key -> value, mengganti seluruh isi localStorage origin ini
+RESTORE_STORAGE_JS = """
+var items = arguments[0];
+localStorage.clear();
+Object.keys(items).forEach(function (key) {
+    localStorage.setItem(key, items[key]);
+});
+"""
@@ -1,8 +1,11 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import TimeoutException
+from urllib.parse import unquote_plus
 from pages.base_page import BasePage
 from utils.config import Config
 import logging
+import re
 
 class SearchPage(BasePage):
     def __init__(self, driver):
@@ -20,43 +23,87 @@ class SearchPage(BasePage):
     SUGESTION_TITLE = (By.CSS_SELECTOR, ".suggestion-title")
     SUGESTION_DESCRIPTION = (By.CSS_SELECTOR, ".suggestion-description")
     
+    READY_LOCATORS = (SEARCH_INPUT,)
+    
+    # Request typeahead portal (action API prefixsearch atau REST title search)
+    TYPEAHEAD_REQUEST = re.compile(r"/w/(?:api\.php\?.*(?:prefixsearch|gpssearch)|rest\.php/v1/search/title)")
+    
     def enter_search_text(self, text):
         self.input_text(self.SEARCH_INPUT, text)
-        self.logger.info(f"entered search text: {text}")
+        self.logger.info("entered search text: %s", text)
         
     def click_search_button(self):
         self.click(self.SEARCH_BUTTON)
-        self.logger.info(f"clicked search button")
+        self.logger.info("clicked search button")
         
     def search(self, text):
         self.enter_search_text(text)
         self.click_search_button()
-        self.logger.info(f"performed search: {text}")
+        self.logger.info("performed search: %s", text)
         
     def search_and_enter(self, text):
-        search_input = self.find_elements(self.SEARCH_INPUT)
-        search_input.clear()
-        search_input.send_keys(text)
-        search_input.send_keys(Keys.RETURN)
-        self.logger.info(f"searched with enter key: {text}")
+        def type_and_enter(search_input):
+            search_input.clear()
+            search_input.send_keys(text)
+            search_input.send_keys(Keys.RETURN)
+        
+        self._with_element(self.SEARCH_INPUT, type_and_enter)
+        self.logger.info("searched with enter key: %s", text)
+        self.collect_performance_metrics()
         
     def is_suggestion_displayed(self):
         return self.is_element_visible(self.SEARCH_DROPDOWN, timeout=3)
     
+    def enter_search_text_and_wait_for_suggestions(self, text, timeout=3):
+        """
+        Ketik text lalu tunggu response typeahead untuk text lengkap
+        
+        Dengan event streams, wait selesai begitu XHR typeahead complete (tanpa
+        polling DOM); dropdown kemudian dicek sekali. Tanpa event streams,
+        fallback ke is_suggestion_displayed.
+        
+        Returns:
+            bool: True jika dropdown suggestion tampil
+        """
+        events = self.events
+        mark = events.mark() if events else None
+        self.enter_search_text(text)
+        if events is None:
+            return self.is_suggestion_displayed()
+        
+        def typeahead_done(event):
+            return (
+                event["type"] in ("response", "error")
+                and bool(event["url"])
+                and self.TYPEAHEAD_REQUEST.search(event["url"]) is not None
+                and text.lower() in unquote_plus(event["url"]).lower()
+            )
+        
+        try:
+            event = events.wait_for("network", typeahead_done, timeout, after=mark, description=f"typeahead '{text}'")
+        except TimeoutException:
+            self.logger.warning("Typeahead response untuk '%s' tidak diterima dalam %ss", text, timeout)
+            return False
+        self.logger.debug("typeahead %s %s: %s", event['type'], event['status'], event['url'])
+        return self.is_element_visible(self.SEARCH_DROPDOWN, timeout=1)
+    
     def click_suggestion(self, index=0):
         sugestions = self.find_elements(self.SUGESTION_ITEM)
         if index < len(sugestions):
             sugestions[index].click()
-            self.logger.info(f"clicked sugestion at index {index}")
+            self.logger.info("clicked sugestion at index %s", index)
+            self.collect_performance_metrics()
         else:
             raise IndexError(f"sugestion index {index} out of range")
         
     def click_suggestion_by_text(self, text):
-        suggestions = self.find_elements(self.SUGESTION_ITEM)
-        for suggestion in suggestions:
-            if text.lower() in suggestion.text.lower():
+        suggestions = self.get_texts(self.SUGESTION_ITEM, with_elements=True)
+        for suggestion_text, suggestion in suggestions:
+            if text.lower() in suggestion_text.lower():
                 suggestion.click()
-            return
+                self.logger.info("clicked suggestion: %s", suggestion_text)
+                self.collect_performance_metrics()
+                return
         raise ValueError(f"suggetions {text} not found")
     
     def is_search_input_displayed(self):
@@ -66,9 +113,8 @@ class SearchPage(BasePage):
         return self.get_attribute(self.SEARCH_INPUT, "Placeholder")
     
     def clear_search_input(self):
-        search_input = self.find_element(self.SEARCH_INPUT)
-        search_input.clear()
-        self.logger.info(f"cleared search input")
+        self._with_element(self.SEARCH_INPUT, lambda search_input: search_input.clear())
+        self.logger.info("cleared search input")
      
         
     
\ No newline at end of file
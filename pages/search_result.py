@@ -1,4 +1,5 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from pages.base_page import BasePage
 import logging
 
@@ -19,16 +20,46 @@ class SearchResult(BasePage):
     NEXT_PAGE_LINK = (By.CSS_SELECTOR, "a[rel='next']")
     PREV_PAGE_LINK = (By.CSS_SELECTOR, "a[rel='prev']")
     
+    READY_LOCATORS = (RESULT_CONTAINER,)
+    
+    URL_PATTERN = r"Special:Search|[?&]search="
+    PERFORMANCE_BUDGET = {"lcp": 2500, "cls": 0.1}
+    
+    def get_search_outcome(self, timeout=10):
+        """
+        Wait hingga halaman search selesai (ada hasil atau pesan no results)
+        
+        Negative check tidak perlu menunggu timeout penuh: begitu salah satu
+        outcome muncul, state semua locator diambil dalam satu round trip.
+        
+        Returns:
+            dict: State dari query_many, atau None jika bukan halaman search results
+        """
+        locators = {
+            "results": self.RESULT_ITEM,
+            "no_results": self.NO_RESULT_MESSAGE,
+            "did_you_mean": self.DID_YOU_MEAN_LINK,
+        }
+        
+        def settled(driver):
+            state = self.query_many(locators)
+            return state if state["results"]["present"] or state["no_results"]["present"] else False
+        
+        try:
+            return self.wait_until(settled, timeout, "search outcome")
+        except TimeoutException:
+            self.logger.debug("Search outcome tidak ditemukan")
+            return None
+    
     def get_results_count(self):
-        results = self.find_elements(self.RESULT_ITEM)
-        count = len(results)
-        self.logger.info(f"Search results count: {count}")
+        state = self.get_search_outcome()
+        count = state["results"]["count"] if state else 0
+        self.logger.info("Search results count: %s", count)
         return count
     
     def get_result_title(self):
-        titles = self.find_elements(self.RESULT_TITLES)
-        title_texts = [t.text for t in titles]
-        self.logger.info(f"Result titles: {title_texts}")
+        title_texts = self.get_texts(self.RESULT_TITLES)
+        self.logger.info("Result titles: %s", title_texts)
         return title_texts
     
     def click_result(self, index=0):
@@ -36,7 +67,8 @@ class SearchResult(BasePage):
         titles = self.find_elements(self.RESULT_TITLES)
         if index < len(titles):
             titles[index].click()
-            self.logger.info(f"Clicked result at index {index}")
+            self.logger.info("Clicked result at index %s", index)
+            self.collect_performance_metrics()
         else:
             raise IndexError(f"Result index {index} out of range")
         
@@ -45,11 +77,13 @@ class SearchResult(BasePage):
 
     
     def is_no_results_displayed(self):
-        return self.is_element_visible(self.NO_RESULT_MESSAGE, timeout=3)
+        state = self.get_search_outcome(timeout=3)
+        return bool(state) and state["no_results"]["visible"]
     
     def get_did_you_mean_suggestion(self):
-        if self.is_element_visible(self.DID_YOU_MEAN_LINK, timeout=3):
-            return self.get_text(self.DID_YOU_MEAN_LINK)
+        state = self.get_search_outcome(timeout=3)
+        if state and state["did_you_mean"]["visible"]:
+            return state["did_you_mean"]["text"]
         return None
     
     
\ No newline at end of file
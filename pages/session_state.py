@@ -0,0 +1,112 @@
+"""
+Cache snapshot state browser (URL, cookies, localStorage, scroll) dengan nama
+
+Test yang butuh state tertentu (mis. artikel hasil search) cukup membangun
+state sekali lewat alur UI, menyimpannya dengan BasePage.save_state(), lalu
+test berikutnya me-restore-nya dengan langsung membuka URL-nya.
+
+Snapshot tidak terikat ke satu driver, jadi driver lain dari DriverPool bisa
+me-restore state yang sama.
+
+Invalidation:
+    - state lebih lama dari Config.STATE_CACHE_TTL tidak dipakai lagi
+    - restore yang gagal (page tidak siap) menghapus state tersebut (discard)
+    - invalidate(prefix) menghapus state secara eksplisit, mis. "article:"
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+from utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class StateCache:
+    """Snapshot state browser per nama, dengan TTL dan batas jumlah entry"""
+
+    def __init__(self, ttl=None, max_entries=None):
+        """
+        Initialize StateCache
+
+        Args:
+            ttl (float): Umur maksimal state dalam detik (default: Config.STATE_CACHE_TTL)
+            max_entries (int): Jumlah state maksimal, yang paling lama tidak dipakai dihapus
+                               (default: Config.STATE_CACHE_MAX_ENTRIES)
+        """
+        self.ttl = Config.STATE_CACHE_TTL if ttl is None else ttl
+        self.max_entries = max_entries or Config.STATE_CACHE_MAX_ENTRIES
+        self.hits = 0
+        self.misses = 0
+        self._states = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        """
+        Return state dengan nama, None jika belum ada atau sudah expired
+
+        Args:
+            name (str): Nama state, mis. "article:Python (programming language)"
+
+        Returns:
+            dict: Snapshot state
+        """
+        with self._lock:
+            state = self._states.get(name)
+            if state is not None and time.time() - state["saved_at"] > self.ttl:
+                del self._states[name]
+                logger.debug("State expired: %s", name)
+                state = None
+            if state is None:
+                self.misses += 1
+                return None
+            self._states.move_to_end(name)
+            self.hits += 1
+            return state
+
+    def put(self, name, state):
+        """Simpan snapshot state dengan nama"""
+        state = dict(state, saved_at=time.time())
+        with self._lock:
+            self._states[name] = state
+            self._states.move_to_end(name)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+
+    def discard(self, name):
+        """
+        Hapus satu state dengan nama persis
+
+        Returns:
+            bool: True jika state ada dan dihapus
+        """
+        with self._lock:
+            return self._states.pop(name, None) is not None
+
+    def invalidate(self, prefix=""):
+        """
+        Hapus state yang namanya diawali prefix
+
+        Args:
+            prefix (str): Prefix nama state, kosong berarti semua state
+
+        Returns:
+            int: Jumlah state yang dihapus
+        """
+        with self._lock:
+            names = [name for name in self._states if name.startswith(prefix)]
+            for name in names:
+                del self._states[name]
+        return len(names)
+
+    def __contains__(self, name):
+        with self._lock:
+            state = self._states.get(name)
+        return state is not None and time.time() - state["saved_at"] <= self.ttl
+
+
+# State cache yang dipakai semua page object di proses ini
+state_cache = StateCache()
@@ -0,0 +1,290 @@
+"""
+Static HTML backend untuk page objects (tanpa browser)
+
+Untuk check struktural yang tidak butuh rendering (link bahasa, subtitle,
+URL hasil search), HTML diambil lewat pooled HTTP client dan di-parse dengan
+lxml. StaticDriver meniru bagian WebDriver yang dipakai BasePage
+(get, find_element(s), current_url, title), dan StaticPage meng-override
+helper BasePage yang memakai JavaScript atau wait. Page object yang sudah ada
+dipakai ulang lewat subclass, mis. StaticHomePage(StaticPage, HomePage).
+
+Keterbatasan: tidak ada JavaScript dan CSS, jadi visibility hanya dilihat dari
+attribute hidden dan inline style display:none/visibility:hidden. Tidak ada
+rendering, jadi take_screenshot tidak menulis file dan me-return None.
+"""
+
+import logging
+from urllib.parse import urlencode, urljoin
+
+import lxml.html
+import urllib3
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.article_page import ArticlePage
+from pages.base_page import BasePage
+from pages.home_pages import HomePage
+from pages.search_page import SearchPage
+from pages.search_result import SearchResult
+from utils.config import Config
+
+_http = urllib3.PoolManager(
+    num_pools=8,
+    maxsize=Config.STATIC_HTTP_POOL_SIZE,
+    timeout=urllib3.Timeout(total=Config.PAGE_LOAD_TIMEOUT),
+    # total=None: redirect dan retry koneksi dibatasi terpisah, redirect chain tidak memakan jatah retry
+    retries=urllib3.Retry(total=None, connect=2, read=2, redirect=10, backoff_factor=0.2),
+    headers={"User-Agent": "learn-selenium-static/1.0 (structural checks)"},
+)
+
+_XPATH_BY_STRATEGY = {
+    By.ID: "//*[@id=$value]",
+    By.NAME: "//*[@name=$value]",
+    By.LINK_TEXT: "//a[normalize-space(string())=$value]",
+    By.PARTIAL_LINK_TEXT: "//a[contains(string(), $value)]",
+}
+
+
+def _is_hidden(node):
+    """Hidden jika node atau ancestor punya attribute hidden atau inline display:none"""
+    current = node
+    while current is not None:
+        if current.get("hidden") is not None or current.get("type") == "hidden":
+            return True
+        style = (current.get("style") or "").replace(" ", "").lower()
+        if "display:none" in style or "visibility:hidden" in style:
+            return True
+        current = current.getparent()
+    return False
+
+
+class StaticElement:
+    """Element dari HTML yang sudah di-parse, dengan API mirip WebElement"""
+
+    def __init__(self, node, driver):
+        self._node = node
+        self._driver = driver
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        if not self.is_displayed():
+            return ""
+        return " ".join(self._node.text_content().split())
+
+    def get_attribute(self, name):
+        if name == "value" and self._node.tag in ("input", "textarea", "select"):
+            return self._node.value
+        return self._node.get(name)
+
+    def get_dom_attribute(self, name):
+        return self._node.get(name)
+
+    def is_displayed(self):
+        return not _is_hidden(self._node)
+
+    def is_enabled(self):
+        return self._node.get("disabled") is None
+
+    def clear(self):
+        self._node.value = ""
+
+    def send_keys(self, *values):
+        self._node.value = (self._node.value or "") + "".join(str(value) for value in values)
+
+    def click(self):
+        """Follow link atau submit form (GET), seperti yang dilakukan browser"""
+        node = self._node
+        if node.tag == "a" and node.get("href"):
+            self._driver.get(urljoin(self._driver.current_url, node.get("href")))
+            return
+
+        is_submit = (node.tag == "button" and node.get("type", "submit") == "submit") or (
+            node.tag == "input" and node.get("type") in ("submit", "image")
+        )
+        form = next((parent for parent in node.iterancestors() if parent.tag == "form"), None)
+        if is_submit and form is not None:
+            fields = [(name, value) for name, value in form.form_values()]
+            if node.get("name"):
+                fields.append((node.get("name"), node.get("value", "")))
+            action = urljoin(self._driver.current_url, form.get("action") or self._driver.current_url)
+            self._driver.get(f"{action}?{urlencode(fields)}")
+
+    def find_element(self, by, value):
+        return self._driver._find(by, value, self._node, single=True)
+
+    def find_elements(self, by, value):
+        return self._driver._find(by, value, self._node)
+
+
+class StaticDriver:
+    """Pengganti WebDriver yang mengambil HTML lewat HTTP tanpa browser"""
+
+    name = "static"
+
+    def __init__(self, http=None):
+        """
+        Initialize StaticDriver
+
+        Args:
+            http: urllib3 PoolManager (default: pool yang dibagi semua StaticDriver)
+        """
+        self.http = http or _http
+        self.current_url = "about:blank"
+        self.page_source = ""
+        self._tree = lxml.html.fromstring("<html><head><title></title></head><body></body></html>")
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def title(self):
+        return (self._tree.findtext(".//title") or "").strip()
+
+    def get(self, url):
+        """
+        Fetch dan parse halaman, redirect diikuti seperti browser
+
+        Args:
+            url (str): URL yang akan dibuka
+        """
+        headers = dict(self.http.headers)
+        if self.current_url.startswith("http"):
+            # Link root-relative di stand-in server diarahkan berdasarkan Referer
+            headers["Referer"] = self.current_url
+        response = self.http.request("GET", url, headers=headers, redirect=True)
+        for redirect in response.retries.history if response.retries else ():
+            if redirect.redirect_location:
+                url = urljoin(url, redirect.redirect_location)
+        self.current_url = url
+        self.page_source = response.data.decode("utf-8", "replace")
+        self._tree = lxml.html.fromstring(response.data, base_url=self.current_url)
+        self.logger.debug("Fetched %s (%s, %s bytes)", self.current_url, response.status, len(response.data))
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def find_element(self, by, value):
+        return self._find(by, value, self._tree, single=True)
+
+    def find_elements(self, by, value):
+        return self._find(by, value, self._tree)
+
+    def quit(self):
+        pass
+
+    def _find(self, by, value, root, single=False):
+        if by == By.CSS_SELECTOR:
+            nodes = root.cssselect(value)
+        elif by == By.CLASS_NAME:
+            nodes = root.cssselect(f".{value}")
+        elif by == By.TAG_NAME:
+            nodes = list(root.iter(value))
+        elif by == By.XPATH:
+            nodes = root.xpath(value)
+        elif by in _XPATH_BY_STRATEGY:
+            xpath = _XPATH_BY_STRATEGY[by]
+            nodes = root.xpath(xpath if root is self._tree else f".{xpath}", value=value)
+        else:
+            raise ValueError(f"Locator strategy '{by}' tidak didukung oleh StaticDriver")
+
+        elements = [StaticElement(node, self) for node in nodes if isinstance(node, lxml.html.HtmlElement)]
+        if single:
+            if not elements:
+                raise NoSuchElementException(f"Element tidak ditemukan: {by}={value}")
+            return elements[0]
+        return elements
+
+
+class StaticPage:
+    """
+    Mixin yang mengganti helper BasePage berbasis JavaScript/wait dengan lookup di HTML statis
+
+    Dokumen tidak berubah setelah di-fetch, jadi setiap wait cukup satu kali check.
+    Scroll tidak melakukan apa-apa dan take_screenshot hanya log warning (return
+    None), karena halaman tidak di-render.
+    """
+
+    def wait_until(self, condition, timeout=None, description=None):
+        return BasePage.wait_until(self, condition, 0, description)
+
+    def observe_until(self, kind, locator=None, timeout=None, description=None):
+        fallback = BasePage._observer_fallbacks[kind](locator)
+        return BasePage.wait_until(self, fallback, 0, description)
+
+    def open_url(self, url):
+        self.driver.get(url)
+        self.logger.info("Opened URL %s (static)", url)
+
+    def collect_performance_metrics(self):
+        return None
+
+    def wait_for_page_load(self, timeout=None):
+        missing = [locator for locator in self.READY_LOCATORS if not self.driver.find_elements(*locator)]
+        if missing:
+            raise TimeoutException(f"{type(self).__name__} tidak siap, locator tidak ditemukan: {missing}")
+
+    def query_many(self, locators, attributes=None):
+        result = {}
+        for name, locator in locators.items():
+            elements = self.driver.find_elements(*locator)
+            first = elements[0] if elements else None
+            result[name] = {
+                "present": bool(elements),
+                "count": len(elements),
+                "visible": first.is_displayed() if first else False,
+                "text": first.text if first else "",
+                "attributes": {attr: first.get_attribute(attr) if first else None for attr in attributes or []},
+            }
+        return result
+
+    def get_texts(self, locator, with_elements=False):
+        elements = self.driver.find_elements(*locator)
+        if with_elements:
+            return [(element.text, element) for element in elements]
+        return [element.text for element in elements]
+
+    def get_attributes(self, locator, names, with_elements=False):
+        elements = self.driver.find_elements(*locator)
+        values = [{name: element.get_attribute(name) for name in names} for element in elements]
+        if with_elements:
+            return list(zip(values, elements))
+        return values
+
+    def scroll_to_element(self, locator):
+        pass
+
+    def scroll_to_bottom(self):
+        pass
+
+    def scroll_to_top(self):
+        pass
+
+    def take_screenshot(self, filename, wait=True):
+        self.logger.warning("Screenshot '%s' dilewati: static page tidak di-render", filename)
+        return None
+
+    def _capture_state(self):
+        # Tanpa browser: tidak ada cookies, localStorage, maupun scroll
+        return {"url": self.driver.current_url, "origin": None, "cookies": [], "local_storage": {}, "scroll": [0, 0]}
+
+    def _apply_state(self, state):
+        self.open_url(state["url"])
+        self.wait_for_page_load()
+
+
+class StaticHomePage(StaticPage, HomePage):
+    """HomePage dengan static HTML backend"""
+
+
+class StaticSearchPage(StaticPage, SearchPage):
+    """SearchPage dengan static HTML backend"""
+
+
+class StaticSearchResult(StaticPage, SearchResult):
+    """SearchResult dengan static HTML backend"""
+
+
+class StaticArticlePage(StaticPage, ArticlePage):
+    """ArticlePage dengan static HTML backend"""
@@ -0,0 +1,131 @@
+"""
+Fan-out data-driven checks ke beberapa tab dalam satu browser session
+
+Navigasi dimulai di semua tab tanpa menunggu load (window.location lewat
+script), lalu tab dicek bergiliran dengan satu PAGE_READY_JS call. Tab yang
+sudah siap langsung diperiksa dengan page object, lalu dipakai ulang untuk URL
+berikutnya. Total waktu mendekati (jumlah URL / jumlah tab) x latency halaman,
+bukan jumlah URL x (navigasi + wait).
+
+Usage:
+    fanout = TabFanOut(driver, ArticlePage, max_tabs=4)
+    results = fanout.run(urls, lambda page: page.get_article_title())
+"""
+
+import logging
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from pages.scripts import PAGE_READY_JS, START_NAVIGATION_JS
+from utils.config import Config
+
+
+class TabFanOut:
+    """Jalankan check page object untuk banyak URL secara bersamaan di beberapa tab"""
+
+    def __init__(self, driver, page_class, max_tabs=None, timeout=None):
+        """
+        Initialize TabFanOut
+
+        Args:
+            driver: WebDriver instance
+            page_class: Page object class, READY_LOCATORS-nya menentukan kapan tab siap
+            max_tabs (int): Jumlah tab bersamaan (default: Config.FANOUT_MAX_TABS)
+            timeout (float): Batas waktu per URL (default: Config.PAGE_LOAD_TIMEOUT)
+        """
+        self.driver = driver
+        self.page_class = page_class
+        self.max_tabs = max_tabs or Config.FANOUT_MAX_TABS
+        self.timeout = Config.PAGE_LOAD_TIMEOUT if timeout is None else timeout
+        self.logger = logging.getLogger(__name__)
+        self._ready_locators = [list(locator) for locator in page_class.READY_LOCATORS]
+
+    def run(self, urls, check):
+        """
+        Buka semua URL dan jalankan check(page) di setiap halaman yang sudah siap
+
+        Args:
+            urls (list): URL yang diperiksa
+            check (callable): Function yang menerima page object (tab sudah aktif)
+
+        Returns:
+            list: Satu dict per URL, urutan sama dengan urls:
+                  {"url", "result", "error", "elapsed"}
+        """
+        urls = list(urls)
+        results = [None] * len(urls)
+        pending = iter(enumerate(urls))
+        original = self.driver.current_window_handle
+        handles = [original]
+        busy = {}
+
+        try:
+            for handle in self._open_tabs(min(self.max_tabs, len(urls)) - 1):
+                handles.append(handle)
+            for handle in handles:
+                self._assign(handle, pending, busy)
+
+            while busy:
+                progressed = False
+                for handle in list(busy):
+                    index, url, started = busy[handle]
+                    self.driver.switch_to.window(handle)
+                    if self._is_ready():
+                        results[index] = self._check(url, started, check)
+                    elif time.monotonic() - started > self.timeout:
+                        error = TimeoutException(f"{self.page_class.__name__} tidak siap setelah {self.timeout}s: {url}")
+                        results[index] = {"url": url, "result": None, "error": error, "elapsed": self.timeout}
+                    else:
+                        continue
+                    progressed = True
+                    del busy[handle]
+                    self._assign(handle, pending, busy)
+                if not progressed:
+                    time.sleep(Config.WAIT_POLL_INITIAL)
+        finally:
+            self._close_tabs(handles[1:], original)
+
+        failed = sum(1 for result in results if result["error"])
+        self.logger.info("Fan-out %s URLs di %s tab, %s gagal", len(urls), len(handles), failed)
+        return results
+
+    def _open_tabs(self, count):
+        for _ in range(count):
+            self.driver.switch_to.new_window("tab")
+            yield self.driver.current_window_handle
+
+    def _assign(self, handle, pending, busy):
+        """Mulai navigasi URL berikutnya di tab, jika masih ada"""
+        item = next(pending, None)
+        if item is None:
+            return
+        index, url = item
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(START_NAVIGATION_JS, url)
+        busy[handle] = (index, url, time.monotonic())
+        self.logger.debug("Tab %s: navigating to %s", handle, url)
+
+    def _is_ready(self):
+        try:
+            return bool(self.driver.execute_script(PAGE_READY_JS, self._ready_locators))
+        except WebDriverException:
+            # Dokumen sedang berganti
+            return False
+
+    def _check(self, url, started, check):
+        elapsed = time.monotonic() - started
+        try:
+            return {"url": url, "result": check(self.page_class(self.driver)), "error": None, "elapsed": elapsed}
+        except Exception as e:
+            self.logger.error("Check gagal untuk %s: %s", url, e)
+            return {"url": url, "result": None, "error": e, "elapsed": elapsed}
+
+    def _close_tabs(self, handles, original):
+        for handle in handles:
+            try:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            except WebDriverException:
+                pass
+        self.driver.switch_to.window(original)
@@ -3,42 +3,63 @@ Pytest configuration dan fixtures
 """
 
 import pytest
+import asyncio
+import inspect
 import logging
 import os
 from datetime import datetime
-from utils.driver_factory import DriverFactory
+from utils.logging_setup import setup_logging, stop_logging, merge_worker_logs
+from utils.driver_factory import DriverFactory, DriverPool
+from utils.local_server import WikipediaStandIn
+from utils.network_stats import BlockingStats
 from utils.config import Config
+from pages.static_page import StaticDriver
+from pages.async_page import AsyncDriverPool
+from utils.parallel import ParallelRunner, WorkerReporter, WORKER_REPORT_ENV, get_worker_id, resolve_worker_count, worker_files
+from utils.test_history import HistoryRecorder
+from utils.test_impact import ImpactRecorder, ImpactSelector
+from utils.scheduler import SmokeGateScheduler
+from utils.instrumentation import command_recorder
+from utils.tracing import tracer
+from utils.performance_metrics import performance_metrics
+from utils.artifacts import artifact_pipeline
 
 
-# Setup logging
-def setup_logging():
-    """Setup logging configuration"""
-    os.makedirs("logs", exist_ok=True)
-    
-    logging.basicConfig(
-        level=getattr(logging, Config.LOG_LEVEL),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(Config.LOG_FILE),
-            logging.StreamHandler()
-        ]
-    )
+logger = logging.getLogger(__name__)
 
+# Local Wikipedia stand-in server (--target=local)
+_stand_in = None
 
-setup_logging()
-logger = logging.getLogger(__name__)
+# Statistik resource blocking untuk seluruh session
+blocking_stats = BlockingStats()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Fixture untuk pool of pre-warmed WebDriver sessions
+    Scope: session - browser di-launch sekali dan dipakai ulang antar test class
+    """
+    browser = request.config.getoption("--browser") if hasattr(request.config, 'getoption') else Config.BROWSER
+    pool_size = request.config.getoption("--pool-size") or Config.DRIVER_POOL_SIZE
+    
+    pool = DriverPool(browser, size=pool_size)
+    pool.warm_up()
+    
+    yield pool
+    
+    pool.close()
 
 
 @pytest.fixture(scope="class")
-def driver(request):
+def driver(request, driver_pool):
     """
-    Fixture untuk create dan quit WebDriver
+    Fixture untuk checkout dan checkin WebDriver dari pool
     Scope: class - satu driver untuk satu test class
     """
-    logger.info(f"Starting test class")
+    logger.info("Starting test class")
     
-    browser = request.config.getoption("--browser") if hasattr(request.config, 'getoption') else Config.BROWSER
-    driver = DriverFactory.get_driver(browser)
+    driver = driver_pool.checkout()
     
     # Assign driver ke class agar bisa diakses via self.driver
     if request.cls is not None:
@@ -46,8 +67,57 @@ def driver(request):
     
     yield driver
     
+    driver_pool.checkin(driver)
+    logger.info("Finished test class")
+
+@pytest.fixture
+def async_driver_pool(driver_pool):
+    """
+    Fixture untuk async test: checkout driver dari pool tanpa memblokir event loop
+    Jumlah session bersamaan dibatasi --pool-size
+    """
+    return AsyncDriverPool(driver_pool)
+
+
+@pytest.fixture(scope="class")
+def static_driver(request):
+    """
+    Fixture untuk StaticDriver (HTML lewat HTTP, tanpa browser)
+    Scope: class - opt-in per test class dengan @pytest.mark.usefixtures("static_driver")
+    """
+    driver = StaticDriver()
+    
+    if request.cls is not None:
+        request.cls.driver = driver
+    
+    yield driver
+    
     driver.quit()
-    logger.info(f"Finished test class")
+
+
+@pytest.fixture(autouse=True)
+def resource_blocking(request):
+    """
+    Fixture untuk override blocking profile per test dengan marker
+    
+    Usage: @pytest.mark.blocking("dom-only")
+    """
+    if "driver" not in request.fixturenames:
+        yield
+        return
+    
+    driver = request.getfixturevalue("driver")
+    marker = request.node.get_closest_marker("blocking")
+    profile = marker.args[0] if marker else Config.BLOCKING_PROFILE
+    if marker:
+        DriverFactory.set_blocking_profile(driver, profile)
+    
+    yield
+    
+    if Config.BLOCKING_PROFILE or Config.BLOCKING_STATS:
+        blocking_stats.collect(driver, request.node.nodeid, profile or "none")
+    if marker:
+        DriverFactory.set_blocking_profile(driver, Config.BLOCKING_PROFILE)
 
 # @pytest.fixture(scope="session")
 # def driver_session(request):
@@ -70,11 +140,73 @@ def driver(request):
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """
-    Hook untuk capture test result (untuk screenshot on failure)
+    Hook untuk capture test result dan failure artifacts (screenshot, DOM, console log)
     """
     outcome = yield
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
+    
+    if rep.failed and rep.when in ("setup", "call") and Config.SCREENSHOT_ON_FAILURE:
+        driver = item.funcargs.get("driver") or getattr(item.instance, "driver", None)
+        if driver is not None:
+            artifact_pipeline.capture(driver, f"{item.nodeid}-{rep.when}")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    """
+    Hook untuk atribusi WebDriver commands dan trace timeline ke test yang sedang berjalan
+    """
+    command_recorder.current_test = item.nodeid
+    performance_metrics.current_test = item.nodeid
+    tracer.start_test(item.nodeid)
+    yield
+    command_recorder.current_test = None
+    performance_metrics.current_test = None
+    tracer.finish_test()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """
+    Jalankan test `async def` di event loop baru
+    """
+    if not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    funcargs = {name: pyfuncitem.funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    asyncio.run(pyfuncitem.obj(**funcargs))
+    return True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    with tracer.span("setup", "pytest"):
+        yield
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """
+    Hook untuk trace span test body dan gagal jika performance budget terlampaui
+    """
+    with tracer.span("call", "pytest"):
+        result = yield
+    violations = performance_metrics.violations.get(item.nodeid)
+    if violations:
+        pytest.fail("Performance budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item, nextitem):
+    with tracer.span("teardown", "pytest"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    with tracer.span(f"fixture {fixturedef.argname}", "fixture", scope=fixturedef.scope):
+        yield
 
 
 def pytest_addoption(parser):
@@ -93,6 +225,133 @@ def pytest_addoption(parser):
         default=False,
         help="Run tests in headless mode"
     )
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=None,
+        choices=list(DriverFactory.LAUNCH_PROFILES),
+        help="default, atau fast: headless tanpa background services dengan disk cache persisten"
+    )
+    parser.addoption(
+        "--pool-size",
+        action="store",
+        type=int,
+        default=None,
+        help="Jumlah browser session yang di-pool (default: Config.DRIVER_POOL_SIZE)"
+    )
+    parser.addoption(
+        "--driver-offline",
+        action="store_true",
+        default=False,
+        help="Pakai driver binary dari cache saja, tanpa akses network"
+    )
+    parser.addoption(
+        "--target",
+        action="store",
+        default="live",
+        choices=["live", "local"],
+        help="live: wikipedia.org, local: recorded stand-in server"
+    )
+    parser.addoption(
+        "--record",
+        action="store_true",
+        default=False,
+        help="Dengan --target=local, rekam halaman yang belum ada dari Wikipedia"
+    )
+    parser.addoption(
+        "--blocking-profile",
+        action="store",
+        default=None,
+        choices=list(DriverFactory.BLOCKING_PROFILES),
+        help="Resource blocking profile default untuk semua test"
+    )
+    parser.addoption(
+        "--blocking-stats",
+        action="store_true",
+        default=False,
+        help="Catat request dan bytes per test ke Config.BLOCKING_STATS_FILE"
+    )
+    parser.addoption(
+        "--page-load-strategy",
+        action="store",
+        default=None,
+        choices=["normal", "eager", "none"],
+        help="WebDriver pageLoadStrategy (default: Config.PAGE_LOAD_STRATEGY)"
+    )
+    parser.addoption(
+        "--wait-mode",
+        action="store",
+        default=None,
+        choices=["poll", "observer"],
+        help="Wait strategy di BasePage: poll (WebDriver polling) atau observer (MutationObserver)"
+    )
+    parser.addoption(
+        "--workers",
+        action="store",
+        default=None,
+        help="Jumlah worker parallel (angka atau 'auto'), satu browser per worker"
+    )
+    parser.addoption(
+        "--instrument",
+        action="store_true",
+        default=False,
+        help="Hitung dan ukur setiap WebDriver command per page object method dan per test"
+    )
+    parser.addoption(
+        "--timeline",
+        action="store_true",
+        default=False,
+        help="Simpan trace timeline per test (Chrome trace-event JSON) ke Config.TRACE_PATH"
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=False,
+        help="Ukur LCP, CLS, timing dan resources setiap navigasi, gagalkan test yang melebihi budget"
+    )
+    parser.addoption(
+        "--event-streams",
+        action="store_true",
+        default=False,
+        help="Stream console, network dan navigation events lewat WebDriver BiDi"
+    )
+    parser.addoption(
+        "--json-logs",
+        action="store_true",
+        default=False,
+        help="Tulis juga structured log (JSON lines) ke Config.LOG_JSON_FILE"
+    )
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="Rekam file repo yang dipakai setiap test ke Config.TEST_IMPACT_FILE"
+    )
+    parser.addoption(
+        "--impact",
+        action="store_true",
+        default=False,
+        help="Jalankan hanya test yang terpengaruh file yang berubah (butuh map dari --record-impact)"
+    )
+    parser.addoption(
+        "--impact-base",
+        action="store",
+        default=None,
+        help="Git ref pembanding untuk --impact, mis. origin/main (default: Config.IMPACT_BASE)"
+    )
+    parser.addoption(
+        "--smoke-gate",
+        action="store_true",
+        default=False,
+        help="Jalankan smoke test duluan di browser tercepat, stop sebelum regression jika ada yang gagal"
+    )
+    parser.addoption(
+        "--smoke-browser",
+        action="store",
+        default=None,
+        choices=["chrome", "firefox", "edge"],
+        help="Browser untuk tier smoke (default: yang pertama terinstall dari Config.SMOKE_BROWSERS)"
+    )
 
 
 def pytest_configure(config):
@@ -104,15 +363,156 @@ def pytest_configure(config):
     os.makedirs(Config.REPORT_PATH, exist_ok=True)
     os.makedirs("logs", exist_ok=True)
     
+    # Logging lewat queue, file dan console ditulis di background thread
+    if config.getoption("--json-logs"):
+        Config.LOG_JSON = True
+    setup_logging()
+    
     # Set headless from command line
     if config.getoption("--headless"):
         Config.HEADLESS = True
+    if config.getoption("--launch-profile"):
+        Config.LAUNCH_PROFILE = config.getoption("--launch-profile")
+    
+    # Local stand-in: semua URL Wikipedia diarahkan ke server lokal
+    global _stand_in
+    if config.getoption("--target") == "local":
+        Config.TARGET = "local"
+        _stand_in = WikipediaStandIn(record=config.getoption("--record")).start()
+        Config.BASE_URL = _stand_in.url_for("www.wikipedia.org")
+        Config.EN_WIKIPEDIA_URL = _stand_in.url_for("en.wikipedia.org")
+    
+    if config.getoption("--blocking-profile") not in (None, "none"):
+        Config.BLOCKING_PROFILE = config.getoption("--blocking-profile")
+    if config.getoption("--blocking-stats"):
+        Config.BLOCKING_STATS = True
+    
+    if config.getoption("--page-load-strategy"):
+        Config.PAGE_LOAD_STRATEGY = config.getoption("--page-load-strategy")
+    
+    if config.getoption("--wait-mode"):
+        Config.WAIT_MODE = config.getoption("--wait-mode")
+    
+    if config.getoption("--driver-offline"):
+        Config.DRIVER_OFFLINE = True
+    
+    if config.getoption("--instrument"):
+        Config.INSTRUMENT_COMMANDS = True
+    
+    if config.getoption("--timeline"):
+        Config.TRACE_ENABLED = True
+        tracer.enabled = True
+    
+    if config.getoption("--perf-metrics"):
+        Config.COLLECT_PERFORMANCE_METRICS = True
+    
+    if config.getoption("--event-streams"):
+        Config.EVENT_STREAMS = True
+    
+    # Parallel execution: proses utama membagi test, worker menjalankan test
+    runs_tests = True
+    if get_worker_id():
+        config.pluginmanager.register(WorkerReporter(config, os.environ[WORKER_REPORT_ENV]), "wiki_worker_reporter")
+    else:
+        config.pluginmanager.register(HistoryRecorder(), "wiki_history_recorder")
+        if config.getoption("--impact"):
+            config.pluginmanager.register(ImpactSelector(config.getoption("--impact-base")), "wiki_impact_selector")
+        workers = resolve_worker_count(config.getoption("--workers"))
+        smoke_gate = config.getoption("--smoke-gate")
+        if smoke_gate:
+            scheduler = SmokeGateScheduler(config, workers, config.getoption("--smoke-browser"))
+            config.pluginmanager.register(scheduler, "wiki_smoke_gate")
+        if workers > 1:
+            config.pluginmanager.register(ParallelRunner(config, workers, keep_order=smoke_gate), "wiki_parallel_runner")
+            runs_tests = False
+    
+    # Impact map direkam di proses yang benar-benar menjalankan test
+    if config.getoption("--record-impact") and runs_tests:
+        config.pluginmanager.register(ImpactRecorder(config.rootpath), "wiki_impact_recorder")
     
     # Add custom markers
     config.addinivalue_line("markers", "smoke: mark test as smoke test")
     config.addinivalue_line("markers", "regression: mark test as regression test")
     config.addinivalue_line("markers", "search: mark test as search functionality test")
     config.addinivalue_line("markers", "article: mark test as article page test")
+    config.addinivalue_line("markers", "blocking(profile): resource blocking profile untuk test ini")
+    config.addinivalue_line("markers", "unit: test tanpa browser dan network (fake driver / fake data)")
+
+
+def _worker_report_path(path):
+    """Di parallel worker, tambahkan worker id ke nama file report"""
+    if not get_worker_id():
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{get_worker_id()}{ext}"
+
+
+def _worker_reports():
+    """Report yang ditulis setiap worker dan digabung di proses utama: (store, path)"""
+    return [
+        (blocking_stats, Config.BLOCKING_STATS_FILE),
+        (command_recorder, Config.INSTRUMENT_REPORT_FILE),
+        (performance_metrics, Config.PERFORMANCE_METRICS_FILE),
+    ]
+
+
+def pytest_sessionfinish(session):
+    """
+    Proses utama: gabungkan report parallel worker sebelum summary ditampilkan
+    
+    Worker menyimpan report-nya saat selesai (pytest_unconfigure), file worker
+    dihapus setelah digabung.
+    """
+    if get_worker_id():
+        return
+    for store, path in _worker_reports():
+        for worker_file in worker_files(path):
+            store.merge(worker_file)
+            os.remove(worker_file)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Tampilkan report resource blocking, performance metrics, dan WebDriver commands, simpan sebagai JSON
+    """
+    if blocking_stats.tests:
+        terminalreporter.write_sep("=", f"Resource blocking ({len(blocking_stats.tests)} tests)")
+        for line in blocking_stats.format_report():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"Report: {_worker_report_path(Config.BLOCKING_STATS_FILE)}")
+    
+    if performance_metrics.tests:
+        terminalreporter.write_sep("=", f"Performance metrics ({len(performance_metrics.tests)} tests)")
+        for line in performance_metrics.format_report():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"Report: {_worker_report_path(Config.PERFORMANCE_METRICS_FILE)}")
+    
+    if not command_recorder.total_commands:
+        return
+    
+    report_file = _worker_report_path(Config.INSTRUMENT_REPORT_FILE)
+    command_recorder.save(report_file)
+    
+    terminalreporter.write_sep("=", f"WebDriver commands ({command_recorder.total_commands} total)")
+    for line in command_recorder.format_report():
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"Report: {report_file}")
+
+
+def pytest_unconfigure(config):
+    """
+    Pytest unconfigure hook
+    """
+    blocking_stats.save(_worker_report_path(Config.BLOCKING_STATS_FILE))
+    artifact_pipeline.close()
+    performance_metrics.save(_worker_report_path(Config.PERFORMANCE_METRICS_FILE))
+    if _stand_in:
+        _stand_in.stop()
+    
+    stop_logging()
+    # Proses utama: gabungkan log per worker ke log utama
+    if not get_worker_id():
+        merge_worker_logs()
 
 
 # ========== Fixture Examples untuk specific needs ==========
@@ -129,6 +529,28 @@ def en_wiki_url():
     return Config.EN_WIKIPEDIA_URL
 
 
+@pytest.fixture
+def popular_articles():
+    """
+    Return Config.POPULAR_ARTICLES, dengan --target=local hanya judul yang sudah direkam
+
+    Replay me-return 404 untuk halaman yang belum direkam, jadi judul tanpa
+    recording dilewati (rekam dengan --target=local --record).
+    """
+    if _stand_in is None:
+        return Config.POPULAR_ARTICLES
+    titles = [
+        title for title in Config.POPULAR_ARTICLES
+        if _stand_in.is_recorded("en.wikipedia.org", f"/wiki/{title.replace(' ', '_')}")
+    ]
+    missing = [title for title in Config.POPULAR_ARTICLES if title not in titles]
+    if missing:
+        logger.warning("Artikel tanpa recording dilewati: %s", ", ".join(missing))
+    if not titles:
+        pytest.skip("Tidak ada POPULAR_ARTICLES yang direkam untuk stand-in")
+    return titles
+
+
 @pytest.fixture
 def valid_search_keywords():
     """Return list of valid search keywords"""
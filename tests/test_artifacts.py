@@ -0,0 +1,123 @@
+"""
+Unit tests untuk ArtifactPipeline (utils/artifacts.py) dengan fake driver
+"""
+
+import base64
+import json
+import os
+import pytest
+from pages.base_page import BasePage
+from utils.artifacts import ArtifactPipeline
+from utils.config import Config
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeDriver:
+    """Driver dengan screenshot berupa bytes yang bisa diatur per test"""
+
+    def __init__(self, screenshot=b"frame-1", page_source="<html></html>"):
+        self.screenshot = screenshot
+        self.page_source = page_source
+        self.current_url = "https://en.wikipedia.org/wiki/Python"
+
+    def get_screenshot_as_base64(self):
+        return base64.b64encode(self.screenshot).decode()
+
+
+@pytest.fixture
+def make_pipeline(tmp_path):
+    pipelines = []
+
+    def make(max_bytes=1024 * 1024):
+        pipelines.append(ArtifactPipeline(str(tmp_path / "artifacts"), max_bytes=max_bytes, image_format="png", workers=1))
+        return pipelines[-1]
+
+    yield make
+    for pipeline in pipelines:
+        pipeline.close()
+
+
+def capture(pipeline, name, screenshot, dom_size=10):
+    return pipeline.capture(FakeDriver(screenshot, "x" * dom_size), name).result()
+
+
+def test_capture_writes_screenshot_dom_and_console(make_pipeline):
+    pipeline = make_pipeline()
+
+    record = capture(pipeline, "tests/test_a.py::test_fail", b"frame-1")
+
+    with open(record["screenshot"], "rb") as f:
+        assert f.read() == b"frame-1"
+    assert record["screenshot"].endswith(".png")
+    assert os.path.exists(record["dom"])
+    with open(record["console"], encoding="utf-8") as f:
+        assert json.load(f) == []
+
+
+def test_identical_screenshots_share_one_file(make_pipeline):
+    pipeline = make_pipeline()
+
+    first = capture(pipeline, "test_a", b"same-frame")
+    second = capture(pipeline, "test_b", b"same-frame")
+
+    assert first["screenshot"] == second["screenshot"]
+    assert first["dom"] != second["dom"]
+
+
+def test_oldest_artifacts_evicted_over_limit(make_pipeline):
+    # Satu artifact: screenshot 100 bytes + DOM 100 bytes + console "[]"
+    pipeline = make_pipeline(max_bytes=450)
+
+    records = [capture(pipeline, f"test_{index}", bytes([index]) * 100, dom_size=100) for index in range(3)]
+
+    assert not os.path.exists(records[0]["screenshot"])
+    assert not os.path.exists(records[0]["dom"])
+    assert os.path.exists(records[2]["screenshot"])
+    assert os.path.exists(records[2]["dom"])
+    assert pipeline._total_bytes <= 450
+    assert pipeline._total_bytes == sum(os.path.getsize(path) for path in pipeline._files)
+
+
+def test_reused_screenshot_is_evicted_last(make_pipeline):
+    pipeline = make_pipeline(max_bytes=450)
+
+    shared = capture(pipeline, "test_0", b"s" * 100, dom_size=100)
+    capture(pipeline, "test_1", b"t" * 100, dom_size=100)
+    # Frame yang sama dengan test_0: file screenshot-nya jadi yang terbaru
+    capture(pipeline, "test_2", b"s" * 100, dom_size=100)
+
+    assert os.path.exists(shared["screenshot"])
+    assert not os.path.exists(shared["dom"])
+
+
+def test_close_writes_index(make_pipeline, tmp_path):
+    pipeline = make_pipeline()
+    capture(pipeline, "test_a", b"frame-1")
+    pipeline.close()
+
+    with open(tmp_path / "artifacts" / "index.json", encoding="utf-8") as f:
+        index = json.load(f)
+    assert [artifact["name"] for artifact in index["artifacts"]] == ["test_a"]
+
+
+def test_save_screenshot_in_background(make_pipeline, tmp_path):
+    pipeline = make_pipeline()
+    filepath = str(tmp_path / "shots" / "home.png")
+
+    assert pipeline.save_screenshot(base64.b64encode(b"png-bytes").decode(), filepath).result() == filepath
+    with open(filepath, "rb") as f:
+        assert f.read() == b"png-bytes"
+
+
+def test_page_screenshot_exists_on_return(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SCREENSHOT_PATH", f"{tmp_path}/shots/")
+    page = BasePage(FakeDriver(screenshot=b"page-png"))
+
+    filepath = page.take_screenshot("home")
+    with open(filepath, "rb") as f:
+        assert f.read() == b"page-png"
+
+    future = page.take_screenshot("home_async", wait=False)
+    assert future.result() == f"{tmp_path}/shots/home_async.png"
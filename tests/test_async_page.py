@@ -0,0 +1,60 @@
+"""
+Unit tests untuk async page objects (pages/async_page.py) dengan fake page
+"""
+
+import asyncio
+import threading
+import pytest
+from pages.async_page import AsyncArticlePage, AsyncPage
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakePage:
+    TITLE = ("id", "firstHeading")
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @property
+    def current_title(self):
+        return "Python"
+
+    def get_title(self, suffix=""):
+        return f"Python{suffix}", threading.current_thread().name
+
+    def _private(self):
+        return "private"
+
+
+class AsyncFakePage(AsyncPage):
+    PAGE_CLASS = FakePage
+
+
+class FakeDriver:
+    pass
+
+
+def test_public_methods_are_coroutines_on_driver_thread():
+    page = AsyncFakePage(FakeDriver())
+
+    title, thread_name = asyncio.run(page.get_title(suffix=" (language)"))
+
+    assert title == "Python (language)"
+    assert thread_name.startswith("driver")
+    assert AsyncFakePage.get_title.__doc__ == FakePage.get_title.__doc__
+
+
+@pytest.mark.parametrize("name", ["TITLE", "current_title", "_private", "get_titel"])
+def test_non_method_attributes_are_not_exposed(name):
+    page = AsyncFakePage(FakeDriver())
+
+    with pytest.raises(AttributeError):
+        getattr(page, name)
+
+
+def test_page_classes_expose_sync_methods():
+    assert "get_article_title" in dir(AsyncArticlePage)
+    assert not hasattr(AsyncArticlePage, "url_for")
+    assert not hasattr(AsyncArticlePage, "ARTICLE_TITLE")
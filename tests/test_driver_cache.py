@@ -0,0 +1,126 @@
+"""
+Unit tests untuk DriverBinaryCache (utils/driver_cache.py) dengan fake installer
+"""
+
+import json
+import threading
+import time
+import pytest
+from utils import driver_cache
+from utils.driver_cache import DriverBinaryCache
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def browser_version(monkeypatch):
+    versions = {"chrome": "120.0.6099.109"}
+    monkeypatch.setattr(driver_cache, "get_browser_version", versions.get)
+    return versions
+
+
+@pytest.fixture
+def binary(tmp_path):
+    path = tmp_path / "chromedriver"
+    path.write_text("")
+    return str(path)
+
+
+class Installer:
+    def __init__(self, path, delay=0):
+        self.path = path
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return self.path
+
+
+def make_cache(tmp_path, **kwargs):
+    return DriverBinaryCache(str(tmp_path / "cache" / "drivers.json"), **kwargs)
+
+
+def test_installs_once_then_hits(tmp_path, browser_version, binary):
+    cache = make_cache(tmp_path, ttl=60, offline=False)
+    installer = Installer(binary)
+
+    assert cache.resolve("chrome", installer) == binary
+    assert cache.resolve("chrome", installer) == binary
+    assert installer.calls == 1
+    assert list(json.loads((tmp_path / "cache" / "drivers.json").read_text())) == ["chrome:120.0.6099.109"]
+
+
+def test_expired_entry_is_resolved_again(tmp_path, browser_version, binary):
+    cache = make_cache(tmp_path, ttl=60, offline=False)
+    installer = Installer(binary)
+    cache.resolve("chrome", installer)
+
+    entries = cache._load()
+    entries["chrome:120.0.6099.109"]["resolved_at"] -= 61
+    cache._save(entries)
+    cache.resolve("chrome", installer)
+
+    assert installer.calls == 2
+
+
+def test_missing_binary_is_resolved_again(tmp_path, browser_version, binary):
+    cache = make_cache(tmp_path, ttl=60, offline=False)
+    installer = Installer(binary)
+    cache.resolve("chrome", installer)
+
+    installer.path = str(tmp_path / "chromedriver-new")
+    (tmp_path / "chromedriver").unlink()
+
+    assert cache.resolve("chrome", installer) == installer.path
+    assert installer.calls == 2
+
+
+def test_browser_update_uses_new_key(tmp_path, browser_version, binary):
+    cache = make_cache(tmp_path, ttl=60, offline=False)
+    installer = Installer(binary)
+    cache.resolve("chrome", installer)
+
+    browser_version["chrome"] = "121.0.6167.85"
+    cache.resolve("chrome", installer)
+
+    assert installer.calls == 2
+    assert sorted(cache._load()) == ["chrome:120.0.6099.109", "chrome:121.0.6167.85"]
+
+
+def test_offline_uses_expired_entry(tmp_path, browser_version, binary):
+    make_cache(tmp_path, ttl=60, offline=False).resolve("chrome", Installer(binary))
+    cache = make_cache(tmp_path, ttl=0, offline=True)
+    installer = Installer(binary)
+
+    assert cache.resolve("chrome", installer) == binary
+    assert installer.calls == 0
+
+
+def test_offline_without_entry_raises(tmp_path, browser_version, binary):
+    cache = make_cache(tmp_path, ttl=60, offline=True)
+    installer = Installer(binary)
+
+    with pytest.raises(RuntimeError, match="Offline mode"):
+        cache.resolve("chrome", installer)
+    assert installer.calls == 0
+
+
+def test_lock_lets_only_one_concurrent_install(tmp_path, browser_version, binary):
+    # Setiap thread punya instance sendiri, seperti pytest worker yang berbeda
+    installer = Installer(binary, delay=0.1)
+    results = []
+
+    def resolve():
+        results.append(make_cache(tmp_path, ttl=60, offline=False).resolve("chrome", installer))
+
+    threads = [threading.Thread(target=resolve) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [binary] * 4
+    assert installer.calls == 1
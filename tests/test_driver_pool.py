@@ -0,0 +1,207 @@
+"""
+Unit tests untuk DriverPool (utils/driver_factory.py) dengan fake driver
+"""
+
+import threading
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.driver_factory import DriverFactory, DriverPool
+from utils.event_streams import EventStreams, _streams
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Driver dengan tab (handle -> history URL), mencatat command reset"""
+
+    def __init__(self):
+        self.tabs = {"main": ["https://www.wikipedia.org/", "https://en.wikipedia.org/wiki/Python"]}
+        self.current = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.crashed = False
+        self.quit_called = False
+        self.commands = []
+
+    @property
+    def current_window_handle(self):
+        if self.crashed:
+            raise WebDriverException("session deleted")
+        return self.current
+
+    @property
+    def window_handles(self):
+        return list(self.tabs)
+
+    def close(self):
+        del self.tabs[self.current]
+
+    def get(self, url):
+        self.tabs[self.current].append(url)
+
+    def execute_script(self, script, *args):
+        self.commands.append(("script", self.current))
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params.get("origin")))
+        if cmd == "Page.getNavigationHistory":
+            return {"entries": [{"url": url} for url in self.tabs[self.current]]}
+        return {}
+
+    def delete_all_cookies(self):
+        self.commands.append(("delete_all_cookies", self.current))
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def launched(monkeypatch):
+    drivers = []
+
+    def get_driver(browser_name=None):
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    monkeypatch.setattr(DriverFactory, "get_driver", staticmethod(get_driver))
+    return drivers
+
+
+def test_checkin_reuses_session(launched):
+    pool = DriverPool("chrome", size=2, max_reuse=5)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+
+    assert second is first
+    assert len(launched) == 1
+    assert pool._usage[id(first)] == 2
+
+
+def test_checkout_launches_until_size_then_times_out(launched):
+    pool = DriverPool("chrome", size=2, max_reuse=5)
+
+    pool.checkout()
+    pool.checkout()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.05)
+    assert len(launched) == 2
+
+
+def test_evicts_after_max_reuse(launched):
+    pool = DriverPool("chrome", size=1, max_reuse=2)
+
+    driver = pool.checkout()
+    pool.checkin(driver)
+    assert pool.checkout() is driver
+    pool.checkin(driver)
+
+    assert driver.quit_called
+    assert pool.checkout() is not driver
+    assert len(launched) == 2
+
+
+def test_crashed_session_evicted_on_checkout(launched):
+    pool = DriverPool("chrome", size=1, max_reuse=5)
+    driver = pool.checkout()
+    pool.checkin(driver)
+    driver.crashed = True
+
+    replacement = pool.checkout()
+
+    assert replacement is not driver
+    assert driver.quit_called
+    assert list(pool._usage) == [id(replacement)]
+
+
+def test_foreign_driver_is_quit_on_checkin(launched):
+    pool = DriverPool("chrome", size=1)
+    foreign = FakeDriver()
+
+    pool.checkin(foreign)
+
+    assert foreign.quit_called
+    assert pool._idle.empty()
+
+
+def test_failed_reset_evicts(launched):
+    pool = DriverPool("chrome", size=1, max_reuse=5)
+    driver = pool.checkout()
+
+    def closed_window(cmd, params):
+        raise WebDriverException("no such window")
+
+    driver.execute_cdp_cmd = closed_window
+
+    pool.checkin(driver)
+
+    assert driver.quit_called
+    assert not pool._usage
+
+
+def test_reset_clears_storage_for_every_visited_origin(launched):
+    pool = DriverPool("chrome", size=1, max_reuse=5)
+    driver = pool.checkout()
+    driver.tabs["popup"] = ["https://commons.wikimedia.org/wiki/File:Python.svg"]
+
+    pool.checkin(driver)
+
+    cleared = {origin for cmd, origin in driver.commands if cmd == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://www.wikipedia.org", "https://en.wikipedia.org", "https://commons.wikimedia.org"}
+    assert ("Network.clearBrowserCookies", None) in driver.commands
+    assert driver.window_handles == ["main"]
+    assert driver.tabs["main"][-1] == "about:blank"
+
+
+def test_reset_without_cdp_clears_each_tab(launched):
+    pool = DriverPool("firefox", size=1, max_reuse=5)
+    driver = pool.checkout()
+    driver.tabs["popup"] = ["https://commons.wikimedia.org/"]
+
+    pool.checkin(driver)
+
+    assert ("delete_all_cookies", "popup") in driver.commands
+    assert ("delete_all_cookies", "main") in driver.commands
+    assert not any(cmd.startswith("Storage.") for cmd, _ in driver.commands)
+
+
+def test_reset_clears_event_streams(launched):
+    pool = DriverPool("chrome", size=1, max_reuse=5)
+    driver = pool.checkout()
+    streams = _streams[driver] = EventStreams(maxlen=10)
+    streams._on_event(("log.entryAdded", {"level": "error", "text": "Uncaught TypeError"}))
+    streams._on_event(("browsingContext.load", {"url": "https://en.wikipedia.org/wiki/Python"}))
+
+    pool.checkin(driver)
+
+    assert all(not streams.events(channel) for channel in EventStreams.CHANNELS)
+    assert pool.checkout() is driver
+
+
+def test_concurrent_checkouts_count_every_use(launched):
+    pool = DriverPool("chrome", size=4, max_reuse=1000)
+    pool.warm_up()
+
+    def worker():
+        for _ in range(50):
+            driver = pool.checkout()
+            pool.checkin(driver)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(pool._usage.values()) == 200
+    assert len(launched) == 4
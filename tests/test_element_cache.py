@@ -0,0 +1,119 @@
+"""
+Unit tests untuk element cache di BasePage (pages/element_cache.py)
+"""
+
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from pages.base_page import BasePage
+
+
+pytestmark = pytest.mark.unit
+
+SEARCH_INPUT = (By.ID, "searchInput")
+RESULT_ITEM = (By.CSS_SELECTOR, ".mw-search-result")
+SEARCH_BUTTON = (By.CSS_SELECTOR, "button[type='submit']")
+
+
+class FakeElement:
+    def __init__(self, text, driver=None):
+        self._text = text
+        self.driver = driver
+        self.stale = False
+        self.clicks = 0
+
+    @property
+    def text(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale element")
+        return self._text
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        # Seperti WebElement.click: command lewat driver.execute
+        self.driver.execute(Command.CLICK_ELEMENT, {"id": id(self)})
+        self.clicks += 1
+
+
+class FakeDriver:
+    """Driver dengan DOM berupa dict locator -> list element, lookup dihitung"""
+
+    def __init__(self):
+        self.dom = {
+            SEARCH_INPUT: [FakeElement("input", self)],
+            SEARCH_BUTTON: [FakeElement("Search", self)],
+            RESULT_ITEM: [FakeElement("first", self)],
+        }
+        self.lookups = 0
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def find_element(self, by, value):
+        self.lookups += 1
+        return self.dom[(by, value)][0]
+
+    def find_elements(self, by, value):
+        self.lookups += 1
+        return list(self.dom.get((by, value), []))
+
+
+@pytest.fixture
+def page():
+    return BasePage(FakeDriver())
+
+
+def test_with_element_reuses_cached_element(page):
+    assert page.get_text(SEARCH_INPUT) == "input"
+    assert page.get_text(SEARCH_INPUT) == "input"
+
+    assert page.driver.lookups == 1
+    assert page.element_cache.hits == 1
+
+
+def test_cache_hit_across_click(page):
+    page.get_text(SEARCH_INPUT)
+    page.click(SEARCH_BUTTON)
+    page.get_text(SEARCH_INPUT)
+
+    assert page.driver.dom[SEARCH_BUTTON][0].clicks == 1
+    assert page.element_cache.hits == 1
+
+
+def test_navigation_command_invalidates_cache(page):
+    page.get_text(SEARCH_INPUT)
+    page.driver.execute(Command.GET, {"url": "about:blank"})
+    page.get_text(SEARCH_INPUT)
+
+    assert page.driver.lookups == 2
+
+
+def test_stale_cached_element_is_looked_up_again(page):
+    page.get_text(SEARCH_INPUT)
+    page.driver.dom[SEARCH_INPUT][0].stale = True
+    page.driver.dom[SEARCH_INPUT] = [FakeElement("re-rendered")]
+
+    assert page.get_text(SEARCH_INPUT) == "re-rendered"
+
+
+def test_find_element_always_looks_up(page):
+    page.get_text(SEARCH_INPUT)
+    page.find_element(SEARCH_INPUT)
+    page.find_element(SEARCH_INPUT)
+
+    assert page.driver.lookups == 3
+
+
+def test_find_elements_sees_elements_added_by_page_script(page):
+    assert len(page.find_elements(RESULT_ITEM)) == 1
+
+    # Hasil ditambahkan JavaScript halaman, tanpa WebDriver command
+    page.driver.dom[RESULT_ITEM].append(FakeElement("second"))
+
+    assert [element.text for element in page.find_elements(RESULT_ITEM)] == ["first", "second"]
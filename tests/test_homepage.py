@@ -5,6 +5,7 @@ TC-001, TC-002, TC-003
 
 import pytest
 from pages.home_pages import HomePage
+from pages.static_page import StaticHomePage
 from utils.config import Config
 import logging
 
@@ -50,7 +51,7 @@ class TestHomePage:
         # Step 2: Verifikasi title
         title = self.home_page.get_page_title()
         assert "Wikipedia" in title, f"Expected 'Wikipedia' in title, but got: {title}"
-        logger.info(f"✓ Page title verified: {title}")
+        logger.info("✓ Page title verified: %s", title)
         
         # Step 3: Verifikasi logo
         assert self.home_page.is_logo_displayed(), "Wikipedia logo tidak ditampilkan"
@@ -80,16 +81,16 @@ class TestHomePage:
         # Step 2: Hitung bahasa
         language_count = self.home_page.get_language_count()
         assert language_count >= 10, f"Expected at least 10 languages, but found: {language_count}"
-        logger.info(f"✓ Found {language_count} languages")
+        logger.info("✓ Found %s languages", language_count)
         
         # Step 3: Verifikasi bahasa populer
         popular_languages = ['en', 'es', 'de', 'fr', 'ja', 'ru', 'it', 'zh', 'pt']
         
         for lang in popular_languages:
             assert self.home_page.is_language_available(lang), f"Language {lang} tidak tersedia"
-            logger.info(f"✓ Language '{lang}' is available")
+            logger.info("✓ Language '%s' is available", lang)
         
-        logger.info(f"TC-002 PASSED ✓ - Total {language_count} languages verified")
+        logger.info("TC-002 PASSED ✓ - Total %s languages verified", language_count)
     
     @pytest.mark.smoke
     def test_TC003_access_english_wikipedia(self):
@@ -116,12 +117,12 @@ class TestHomePage:
         # Step 3: Verifikasi URL
         current_url = self.home_page.get_current_url()
         assert "en.wikipedia.org" in current_url, f"Expected 'en.wikipedia.org' in URL, but got: {current_url}"
-        logger.info(f"✓ Successfully redirected to: {current_url}")
+        logger.info("✓ Successfully redirected to: %s", current_url)
         
         # Additional verification - page title
         page_title = self.home_page.get_page_title()
         assert "Wikipedia" in page_title, f"Expected 'Wikipedia' in title, but got: {page_title}"
-        logger.info(f"✓ English Wikipedia page title: {page_title}")
+        logger.info("✓ English Wikipedia page title: %s", page_title)
         
         logger.info("TC-003 PASSED ✓")
     
@@ -146,7 +147,7 @@ class TestHomePage:
         # Step 2 & 3: Verifikasi subtitle
         subtitle = self.home_page.get_subtitle_text()
         assert "The Free Encyclopedia" in subtitle, f"Expected 'The Free Encyclopedia', but got: {subtitle}"
-        logger.info(f"✓ Subtitle verified: {subtitle}")
+        logger.info("✓ Subtitle verified: %s", subtitle)
         
         logger.info("Subtitle verification PASSED ✓")
     
@@ -201,7 +202,7 @@ class TestHomePage:
         
         for lang_code, lang_name in test_languages.items():
             assert self.home_page.is_language_available(lang_code), f"Language {lang_name} tidak tersedia"
-            logger.info(f"✓ {lang_name} ({lang_code}) is available")
+            logger.info("✓ %s (%s) is available", lang_name, lang_code)
         
         logger.info("Multiple language links PASSED ✓")
     
@@ -242,7 +243,7 @@ class TestHomePage:
             lang_code (str): Language code
             expected_url_part (str): Expected URL fragment
         """
-        logger.info(f"Starting parametrized test for language: {lang_code}")
+        logger.info("Starting parametrized test for language: %s", lang_code)
         
         # Buka homepage
         self.home_page.open()
@@ -253,4 +254,37 @@ class TestHomePage:
         # Verifikasi URL
         current_url = self.home_page.get_current_url()
         assert expected_url_part in current_url, f"Expected {expected_url_part} in URL, but got: {current_url}"
-        logger.info(f"✓ Successfully navigated to {lang_code}: {current_url}")
\ No newline at end of file
+        logger.info("✓ Successfully navigated to %s: %s", lang_code, current_url)
+
+
+@pytest.mark.usefixtures("static_driver")
+class TestHomePageStatic:
+    """Structural checks homepage tanpa browser (static HTML backend)"""
+    
+    @pytest.fixture(autouse=True)
+    def setup(self, static_driver):
+        self.home_page = StaticHomePage(static_driver)
+        self.home_page.open()
+    
+    @pytest.mark.smoke
+    def test_TC002_verify_available_languages_static(self):
+        """TC-002 (static): Verifikasi bahasa yang tersedia di homepage"""
+        language_count = self.home_page.get_language_count()
+        assert language_count >= 10, f"Expected at least 10 languages, but found: {language_count}"
+        
+        available = self.home_page.get_popular_languages()
+        for lang in ['en', 'es', 'de', 'fr', 'ja', 'ru', 'it', 'zh', 'pt']:
+            assert lang in available, f"Language {lang} tidak tersedia"
+        logger.info("✓ Found %s languages (static)", language_count)
+    
+    @pytest.mark.regression
+    def test_homepage_subtitle_verification_static(self):
+        """Subtitle "The Free Encyclopedia" (static)"""
+        subtitle = self.home_page.get_subtitle_text()
+        assert "The Free Encyclopedia" in subtitle, f"Expected 'The Free Encyclopedia', but got: {subtitle}"
+    
+    @pytest.mark.regression
+    def test_multiple_language_links_static(self):
+        """Multiple language links tersedia (static)"""
+        for lang_code in ['en', 'es', 'de', 'fr', 'ja']:
+            assert self.home_page.is_language_available(lang_code), f"Language {lang_code} tidak tersedia"
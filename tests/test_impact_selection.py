@@ -0,0 +1,118 @@
+"""
+Unit tests untuk test-impact selection (utils/test_impact.py)
+"""
+
+import os
+import pytest
+from utils import test_impact
+from utils.config import Config
+from utils.test_impact import ImpactMap, ImpactRecorder, ImpactSelector
+
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class FakeItem:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+
+class FakeHook:
+    def __init__(self):
+        self.deselected = []
+
+    def pytest_deselected(self, items):
+        self.deselected.extend(items)
+
+
+class FakeConfig:
+    rootpath = "."
+
+    def __init__(self):
+        self.hook = FakeHook()
+
+
+@pytest.fixture
+def impact_map(tmp_path):
+    impact_map = ImpactMap(str(tmp_path / "impact.json"))
+    impact_map.tests = {
+        "tests/test_homepage.py::TestHomePage::test_logo": {
+            "files": ["pages/home_pages.py", "tests/test_homepage.py"],
+            "fixtures": ["driver"],
+        },
+        "tests/test_search.py::TestSearch::test_search": {
+            "files": ["pages/search_page.py", "tests/test_search.py"],
+            "fixtures": ["driver"],
+        },
+    }
+    impact_map.fixtures = {"driver": ["utils/driver_factory.py"]}
+    return impact_map
+
+
+def select(impact_map, changed, monkeypatch, nodeids=None):
+    monkeypatch.setattr(test_impact, "changed_files", lambda base=None, cwd=None: changed)
+    items = [FakeItem(nodeid) for nodeid in nodeids or impact_map.tests]
+    config = FakeConfig()
+    ImpactSelector(impact_map=impact_map).pytest_collection_modifyitems(None, config, items)
+    return [item.nodeid for item in items], [item.nodeid for item in config.hook.deselected]
+
+
+def test_files_for_includes_fixture_files(impact_map):
+    files = impact_map.files_for("tests/test_homepage.py::TestHomePage::test_logo")
+    assert files == {"pages/home_pages.py", "tests/test_homepage.py", "utils/driver_factory.py"}
+
+
+def test_files_for_unknown_test(impact_map):
+    assert impact_map.files_for("tests/test_new.py::test_new") is None
+
+
+def test_run_all_reason(impact_map, tmp_path):
+    selector = ImpactSelector(impact_map=impact_map)
+    assert selector._run_all_reason({"pages/home_pages.py"}) is None
+    assert "git diff" in selector._run_all_reason(None)
+    assert "utils/config.py" in selector._run_all_reason({"utils/config.py", "pages/home_pages.py"})
+
+    empty = ImpactSelector(impact_map=ImpactMap(str(tmp_path / "missing.json")))
+    assert "no impact map" in empty._run_all_reason({"pages/home_pages.py"})
+
+
+def test_deselects_unaffected_tests(impact_map, monkeypatch):
+    selected, deselected = select(impact_map, {"pages/search_page.py", "README.md"}, monkeypatch)
+    assert selected == ["tests/test_search.py::TestSearch::test_search"]
+    assert deselected == ["tests/test_homepage.py::TestHomePage::test_logo"]
+
+
+def test_fixture_change_selects_all_users(impact_map, monkeypatch):
+    selected, deselected = select(impact_map, {"utils/driver_factory.py"}, monkeypatch)
+    assert len(selected) == 2 and not deselected
+
+
+def test_unknown_test_always_selected(impact_map, monkeypatch):
+    nodeids = list(impact_map.tests) + ["tests/test_new.py::test_new"]
+    selected, _ = select(impact_map, {"pages/search_page.py"}, monkeypatch, nodeids)
+    assert "tests/test_new.py::test_new" in selected
+
+
+def test_global_file_runs_all(impact_map, monkeypatch):
+    selected, deselected = select(impact_map, {Config.IMPACT_GLOBAL_FILES[0]}, monkeypatch)
+    assert len(selected) == 2 and not deselected
+
+
+def test_imports_of_includes_data_modules(impact_map):
+    import pages.base_page  # noqa: F401 - module harus ada di sys.modules
+
+    recorder = ImpactRecorder(ROOT, impact_map)
+    assert "pages/scripts.py" in recorder.imports_of("pages/base_page.py")
+
+
+def test_data_file_reads_recorded(impact_map):
+    recorder = ImpactRecorder(ROOT, impact_map)
+    recorder._auditing = True
+    bucket = set()
+    with recorder._recording(bucket):
+        recorder._audit("open", (os.path.join(ROOT, Config.LOCAL_RECORDINGS_PATH, "www.wikipedia.org", "a.body"), "rb", 0))
+        recorder._audit("open", (os.path.join(ROOT, Config.LOG_FILE), "a", 0))
+        recorder._audit("open", ("/usr/lib/python3/os.py", "r", 0))
+    assert bucket == {f"{Config.LOCAL_RECORDINGS_PATH}www.wikipedia.org/a.body"}
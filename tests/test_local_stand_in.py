@@ -0,0 +1,176 @@
+"""
+Unit tests untuk recorded fixtures Wikipedia stand-in (utils/local_server.py)
+
+Stand-in server dijalankan dengan recordings di Config.LOCAL_RECORDINGS_PATH,
+lalu locator page object di-resolve lewat StaticDriver, tanpa browser dan
+tanpa network.
+"""
+
+import json
+import os
+import pytest
+import urllib3
+from benchmarks.run import SEARCH_KEYWORD
+from pages.search_page import SearchPage
+from pages.static_page import StaticArticlePage, StaticDriver, StaticHomePage, StaticSearchPage, StaticSearchResult
+from utils.config import Config
+from utils.local_server import RecordingStore, WikipediaStandIn
+
+
+pytestmark = pytest.mark.unit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    stand_in = WikipediaStandIn(os.path.join(ROOT, Config.LOCAL_RECORDINGS_PATH)).start()
+    yield stand_in
+    stand_in.stop()
+
+
+@pytest.fixture
+def stand_in_driver(stand_in, monkeypatch):
+    monkeypatch.setattr(Config, "BASE_URL", stand_in.url_for("www.wikipedia.org"))
+    monkeypatch.setattr(Config, "EN_WIKIPEDIA_URL", stand_in.url_for("en.wikipedia.org"))
+    # Pool sendiri tanpa retry, server lokal harus langsung menjawab
+    return StaticDriver(urllib3.PoolManager(retries=urllib3.Retry(total=None, connect=0, read=0, redirect=10)))
+
+
+def search(driver, keyword):
+    home_page = StaticHomePage(driver)
+    home_page.open()
+    StaticSearchPage(driver).search(keyword)
+    return StaticSearchResult(driver)
+
+
+def test_homepage_locators(stand_in_driver):
+    home_page = StaticHomePage(stand_in_driver)
+    home_page.open()
+
+    assert home_page.is_logo_displayed()
+    assert home_page.get_subtitle_text() == "The Free Encyclopedia"
+    assert home_page.is_search_input_displayed()
+    assert home_page.get_language_count() >= 10
+    for lang_code in ("en", "es", "de", "fr", "ja", "ru", "it", "zh", "pt", "ar"):
+        assert home_page.is_language_available(lang_code), lang_code
+
+
+def test_search_results_locators(stand_in_driver):
+    search_result = search(stand_in_driver, "list programming languages")
+
+    assert "search=" in search_result.get_current_url().lower()
+    assert search_result.get_results_count() == 3
+    assert search_result.get_result_title()[0] == "List of programming languages"
+    assert not search_result.is_no_results_displayed()
+
+    # Link root-relative (/wiki/...) diikuti lewat Referer ke host yang benar
+    search_result.click_result(0)
+    article_page = StaticArticlePage(stand_in_driver)
+    assert article_page.is_article_loaded()
+    assert article_page.get_article_title() == "List of programming languages"
+
+
+def test_benchmark_search_keyword_recorded(stand_in_driver):
+    search_result = search(stand_in_driver, SEARCH_KEYWORD)
+
+    assert search_result.get_results_count() > 0
+
+
+@pytest.mark.parametrize("keyword", ["adsjasdjfha", "!!!!!!!!!!", "seleniumverylongkeyword"])
+def test_search_no_results_locators(stand_in_driver, keyword):
+    search_result = search(stand_in_driver, keyword)
+
+    assert "search=" in search_result.get_current_url().lower()
+    assert search_result.is_no_results_displayed()
+    assert search_result.get_results_count() == 0
+
+
+def test_search_exact_title_redirects_to_article(stand_in_driver):
+    search(stand_in_driver, "Python (programming language)")
+
+    article_page = StaticArticlePage(stand_in_driver)
+    assert article_page.get_current_url().endswith("/wiki/Python_(programming_language)")
+    assert article_page.get_article_title() == "Python (programming language)"
+
+
+def test_article_toc_locators(stand_in_driver):
+    article_page = StaticArticlePage(stand_in_driver)
+    article_page.open_url(StaticArticlePage.url_for("Python (programming language)"))
+
+    assert article_page.is_article_loaded()
+    assert article_page.is_toc_displayed()
+    assert article_page.get_toc_title() == "Contents"
+    assert "1 History" in article_page.get_toc_items()
+    assert article_page.get_first_paragraph().startswith("Python is a high-level")
+
+
+@pytest.mark.parametrize("title", Config.POPULAR_ARTICLES)
+def test_popular_articles_recorded(stand_in_driver, title):
+    article_page = StaticArticlePage(stand_in_driver)
+    article_page.open_url(StaticArticlePage.url_for(title))
+
+    assert article_page.get_article_title() == title
+    assert article_page.is_content_available()
+
+
+def test_typeahead_json(stand_in):
+    url = stand_in.url_for("en.wikipedia.org", "/w/rest.php/v1/search/title?limit=6&q=Python")
+    assert SearchPage.TYPEAHEAD_REQUEST.search(url)
+
+    response = urllib3.request("GET", url, retries=False)
+
+    assert response.status == 200
+    pages = json.loads(response.data)["pages"]
+    assert pages[0]["title"] == "Python (programming language)"
+
+
+def test_portal_urls_rewritten_to_stand_in(stand_in):
+    response = urllib3.request("GET", stand_in.url_for("www.wikipedia.org"), retries=False)
+    body = response.data.decode()
+
+    assert f"{stand_in.base_url}/_h/www.wikipedia.org/search-redirect.php" in body
+    assert f"{stand_in.base_url}/_h/en.wikipedia.org/w/rest.php/v1/search/title" in body
+    assert "https://en.wikipedia.org" not in body
+
+
+def test_unrecorded_request_is_404(stand_in):
+    response = urllib3.request("GET", stand_in.url_for("en.wikipedia.org", "/wiki/Not_recorded"), retries=False)
+
+    assert response.status == 404
+
+
+def test_static_driver_follows_redirect_chain(tmp_path):
+    store = RecordingStore(str(tmp_path))
+    hops = ["/wiki/A", "/wiki/B", "/wiki/C", "/wiki/D", "/wiki/E"]
+    for path, target in zip(hops, hops[1:]):
+        store.save("en.wikipedia.org", path, 301, {"location": f"https://en.wikipedia.org{target}"}, b"")
+    store.save("en.wikipedia.org", hops[-1], 200, {"content-type": "text/html"}, b"<title>E</title>")
+    stand_in = WikipediaStandIn(str(tmp_path)).start()
+
+    try:
+        # Pool default StaticDriver: 4 redirect berturut-turut harus diikuti sampai halaman akhir
+        driver = StaticDriver()
+        driver.get(stand_in.url_for("en.wikipedia.org", hops[0]))
+    finally:
+        stand_in.stop()
+
+    assert driver.current_url == stand_in.url_for("en.wikipedia.org", hops[-1])
+    assert driver.title == "E"
+
+
+def test_is_recorded_only_for_saved_requests(tmp_path):
+    store = RecordingStore(str(tmp_path))
+    store.save("en.wikipedia.org", "/wiki/Indonesia", 200, {"content-type": "text/html"}, b"")
+
+    assert WikipediaStandIn(str(tmp_path)).is_recorded("en.wikipedia.org", "/wiki/Indonesia")
+    assert not WikipediaStandIn(str(tmp_path)).is_recorded("en.wikipedia.org", "/wiki/World_War_II")
+    assert WikipediaStandIn(str(tmp_path), record=True).is_recorded("en.wikipedia.org", "/wiki/World_War_II")
+
+
+def test_static_page_screenshot_is_skipped(stand_in_driver, caplog):
+    home_page = StaticHomePage(stand_in_driver)
+    home_page.open()
+
+    assert home_page.take_screenshot("static_home") is None
+    assert "static_home" in caplog.text
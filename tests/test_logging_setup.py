@@ -0,0 +1,96 @@
+"""
+Unit tests untuk merge log parallel worker (utils/logging_setup.py)
+"""
+
+import json
+import logging
+import pytest
+from utils import logging_setup
+from utils.config import Config
+from utils.logging_setup import LazyQueueHandler, merge_worker_logs
+
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def log_files(tmp_path, monkeypatch):
+    main_log = tmp_path / "test_execution.log"
+    json_log = tmp_path / "test_execution.jsonl"
+    monkeypatch.setattr(Config, "LOG_FILE", str(main_log))
+    monkeypatch.setattr(Config, "LOG_JSON_FILE", str(json_log))
+    monkeypatch.setattr(logging_setup, "_session_offsets", {})
+    return main_log, json_log
+
+
+def start_session(path, previous_runs=""):
+    """Isi log dari run sebelumnya, lalu catat offset seperti setup_logging()"""
+    path.write_text(previous_runs)
+    logging_setup._session_offsets[str(path)] = len(previous_runs.encode())
+
+
+def test_text_logs_merged_by_time(log_files, tmp_path):
+    main_log, _ = log_files
+    start_session(main_log, "2026-01-01 09:00:00,000 - old - INFO - previous run\n")
+    with open(main_log, "a") as f:
+        f.write("2026-01-02 10:00:00,000 - conftest - INFO - session start\n")
+    (tmp_path / "test_execution.gw0.log").write_text(
+        "2026-01-02 10:00:01,000 - gw0 - pages - INFO - open homepage\n"
+        "2026-01-02 10:00:03,000 - gw0 - pages - ERROR - failed\n"
+        "Traceback (most recent call last):\n"
+        "  File \"x.py\", line 1\n"
+    )
+    (tmp_path / "test_execution.gws0.log").write_text(
+        "2026-01-02 10:00:02,000 - gws0 - pages - INFO - smoke search\n"
+        "2026-01-02 10:00:04,000 - gws0 - pages - INFO - smoke done\n"
+    )
+
+    assert merge_worker_logs() == 2
+
+    assert main_log.read_text().splitlines() == [
+        "2026-01-01 09:00:00,000 - old - INFO - previous run",
+        "2026-01-02 10:00:00,000 - conftest - INFO - session start",
+        "2026-01-02 10:00:01,000 - gw0 - pages - INFO - open homepage",
+        "2026-01-02 10:00:02,000 - gws0 - pages - INFO - smoke search",
+        "2026-01-02 10:00:03,000 - gw0 - pages - ERROR - failed",
+        "Traceback (most recent call last):",
+        "  File \"x.py\", line 1",
+        "2026-01-02 10:00:04,000 - gws0 - pages - INFO - smoke done",
+    ]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["test_execution.log"]
+
+
+def test_json_logs_merged_by_created(log_files, tmp_path):
+    _, json_log = log_files
+    start_session(json_log)
+
+    def line(created, message):
+        return json.dumps({"created": created, "message": message}) + "\n"
+
+    (tmp_path / "test_execution.gw0.jsonl").write_text(line(100.5, "b") + line(102.0, "d"))
+    (tmp_path / "test_execution.gw1.jsonl").write_text(line(100.1, "a") + line(101.0, "c"))
+
+    assert merge_worker_logs() == 2
+
+    messages = [json.loads(line)["message"] for line in json_log.read_text().splitlines()]
+    assert messages == ["a", "b", "c", "d"]
+
+
+def test_no_worker_files_leaves_log_untouched(log_files):
+    main_log, _ = log_files
+    start_session(main_log, "2026-01-01 09:00:00,000 - old - INFO - previous run\n")
+
+    assert merge_worker_logs() == 0
+    assert main_log.read_text() == "2026-01-01 09:00:00,000 - old - INFO - previous run\n"
+
+
+def test_lazy_handler_formats_mutable_args_eagerly():
+    handler = LazyQueueHandler(None)
+    items = ["a"]
+    lazy = logging.LogRecord("x", logging.INFO, __file__, 1, "open %s", ("Python",), None)
+    mutable = logging.LogRecord("x", logging.INFO, __file__, 1, "items %s", (items,), None)
+
+    assert handler.prepare(lazy) is lazy
+    prepared = handler.prepare(mutable)
+    items.append("b")
+    assert prepared.getMessage() == "items ['a']"
@@ -0,0 +1,65 @@
+"""
+Unit tests untuk statistik resource blocking (utils/network_stats.py) dengan fake performance log
+"""
+
+import json
+import pytest
+from utils.local_server import RecordingStore, WikipediaStandIn
+from utils.network_stats import BlockingStats
+
+
+pytestmark = pytest.mark.unit
+
+
+def log_entry(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+class FakeDriver:
+    def __init__(self, entries):
+        self.entries = entries
+
+    def get_log(self, log_type):
+        entries, self.entries = self.entries, []
+        return entries
+
+
+@pytest.fixture
+def stand_in(tmp_path):
+    store = RecordingStore(str(tmp_path))
+    store.save("upload.wikimedia.org", "/logo.png", 200, {"content-type": "image/png"}, b"x" * 3000)
+    stand_in = WikipediaStandIn(str(tmp_path)).start()
+    yield stand_in
+    stand_in.stop()
+
+
+def blocked(request_id, url):
+    return [
+        log_entry("Network.requestWillBeSent", requestId=request_id, request={"url": url}),
+        log_entry("Network.loadingFailed", requestId=request_id, blockedReason="inspector"),
+    ]
+
+
+def test_saved_bytes_from_head_for_never_loaded_url(stand_in):
+    url = stand_in.url_for("upload.wikimedia.org", "/logo.png")
+    missing = stand_in.url_for("upload.wikimedia.org", "/missing.png")
+    driver = FakeDriver(blocked("1", url) + blocked("2", missing))
+
+    record = BlockingStats().collect(driver, "test_a", "dom-only")
+
+    assert record["blocked_requests"] == 2
+    assert record["saved_bytes"] == 3000
+
+
+def test_saved_bytes_prefers_size_loaded_without_blocking(monkeypatch):
+    url = "https://upload.wikimedia.org/logo.png"
+    stats = BlockingStats()
+    monkeypatch.setattr(BlockingStats, "_head_size", staticmethod(lambda url: pytest.fail("HEAD request")))
+    stats.collect(FakeDriver([
+        log_entry("Network.requestWillBeSent", requestId="1", request={"url": url}),
+        log_entry("Network.loadingFinished", requestId="1", encodedDataLength=4096),
+    ]), "test_a", "none")
+
+    record = stats.collect(FakeDriver(blocked("2", url)), "test_b", "dom-only")
+
+    assert record["saved_bytes"] == 4096
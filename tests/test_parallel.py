@@ -0,0 +1,99 @@
+"""
+Unit tests untuk sharding parallel worker dan TestHistory (utils/parallel.py, utils/test_history.py)
+"""
+
+import pytest
+from utils import parallel
+from utils.parallel import group_key, resolve_worker_count, shard_items
+from utils.test_history import TestHistory
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeItem:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.cls = object() if nodeid.count("::") > 1 else None
+
+
+@pytest.fixture
+def history(tmp_path):
+    return TestHistory(str(tmp_path / "history.json"))
+
+
+def record(history, durations, outcome="passed"):
+    for nodeid, duration in durations.items():
+        history.record(nodeid, duration, outcome)
+    history.save()
+
+
+@pytest.mark.parametrize("value, expected", [(None, 1), ("", 1), ("3", 3), ("0", 1), ("-2", 1)])
+def test_resolve_worker_count(value, expected):
+    assert resolve_worker_count(value) == expected
+
+
+def test_resolve_worker_count_auto(monkeypatch):
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: 6)
+    assert resolve_worker_count("auto") == 6
+    monkeypatch.setattr(parallel.os, "cpu_count", lambda: None)
+    assert resolve_worker_count("auto") == 1
+
+
+def test_group_key_keeps_class_together():
+    assert group_key(FakeItem("tests/test_a.py::TestA::test_one")) == "tests/test_a.py::TestA"
+    assert group_key(FakeItem("tests/test_a.py::test_module")) == "tests/test_a.py"
+
+
+def test_shard_items_balances_by_history(history):
+    record(history, {
+        "tests/test_a.py::TestSlow::test_1": 30.0,
+        "tests/test_a.py::TestSlow::test_2": 30.0,
+        "tests/test_b.py::TestMedium::test_1": 40.0,
+        "tests/test_c.py::TestFast::test_1": 5.0,
+        "tests/test_c.py::TestFast::test_2": 5.0,
+    })
+    items = [FakeItem(nodeid) for nodeid in sorted(history.entries)]
+
+    shards = shard_items(items, 2, history)
+
+    assert shards == [
+        ["tests/test_a.py::TestSlow::test_1", "tests/test_a.py::TestSlow::test_2"],
+        ["tests/test_b.py::TestMedium::test_1", "tests/test_c.py::TestFast::test_1", "tests/test_c.py::TestFast::test_2"],
+    ]
+
+
+def test_shard_items_keep_order(history):
+    record(history, {"tests/test_a.py::test_fast": 1.0, "tests/test_b.py::test_slow": 10.0})
+    items = [FakeItem("tests/test_a.py::test_fast"), FakeItem("tests/test_b.py::test_slow")]
+
+    assert shard_items(items, 1, history) == [["tests/test_b.py::test_slow", "tests/test_a.py::test_fast"]]
+    assert shard_items(items, 1, history, keep_order=True) == [["tests/test_a.py::test_fast", "tests/test_b.py::test_slow"]]
+
+
+def test_shard_items_drops_empty_shards(history):
+    items = [FakeItem("tests/test_a.py::TestA::test_1"), FakeItem("tests/test_a.py::TestA::test_2")]
+
+    assert shard_items(items, 4, history) == [["tests/test_a.py::TestA::test_1", "tests/test_a.py::TestA::test_2"]]
+
+
+def test_history_failure_rate_and_last_failed(history):
+    nodeid = "tests/test_a.py::test_flaky"
+    for outcome in ("failed", "passed", "passed", "failed"):
+        record(history, {nodeid: 2.0}, outcome)
+
+    reloaded = TestHistory(history.path)
+    assert reloaded.failure_rate(nodeid) == 0.5
+    assert reloaded.last_failed(nodeid)
+    assert reloaded.duration(nodeid) == 2.0
+    assert reloaded.failure_rate("tests/test_a.py::test_new") == 0.0
+    assert not reloaded.last_failed("tests/test_a.py::test_new")
+    assert reloaded.duration("tests/test_a.py::test_new", 7.0) == 7.0
+
+
+def test_history_save_merges_other_workers(history):
+    other_worker = TestHistory(history.path)
+    record(history, {"tests/test_a.py::test_1": 1.0})
+    record(other_worker, {"tests/test_b.py::test_1": 2.0})
+
+    assert sorted(TestHistory(history.path).entries) == ["tests/test_a.py::test_1", "tests/test_b.py::test_1"]
@@ -0,0 +1,153 @@
+"""
+Unit tests untuk smoke-first scheduling (utils/scheduler.py)
+"""
+
+import pytest
+from utils import scheduler
+from utils.scheduler import SmokeGateScheduler, prioritize
+from utils.test_history import TestHistory
+
+
+pytestmark = pytest.mark.unit
+
+
+class FakeItem:
+    def __init__(self, nodeid, smoke=False):
+        self.nodeid = nodeid
+        self.cls = object() if nodeid.count("::") > 1 else None
+        self.smoke = smoke
+
+    def get_closest_marker(self, name):
+        return name if name == "smoke" and self.smoke else None
+
+
+class FakeOption:
+    collectonly = False
+    continue_on_collection_errors = False
+
+
+class FakeConfig:
+    option = FakeOption()
+
+
+class FakeSession:
+    def __init__(self, items):
+        self.items = list(items)
+        self.testsfailed = 0
+        self.config = FakeConfig()
+
+
+class FakeRunner:
+    """Pengganti ParallelRunner: smoke tier "gagal" sebanyak failures test"""
+
+    failures = 0
+    runs = []
+
+    def __init__(self, config, workers, keep_order=False):
+        pass
+
+    def run_items(self, session, items, prefix="gw", extra_args=(), keep_order=False):
+        FakeRunner.runs.append([item.nodeid for item in items])
+        session.testsfailed += FakeRunner.failures
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    FakeRunner.failures = 0
+    FakeRunner.runs = []
+    monkeypatch.setattr(scheduler, "ParallelRunner", FakeRunner)
+    return FakeRunner
+
+
+def schedule(items, tmp_path):
+    gate = SmokeGateScheduler(FakeConfig(), browser="chrome", history=TestHistory(str(tmp_path / "history.json")))
+    items = list(items)
+    gate.pytest_collection_modifyitems(None, None, items)
+    session = FakeSession(items)
+    return gate, session, gate.pytest_runtestloop(session)
+
+
+ITEMS = [
+    FakeItem("tests/test_search.py::TestSearch::test_valid", smoke=True),
+    FakeItem("tests/test_search.py::TestSearch::test_invalid"),
+    FakeItem("tests/test_homepage.py::TestHomePage::test_logo", smoke=True),
+    FakeItem("tests/test_homepage.py::test_module_level"),
+]
+
+
+def test_tier_split_puts_smoke_first(runner, tmp_path):
+    gate, session, _ = schedule(ITEMS, tmp_path)
+
+    assert {item.nodeid for item in gate.smoke} == {ITEMS[0].nodeid, ITEMS[2].nodeid}
+    assert {item.nodeid for item in gate.regression} == {ITEMS[1].nodeid, ITEMS[3].nodeid}
+    assert runner.runs == [[item.nodeid for item in gate.smoke]]
+
+
+def test_passing_gate_hands_regression_tier_to_next_loop(runner, tmp_path):
+    gate, session, result = schedule(ITEMS, tmp_path)
+
+    assert result is None
+    assert session.items == gate.regression
+    assert gate.outcome[1] == "green"
+
+
+def test_failing_gate_stops_run(runner, tmp_path):
+    runner.failures = 1
+    gate, session, result = schedule(ITEMS, tmp_path)
+
+    assert result is True
+    assert len(session.items) == 4
+    assert gate.outcome == ("Smoke gate failed: 1 smoke test(s) failed, 2 regression tests not started", "red")
+
+
+@pytest.mark.parametrize("smoke, reason", [(True, "no regression tests"), (False, "no smoke tests")])
+def test_gate_skipped_when_tier_empty(runner, tmp_path, smoke, reason):
+    items = [FakeItem(f"tests/test_x.py::test_{index}", smoke=smoke) for index in range(3)]
+    gate, session, result = schedule(items, tmp_path)
+
+    assert result is None
+    assert runner.runs == []
+    assert len(session.items) == 3
+    assert gate.skip_reason == reason
+    assert gate.outcome == (f"Smoke gate skipped: {reason}, 3 tests run without gate", "yellow")
+    assert gate.pytest_report_collectionfinish(None, None, items).startswith(f"smoke gate: skipped ({reason})")
+
+
+def test_prioritize_recent_failures_then_failure_rate_then_duration(tmp_path):
+    history = TestHistory(str(tmp_path / "history.json"))
+    runs = {
+        "tests/test_a.py::test_slow": ["passed"] * 2,
+        "tests/test_a.py::test_fast": ["passed"] * 2,
+        "tests/test_b.py::test_flaky": ["failed", "passed"],
+        "tests/test_c.py::test_broken": ["passed", "failed"],
+    }
+    durations = {"tests/test_a.py::test_slow": 20.0, "tests/test_a.py::test_fast": 1.0}
+    for run in range(2):
+        for nodeid, outcomes in runs.items():
+            history.record(nodeid, durations.get(nodeid, 5.0), outcomes[run])
+        history.save()
+    items = [FakeItem(nodeid) for nodeid in runs]
+
+    ordered = [item.nodeid for item in prioritize(items, history)]
+
+    assert ordered == [
+        "tests/test_c.py::test_broken",
+        "tests/test_b.py::test_flaky",
+        "tests/test_a.py::test_fast",
+        "tests/test_a.py::test_slow",
+    ]
+
+
+def test_prioritize_keeps_class_together(tmp_path):
+    history = TestHistory(str(tmp_path / "history.json"))
+    history.record("tests/test_a.py::TestA::test_2", 1.0, "failed")
+    history.save()
+    items = [
+        FakeItem("tests/test_a.py::TestA::test_1"),
+        FakeItem("tests/test_b.py::test_other"),
+        FakeItem("tests/test_a.py::TestA::test_2"),
+    ]
+
+    ordered = [item.nodeid for item in prioritize(items, history)]
+
+    assert ordered == ["tests/test_a.py::TestA::test_2", "tests/test_a.py::TestA::test_1", "tests/test_b.py::test_other"]
@@ -0,0 +1,118 @@
+"""
+Unit tests untuk StateCache dan BasePage.ensure_state (pages/session_state.py)
+"""
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from pages import base_page, session_state
+from pages.base_page import BasePage
+from pages.session_state import StateCache
+
+
+pytestmark = pytest.mark.unit
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_state.time, "time", clock.time)
+    return clock
+
+
+@pytest.fixture
+def cache(clock, monkeypatch):
+    cache = StateCache(ttl=60, max_entries=3)
+    monkeypatch.setattr(base_page, "state_cache", cache)
+    return cache
+
+
+class FakePage(BasePage):
+    """Page object tanpa browser: state hanya URL, restore bisa dibuat gagal"""
+
+    def __init__(self, url="https://en.wikipedia.org/wiki/Python", restore_fails=False):
+        super().__init__(driver=None)
+        self.url = url
+        self.restore_fails = restore_fails
+        self.applied = []
+
+    def _capture_state(self):
+        return {"url": self.url}
+
+    def _apply_state(self, state):
+        if self.restore_fails:
+            raise TimeoutException("page tidak siap")
+        self.applied.append(state["url"])
+
+    def wait_for_page_load(self, timeout=None):
+        pass
+
+
+def test_put_get_discard(cache):
+    cache.put("article:Python", {"url": "a"})
+    cache.put("article:Python 3", {"url": "b"})
+
+    assert cache.get("article:Python")["url"] == "a"
+    assert cache.discard("article:Python")
+    assert not cache.discard("article:Python")
+    # discard hanya nama persis, bukan prefix
+    assert cache.get("article:Python 3")["url"] == "b"
+
+
+def test_invalidate_by_prefix(cache):
+    for name in ("article:A", "article:B", "search:A"):
+        cache.put(name, {"url": name})
+
+    assert cache.invalidate("article:") == 2
+    assert "search:A" in cache
+    assert "article:A" not in cache
+
+
+def test_ttl_expiry(cache, clock):
+    cache.put("article:Python", {"url": "a"})
+
+    clock.now += 60
+    assert "article:Python" in cache
+    clock.now += 1
+    assert "article:Python" not in cache
+    assert cache.get("article:Python") is None
+    assert cache.misses == 1
+
+
+def test_max_entries_evicts_least_recently_used(cache):
+    for name in ("a", "b", "c"):
+        cache.put(name, {"url": name})
+    cache.get("a")
+    cache.put("d", {"url": "d"})
+
+    assert [name for name in "abcd" if name in cache] == ["a", "c", "d"]
+
+
+def test_ensure_state_restores_cached_state(cache):
+    FakePage().save_state("article:Python")
+    page = FakePage()
+    built = []
+
+    assert page.ensure_state("article:Python", lambda: built.append(True))
+    assert page.applied == ["https://en.wikipedia.org/wiki/Python"]
+    assert built == []
+
+
+def test_ensure_state_falls_back_to_build_when_restore_fails(cache):
+    cache.put("article:Python", {"url": "stale"})
+    cache.put("article:Python 3", {"url": "other"})
+    page = FakePage(restore_fails=True)
+    built = []
+
+    assert not page.ensure_state("article:Python", lambda: built.append(True))
+    assert built == [True]
+    # State yang gagal diganti snapshot baru, state lain dengan prefix sama tetap ada
+    assert cache.get("article:Python")["url"] == page.url
+    assert cache.get("article:Python 3")["url"] == "other"
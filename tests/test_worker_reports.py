@@ -0,0 +1,100 @@
+"""
+Unit tests untuk report per parallel worker yang digabung di proses utama
+"""
+
+import os
+import pytest
+from utils.instrumentation import CommandRecorder
+from utils.network_stats import BlockingStats
+from utils.parallel import worker_files
+from utils.performance_metrics import PerformanceMetrics
+
+
+pytestmark = pytest.mark.unit
+
+
+def blocking_record(profile, requests=10, blocked=2):
+    return {
+        "profile": profile,
+        "requests": requests,
+        "transferred_bytes": requests * 1024,
+        "blocked_requests": blocked,
+        "saved_bytes": blocked * 2048,
+    }
+
+
+def test_worker_files_match_both_tiers_only(tmp_path):
+    path = tmp_path / "report.json"
+    for name in ("report.gw1.json", "report.gw0.json", "report.gws0.json", "report.json", "report.gw0.log", "other.gw0.json"):
+        (tmp_path / name).write_text("{}")
+
+    names = [os.path.basename(file) for file in worker_files(str(path))]
+
+    assert names == ["report.gw0.json", "report.gw1.json", "report.gws0.json"]
+
+
+def test_blocking_stats_merge_keeps_every_worker(tmp_path):
+    for worker_id, tests in (("gw0", ["a", "b"]), ("gw1", ["c"])):
+        stats = BlockingStats()
+        stats.tests = {f"tests/test_x.py::{name}": blocking_record("dom-only") for name in tests}
+        stats.save(str(tmp_path / f"blocking.{worker_id}.json"))
+
+    merged = BlockingStats()
+    for path in worker_files(str(tmp_path / "blocking.json")):
+        merged.merge(path)
+
+    assert len(merged.tests) == 3
+    assert merged.totals() == {"requests": 30, "transferred_bytes": 30720, "blocked_requests": 6, "saved_bytes": 12288}
+
+
+def test_blocking_stats_report_per_profile():
+    stats = BlockingStats()
+    stats.tests = {
+        "a": blocking_record("dom-only"),
+        "b": blocking_record("dom-only"),
+        "c": blocking_record("none", requests=40, blocked=0),
+    }
+
+    header, dom_only, none = stats.format_report()
+
+    assert header.split() == ["profile", "tests", "requests", "KiB", "blocked", "saved", "KiB"]
+    assert dom_only.split() == ["dom-only", "2", "20", "20", "4", "8"]
+    assert none.split() == ["none", "1", "40", "40", "0", "0"]
+
+
+def test_command_recorder_merge_adds_counts(tmp_path):
+    for worker_id, test in (("gw0", "test_a"), ("gw1", "test_b")):
+        recorder = CommandRecorder()
+        recorder.current_test = test
+        recorder.record("findElement", 0.5, "HomePage.open")
+        recorder.record("get", 1.0, "HomePage.open")
+        recorder.save(str(tmp_path / f"commands.{worker_id}.json"))
+
+    merged = CommandRecorder()
+    for path in worker_files(str(tmp_path / "commands.json")):
+        merged.merge(path)
+
+    assert merged.total_commands == 4
+    assert merged.tests["test_a"] == {"count": 2, "time": 1.5}
+    [(caller, count, total, commands)] = merged.caller_rows()
+    assert (caller, count, total) == ("HomePage.open", 4, 3.0)
+    assert commands["findElement"] == {"count": 2, "time": 1.0}
+
+
+def test_performance_metrics_merge_and_report(tmp_path):
+    for worker_id, lcp in (("gw0", 1200), ("gws0", 3100)):
+        metrics = PerformanceMetrics()
+        metrics.current_test = f"test_{worker_id}"
+        metrics.record(object(), "ArticlePage", {"ttfb": 80, "lcp": lcp, "cls": 0.01}, budget={"lcp": 2500})
+        metrics.save(str(tmp_path / f"perf.{worker_id}.json"))
+
+    merged = PerformanceMetrics()
+    for path in worker_files(str(tmp_path / "perf.json")):
+        merged.merge(path)
+
+    assert sorted(merged.tests) == ["test_gw0", "test_gws0"]
+    assert list(merged.violations) == ["test_gws0"]
+    lines = merged.format_report()
+    assert lines[1].split() == ["ArticlePage", "2", "80", "3100", "0.01"]
+    assert lines[3] == "Budget violations (1):"
+    assert "lcp=3100 > budget 2500" in lines[4]
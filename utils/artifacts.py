@@ -0,0 +1,218 @@
+"""
+Failure artifacts (screenshot, DOM, console log) dengan proses di background thread
+
+Di thread test hanya data mentah yang diambil dari browser: screenshot base64,
+DOM snapshot dan console log. Decode, kompresi (WebP/JPEG, butuh Pillow),
+dedup screenshot yang identik berdasarkan hash, dan penulisan ke disk
+dijalankan di thread pool, jadi browser dan test berikutnya tidak menunggu.
+Total ukuran artifact satu run dibatasi Config.ARTIFACT_MAX_MB; artifact
+paling lama dihapus lebih dulu.
+"""
+
+import base64
+import hashlib
+import io
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+from utils.config import Config
+from utils.event_streams import EventStreams
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow optional, tanpa Pillow screenshot disimpan sebagai PNG
+    Image = None
+
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactPipeline:
+    """Capture artifact di thread test, encode dan tulis di background"""
+
+    def __init__(self, path=None, max_bytes=None, image_format=None, workers=None):
+        """
+        Initialize ArtifactPipeline
+
+        Args:
+            path (str): Folder output (default: Config.ARTIFACT_PATH)
+            max_bytes (int): Batas total ukuran artifact run ini (default: Config.ARTIFACT_MAX_MB)
+            image_format (str): png, webp, atau jpeg (default: Config.ARTIFACT_IMAGE_FORMAT)
+            workers (int): Jumlah background thread (default: Config.ARTIFACT_WORKERS)
+        """
+        self.path = path or Config.ARTIFACT_PATH
+        self.max_bytes = max_bytes or Config.ARTIFACT_MAX_MB * 1024 * 1024
+        self.image_format = (image_format or Config.ARTIFACT_IMAGE_FORMAT).lower()
+        if self.image_format != "png" and Image is None:
+            logger.warning("Pillow tidak terinstall, screenshot disimpan sebagai PNG (bukan %s)", self.image_format)
+            self.image_format = "png"
+        self.index = []
+        self._executor = ThreadPoolExecutor(max_workers=workers or Config.ARTIFACT_WORKERS, thread_name_prefix="artifacts")
+        self._lock = threading.Lock()
+        self._files = OrderedDict()
+        self._screenshots = {}
+        self._total_bytes = 0
+        self._futures = set()
+        self._sequence = itertools.count(1)
+
+    def capture(self, driver, name):
+        """
+        Ambil screenshot, DOM dan console log lalu proses di background
+
+        Args:
+            driver: WebDriver instance
+            name (str): Nama artifact, mis. pytest node id
+
+        Returns:
+            Future: Selesai dengan metadata artifact, atau None jika driver tidak mendukung screenshot
+        """
+        if not hasattr(driver, "get_screenshot_as_base64"):
+            return None
+        try:
+            screenshot = driver.get_screenshot_as_base64()
+            dom = driver.page_source
+            url = driver.current_url
+        except WebDriverException as e:
+            logger.error("Capture artifact gagal untuk %s: %s", name, e)
+            return None
+        console = self._console_log(driver)
+        return self._submit(self._process, name, url, screenshot, dom, console)
+
+    def save_screenshot(self, screenshot, filepath):
+        """
+        Decode dan tulis screenshot base64 ke filepath di background
+
+        Returns:
+            Future: Selesai dengan filepath
+        """
+        return self._submit(self._write_screenshot_file, screenshot, filepath)
+
+    def flush(self):
+        """Tunggu semua artifact yang sedang diproses"""
+        with self._lock:
+            pending = list(self._futures)
+        for future in pending:
+            future.exception()
+
+    def close(self):
+        """Tunggu semua proses selesai dan tulis index.json"""
+        self._executor.shutdown(wait=True)
+        if not self.index:
+            return
+        with open(os.path.join(self.path, "index.json"), "w", encoding="utf-8") as f:
+            json.dump({"total_bytes": self._total_bytes, "artifacts": self.index}, f, indent=2)
+        logger.info("%s failure artifact(s) saved: %s", len(self.index), self.path)
+
+    def _submit(self, func, *args):
+        future = self._executor.submit(func, *args)
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        if future.exception() is not None:
+            logger.error("Proses artifact gagal: %s", future.exception())
+
+    @staticmethod
+    def _console_log(driver):
+        """Console log dari BiDi event stream jika ada, atau browser log Chromium"""
+        streams = EventStreams.for_driver(driver)
+        if streams is not None:
+            return streams.events("console")
+        if hasattr(driver, "get_log"):
+            try:
+                return driver.get_log("browser")
+            except WebDriverException:
+                pass
+        return []
+
+    def _process(self, name, url, screenshot, dom, console):
+        base = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)[-120:]
+        stamp = f"{time.strftime('%Y%m%d_%H%M%S')}_{next(self._sequence)}"
+        png = base64.b64decode(screenshot)
+        digest = hashlib.sha1(png).hexdigest()
+
+        with self._lock:
+            screenshot_file = self._screenshots.get(digest)
+            if screenshot_file in self._files:
+                # Frame identik dengan artifact sebelumnya: pakai ulang file-nya
+                self._files.move_to_end(screenshot_file)
+            else:
+                screenshot_file = None
+
+        if screenshot_file is None:
+            screenshot_file = os.path.join(self.path, f"{base}_{stamp}.{self.image_format}")
+            self._write(screenshot_file, self._encode(png))
+            with self._lock:
+                self._screenshots[digest] = screenshot_file
+
+        dom_file = os.path.join(self.path, f"{base}_{stamp}.html")
+        console_file = os.path.join(self.path, f"{base}_{stamp}.console.json")
+        self._write(dom_file, dom.encode("utf-8"))
+        self._write(console_file, json.dumps(console, indent=2, default=str).encode("utf-8"))
+
+        record = {
+            "name": name,
+            "url": url,
+            "screenshot": screenshot_file,
+            "screenshot_sha1": digest,
+            "dom": dom_file,
+            "console": console_file,
+            "console_errors": sum(1 for entry in console if str(entry.get("level", "")).lower() in ("error", "severe")),
+        }
+        with self._lock:
+            self.index.append(record)
+        logger.info("Failure artifacts saved for %s: %s", name, screenshot_file)
+        return record
+
+    def _encode(self, png):
+        if self.image_format == "png":
+            return png
+        image = Image.open(io.BytesIO(png))
+        output = io.BytesIO()
+        if self.image_format in ("jpeg", "jpg"):
+            image.convert("RGB").save(output, "JPEG", quality=Config.ARTIFACT_IMAGE_QUALITY, optimize=True)
+        else:
+            image.save(output, self.image_format.upper(), quality=Config.ARTIFACT_IMAGE_QUALITY)
+        return output.getvalue()
+
+    def _write(self, filepath, data):
+        """Tulis file lalu evict file paling lama jika total melebihi batas"""
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(data)
+        with self._lock:
+            self._files[filepath] = len(data)
+            self._total_bytes += len(data)
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(self._files) > 1:
+                old_file, size = self._files.popitem(last=False)
+                self._total_bytes -= size
+                evicted.append(old_file)
+        for old_file in evicted:
+            try:
+                os.remove(old_file)
+            except OSError:
+                pass
+            logger.debug("Artifact evicted (disk limit): %s", old_file)
+
+    def _write_screenshot_file(self, screenshot, filepath):
+        os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+        with open(filepath, "wb") as f:
+            f.write(base64.b64decode(screenshot))
+        return filepath
+
+
+# Pipeline yang dipakai BasePage.take_screenshot dan hook failure di conftest
+artifact_pipeline = ArtifactPipeline()
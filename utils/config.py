@@ -2,22 +2,104 @@ class Config:
     BASE_URL = "https://www.wikipedia.org/"
     EN_WIKIPEDIA_URL = "https://en.wikipedia.org/"
     
+    # Target: live (wikipedia.org) atau local (recorded stand-in server)
+    TARGET = "live"
+    LOCAL_RECORDINGS_PATH = "test_data/recordings/"
+    
+    # Static HTML backend (tanpa browser)
+    STATIC_HTTP_POOL_SIZE = 10
+    
     BROWSER = "chrome"
-    HEADLES = False
-    IMPLICIT_WAIT = 10
+    HEADLESS = False
+    # Launch profile: default atau fast (headless, tanpa background services, disk cache persisten)
+    LAUNCH_PROFILE = "default"
+    BROWSER_CACHE_DIR = ".browser_cache/"
     EXPLICIT_WAIT = 10
+    WAIT_POLL_INITIAL = 0.05
+    WAIT_POLL_BACKOFF = 2
+    WAIT_POLL_MAX = 0.5
+    WAIT_MODE = "poll"  # poll atau observer (MutationObserver di browser)
+    ELEMENT_CACHE = True  # pakai ulang WebElement per locator sampai navigasi/action berikutnya
     PAGE_LOAD_TIMEOUT = 30
+    # normal: tunggu semua subresource, eager: DOMContentLoaded, none: langsung return
+    PAGE_LOAD_STRATEGY = "eager"
+    
+    # Driver pool (pre-warmed browser sessions)
+    DRIVER_POOL_SIZE = 1
+    DRIVER_POOL_MAX_REUSE = 20
+    DRIVER_POOL_CHECKOUT_TIMEOUT = 60
+    
+    # Driver binary resolution cache
+    DRIVER_CACHE_FILE = ".driver_cache/drivers.json"
+    DRIVER_CACHE_TTL = 24 * 60 * 60
+    DRIVER_OFFLINE = False
+    
+    # Parallel execution
+    TEST_HISTORY_FILE = ".test_history.json"
+    PARALLEL_DEFAULT_DURATION = 10
+    
+    # Test-impact selection (--record-impact / --impact)
+    TEST_IMPACT_FILE = ".test_impact.json"
+    IMPACT_BASE = "HEAD"
+    # Perubahan file ini menjalankan semua test
+    IMPACT_GLOBAL_FILES = ["tests/conftest.py", "tests/__init__.py", "utils/config.py", "pytest.ini", "requirements.txt"]
+    
+    # Smoke-first scheduling (--smoke-gate)
+    SMOKE_MARKER = "smoke"
+    # Urut dari yang paling cepat start, yang pertama terinstall dipakai untuk tier smoke
+    SMOKE_BROWSERS = ["chrome", "edge", "firefox"]
+    SMOKE_LAUNCH_PROFILE = "fast"
     
     WINDOW_WIDTH = 1920
     WINDOW_HEIGHT = 1080
     
+    # Resource blocking: None, "no-media", atau "dom-only"
+    BLOCKING_PROFILE = None
+    BLOCKING_STATS = False
+    BLOCKING_STATS_FILE = "reports/blocking_stats.json"
+    
+    # WebDriver command instrumentation (count + timing per page object method)
+    INSTRUMENT_COMMANDS = False
+    INSTRUMENT_REPORT_FILE = "reports/webdriver_commands.json"
+    
+    # Timeline per test (Chrome trace-event JSON, buka di ui.perfetto.dev)
+    TRACE_ENABLED = False
+    TRACE_PATH = "reports/traces/"
+    
+    # Browser performance metrics per navigasi, budget di page object (PERFORMANCE_BUDGET)
+    COLLECT_PERFORMANCE_METRICS = False
+    PERFORMANCE_METRICS_FILE = "reports/performance_metrics.json"
+    
+    # BiDi event streams (console, network, navigation) per driver
+    EVENT_STREAMS = False
+    EVENT_BUFFER_SIZE = 500
+    
+    # Cache snapshot state browser (BasePage.save_state / restore_state)
+    STATE_CACHE_TTL = 10 * 60
+    STATE_CACHE_MAX_ENTRIES = 50
+    # Halaman ringan di origin tujuan untuk set cookies/localStorage sebelum restore
+    STATE_BOOTSTRAP_PATH = "/robots.txt"
+    
+    # Jumlah tab bersamaan untuk fan-out data-driven checks (pages/tab_fanout.py)
+    FANOUT_MAX_TABS = 4
+    
     SCREENSHOT_ON_FAILURE = True
     SCREENSHOT_PATH = "reports/screenshots/"
     
+    # Failure artifacts (screenshot, DOM, console log), diproses di background thread
+    ARTIFACT_PATH = "reports/artifacts/"
+    ARTIFACT_MAX_MB = 200
+    ARTIFACT_IMAGE_FORMAT = "png"  # png, webp atau jpeg (webp/jpeg butuh Pillow)
+    ARTIFACT_IMAGE_QUALITY = 70
+    ARTIFACT_WORKERS = 2
+    
     REPORT_PATH = "reports/html_reports/"
     
     LOG_FILE = "logs/test_execution.log"
     LOG_LEVEL = "INFO"
+    # Structured log, satu JSON object per baris
+    LOG_JSON = False
+    LOG_JSON_FILE = "logs/test_execution.jsonl"
     
     VALID_SEARCH_KEYWORDS = [
         "Python programming",
@@ -0,0 +1,153 @@
+"""
+Cache untuk hasil resolusi driver binary (chromedriver, geckodriver, msedgedriver)
+
+webdriver_manager melakukan version check (dan kadang download) setiap kali
+install() dipanggil. Hasilnya disimpan di disk per browser + versi browser
+yang terinstall, dengan TTL, dan dibagi antar pytest worker memakai file lock.
+"""
+
+import functools
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from utils.config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Exclusive lock antar proses menggunakan lock file
+
+    Args:
+        path (str): Path lock file
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+") as handle:
+        if fcntl:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK menyerah setelah 10 detik, coba lagi
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+@functools.lru_cache(maxsize=None)
+def get_browser_version(browser_name):
+    """
+    Get versi browser yang terinstall (di-cache per proses)
+
+    Args:
+        browser_name (str): Name browser (chrome, firefox, edge)
+
+    Returns:
+        str: Versi browser, atau None jika tidak terdeteksi
+    """
+    from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+
+    browser_types = {
+        "chrome": ChromeType.GOOGLE,
+        "firefox": "firefox",
+        "edge": ChromeType.MSEDGE,
+    }
+    try:
+        return OperationSystemManager().get_browser_version_from_os(browser_types[browser_name])
+    except Exception as e:
+        logger.debug("Versi browser %s tidak terdeteksi: %s", browser_name, e)
+        return None
+
+
+class DriverBinaryCache:
+    """Disk cache untuk path driver binary hasil webdriver_manager"""
+
+    def __init__(self, cache_file=None, ttl=None, offline=None):
+        """
+        Initialize DriverBinaryCache
+
+        Args:
+            cache_file (str): Path file JSON cache
+            ttl (int): Umur maksimal entry dalam detik
+            offline (bool): Jika True, tidak pernah memanggil webdriver_manager
+        """
+        self.cache_file = cache_file or Config.DRIVER_CACHE_FILE
+        self.ttl = Config.DRIVER_CACHE_TTL if ttl is None else ttl
+        self.offline = Config.DRIVER_OFFLINE if offline is None else offline
+        self.lock_file = f"{self.cache_file}.lock"
+
+    def resolve(self, browser_name, installer):
+        """
+        Return path driver binary dari cache, atau install dan simpan ke cache
+
+        Args:
+            browser_name (str): Name browser (chrome, firefox, edge)
+            installer (callable): Dipanggil jika cache miss, return path driver
+
+        Returns:
+            str: Path ke driver binary
+        """
+        version = get_browser_version(browser_name)
+        key = f"{browser_name}:{version or 'unknown'}"
+
+        with file_lock(self.lock_file):
+            entries = self._load()
+            entry = entries.get(key)
+
+            if entry and os.path.exists(entry["path"]):
+                age = time.time() - entry["resolved_at"]
+                if self.offline or age < self.ttl:
+                    logger.debug("Driver cache hit %s: %s", key, entry["path"])
+                    return entry["path"]
+
+            if self.offline:
+                raise RuntimeError(
+                    f"Offline mode: tidak ada driver ter-cache untuk {key} di {self.cache_file}. "
+                    f"Jalankan sekali tanpa offline mode untuk mengisi cache."
+                )
+
+            path = installer()
+            entries[key] = {"path": path, "resolved_at": time.time()}
+            self._save(entries)
+            logger.info("Driver resolved %s: %s", key, path)
+            return path
+
+    def clear(self):
+        """Hapus semua entry cache"""
+        with file_lock(self.lock_file):
+            self._save({})
+
+    def _load(self):
+        try:
+            with open(self.cache_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries):
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
@@ -1,4 +1,13 @@
+import logging
+import os
+import queue
+import threading
+import time
+import weakref
+from urllib.parse import urlsplit
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
@@ -6,10 +15,96 @@ from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from utils.config import Config
+from utils.driver_cache import DriverBinaryCache
+from utils.instrumentation import command_recorder
+from utils.tracing import tracer
+from utils.event_streams import EventStreams
+from utils.parallel import get_worker_id
+
+_MEDIA_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.ogg", "*.ogv", "*.mp3", "*upload.wikimedia.org/*",
+]
+_FONT_PATTERNS = ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"]
+_STYLE_PATTERNS = ["*.css", "*load.php?*only=styles*"]
+_ANALYTICS_PATTERNS = ["*intake-analytics.wikimedia.org/*", "*/beacon/*", "*/event/*", "*google-analytics.com/*"]
+
+# Storage per origin yang dihapus lewat CDP saat pooled session di-reset
+_CLEARED_STORAGE_TYPES = "local_storage,indexeddb,websql,cache_storage,service_workers"
+_CLEAR_STORAGE_JS = "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+
 
 class DriverFactory:
     """factory class for create Webdriver Instance"""
     
+    # Resource blocking profiles: URL patterns (wildcard *) yang tidak di-load.
+    # Script tetap di-load agar typeahead dan TOC berjalan.
+    BLOCKING_PROFILES = {
+        "none": [],
+        "no-media": _MEDIA_PATTERNS,
+        "dom-only": _MEDIA_PATTERNS + _FONT_PATTERNS + _STYLE_PATTERNS + _ANALYTICS_PATTERNS,
+    }
+    
+    # Firefox tidak punya Network.setBlockedURLs, pakai preferences saat launch.
+    # Preferences hanya mencakup gambar, media autoplay dan web font: CSS
+    # (_STYLE_PATTERNS) dan analytics (_ANALYTICS_PATTERNS) di profile dom-only
+    # tetap di-load di Firefox, dan statistik blocking tidak tersedia (tanpa
+    # performance log).
+    FIREFOX_BLOCKING_PREFS = {
+        "none": {},
+        "no-media": {"permissions.default.image": 2, "media.autoplay.default": 5},
+        "dom-only": {
+            "permissions.default.image": 2,
+            "media.autoplay.default": 5,
+            "browser.display.use_document_fonts": 0,
+        },
+    }
+    
+    # Launch profiles. fast: selalu headless (mode baru), tanpa background networking,
+    # component update, first-run UI, throttling tab background dan translate,
+    # dengan disk cache persisten di Config.BROWSER_CACHE_DIR.
+    LAUNCH_PROFILES = ("default", "fast")
+    
+    CHROMIUM_LAUNCH_ARGS = {
+        "default": [],
+        "fast": [
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--disable-background-timer-throttling",
+            "--disable-backgrounding-occluded-windows",
+            "--disable-renderer-backgrounding",
+            "--disable-features=Translate,OptimizationHints,MediaRouter",
+            "--disable-sync",
+            "--disable-default-apps",
+        ],
+    }
+    
+    FIREFOX_LAUNCH_PREFS = {
+        "default": {},
+        "fast": {
+            "app.update.auto": False,
+            "app.normandy.enabled": False,
+            "extensions.update.enabled": False,
+            "browser.shell.checkDefaultBrowser": False,
+            "browser.startup.homepage_override.mstone": "ignore",
+            "browser.aboutwelcome.enabled": False,
+            "datareporting.policy.dataSubmissionEnabled": False,
+            "toolkit.telemetry.enabled": False,
+            "network.captive-portal-service.enabled": False,
+            "network.connectivity-service.enabled": False,
+            "browser.safebrowsing.update.enabled": False,
+            "browser.translations.enable": False,
+            "dom.timeout.enable_budget_timer_throttling": False,
+            "browser.cache.disk.enable": True,
+        },
+    }
+    
+    # Slot disk cache yang sedang dipakai browser hidup, per browser
+    _cache_slots = {}
+    _cache_slots_lock = threading.Lock()
+    
     @staticmethod
     def get_driver(browser_name= None):
         """
@@ -27,23 +122,39 @@ class DriverFactory:
             
         browser_name = browser_name.lower()
         
-        if browser_name == "chrome":
-            return DriverFactory._get_chrome_driver()
-        elif browser_name == "firefox":
-            return DriverFactory._get_firefox_driver()
-        elif browser_name == "edge":
-            return DriverFactory._get_edge_driver()
-        else:
-            raise ValueError(f"Browser '{browser_name}' tidak didukung. Gunakan: chrome, firefox, atau edge")
+        if Config.LAUNCH_PROFILE not in DriverFactory.LAUNCH_PROFILES:
+            raise ValueError(f"Launch profile '{Config.LAUNCH_PROFILE}' tidak dikenal. Gunakan: {', '.join(DriverFactory.LAUNCH_PROFILES)}")
+        
+        start = time.perf_counter()
+        with tracer.span("DriverFactory.get_driver", "driver", browser=browser_name, profile=Config.LAUNCH_PROFILE):
+            if browser_name == "chrome":
+                driver = DriverFactory._get_chrome_driver()
+            elif browser_name == "firefox":
+                driver = DriverFactory._get_firefox_driver()
+            elif browser_name == "edge":
+                driver = DriverFactory._get_edge_driver()
+            else:
+                raise ValueError(f"Browser '{browser_name}' tidak didukung. Gunakan: chrome, firefox, atau edge")
+        logging.getLogger(__name__).info(
+            "%s (%s profile) started in %.2fs", browser_name, Config.LAUNCH_PROFILE, time.perf_counter() - start
+        )
+        
+        if Config.INSTRUMENT_COMMANDS:
+            command_recorder.instrument(driver)
+        if Config.TRACE_ENABLED:
+            tracer.instrument(driver)
+        if Config.EVENT_STREAMS:
+            EventStreams.attach(driver)
+        return driver
     
     @staticmethod
     def _get_chrome_driver():
         """Create Chrome Driver"""
         options = webdriver.ChromeOptions()
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        if Config.EVENT_STREAMS:
+            options.enable_bidi = True
         
-        if Config.HEADLES:
-            options.add_argument("--headless")
-            
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
@@ -51,9 +162,16 @@ class DriverFactory:
         options.add_argument(f"--window-size={Config.WINDOW_WIDTH},{Config.WINDOW_HEIGHT}")
         
         options.add_experimental_option('excludeSwitches', ['enable-logging'])
+        DriverFactory._enable_network_log(options)
+        cache_slot = DriverFactory._apply_chromium_launch_profile(options, "chrome")
         
-        service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        try:
+            service = ChromeService(DriverFactory._resolve_driver_path("chrome", ChromeDriverManager))
+            driver = webdriver.Chrome(service=service, options=options)
+        except Exception:
+            DriverFactory._release_cache_slot("chrome", cache_slot)
+            raise
+        DriverFactory._hold_cache_slot(driver, "chrome", cache_slot)
         
         DriverFactory._configure_driver(driver)
         return driver
@@ -62,13 +180,38 @@ class DriverFactory:
     def _get_firefox_driver():
         """Create Firefox WebDriver"""
         options = webdriver.FirefoxOptions()
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        if Config.EVENT_STREAMS:
+            options.enable_bidi = True
         
-        if Config.HEADLESS:
-            options.add_argument("--headless")
+        if DriverFactory._is_headless():
+            options.add_argument("-headless")
+        
+        blocking_profile = Config.BLOCKING_PROFILE or "none"
+        for name, value in DriverFactory.FIREFOX_BLOCKING_PREFS.get(blocking_profile, {}).items():
+            options.set_preference(name, value)
+        unsupported = set(DriverFactory.BLOCKING_PROFILES.get(blocking_profile, [])) & set(_STYLE_PATTERNS + _ANALYTICS_PATTERNS)
+        if unsupported:
+            logging.getLogger(__name__).warning(
+                "Blocking profile '%s' di Firefox hanya memblokir gambar, media dan font; CSS dan analytics tetap di-load",
+                blocking_profile,
+            )
+        
+        cache_slot = None
+        for name, value in DriverFactory.FIREFOX_LAUNCH_PREFS[Config.LAUNCH_PROFILE].items():
+            options.set_preference(name, value)
+        if Config.LAUNCH_PROFILE == "fast":
+            cache_slot, cache_dir = DriverFactory._acquire_cache_dir("firefox")
+            options.set_preference("browser.cache.disk.parent_directory", cache_dir)
         
         # Create driver
-        service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
+        try:
+            service = FirefoxService(DriverFactory._resolve_driver_path("firefox", GeckoDriverManager))
+            driver = webdriver.Firefox(service=service, options=options)
+        except Exception:
+            DriverFactory._release_cache_slot("firefox", cache_slot)
+            raise
+        DriverFactory._hold_cache_slot(driver, "firefox", cache_slot)
         
         DriverFactory._configure_driver(driver)
         return driver
@@ -77,24 +220,359 @@ class DriverFactory:
     def _get_edge_driver():
         """Create Edge WebDriver"""
         options = webdriver.EdgeOptions()
-        
-        if Config.HEADLESS:
-            options.add_argument("--headless")
+        options.page_load_strategy = Config.PAGE_LOAD_STRATEGY
+        if Config.EVENT_STREAMS:
+            options.enable_bidi = True
         
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
+        DriverFactory._enable_network_log(options)
+        cache_slot = DriverFactory._apply_chromium_launch_profile(options, "edge")
         
         # Create driver
-        service = EdgeService(EdgeChromiumDriverManager().install())
-        driver = webdriver.Edge(service=service, options=options)
+        try:
+            service = EdgeService(DriverFactory._resolve_driver_path("edge", EdgeChromiumDriverManager))
+            driver = webdriver.Edge(service=service, options=options)
+        except Exception:
+            DriverFactory._release_cache_slot("edge", cache_slot)
+            raise
+        DriverFactory._hold_cache_slot(driver, "edge", cache_slot)
         
         DriverFactory._configure_driver(driver)
         return driver
     
+    @staticmethod
+    def _is_headless():
+        return Config.HEADLESS or Config.LAUNCH_PROFILE == "fast"
+    
+    @staticmethod
+    def _apply_chromium_launch_profile(options, browser_name):
+        """
+        Tambahkan headless dan flag launch profile ke Chrome/Edge options
+        
+        Returns:
+            int: Slot disk cache yang dipakai, None jika profile tanpa disk cache
+        """
+        if DriverFactory._is_headless():
+            options.add_argument("--headless=new")
+        for argument in DriverFactory.CHROMIUM_LAUNCH_ARGS[Config.LAUNCH_PROFILE]:
+            options.add_argument(argument)
+        if Config.LAUNCH_PROFILE != "fast":
+            return None
+        cache_slot, cache_dir = DriverFactory._acquire_cache_dir(browser_name)
+        options.add_argument(f"--disk-cache-dir={cache_dir}")
+        return cache_slot
+    
+    @staticmethod
+    def _acquire_cache_dir(browser_name):
+        """
+        Pilih folder disk cache yang tidak sedang dipakai browser lain
+        
+        Browser yang hidup bersamaan (pool, parallel worker) tidak boleh berbagi
+        disk cache, jadi setiap browser mendapat slot sendiri yang dipakai ulang
+        oleh browser berikutnya setelah browser tersebut ditutup.
+        
+        Returns:
+            tuple: (slot, absolute path folder cache)
+        """
+        with DriverFactory._cache_slots_lock:
+            used = DriverFactory._cache_slots.setdefault(browser_name, set())
+            slot = next(index for index in range(len(used) + 1) if index not in used)
+            used.add(slot)
+        cache_dir = os.path.abspath(os.path.join(Config.BROWSER_CACHE_DIR, browser_name, f"{get_worker_id() or 'main'}-{slot}"))
+        os.makedirs(cache_dir, exist_ok=True)
+        return slot, cache_dir
+    
+    @staticmethod
+    def _release_cache_slot(browser_name, slot):
+        if slot is None:
+            return
+        with DriverFactory._cache_slots_lock:
+            DriverFactory._cache_slots[browser_name].discard(slot)
+    
+    @staticmethod
+    def _hold_cache_slot(driver, browser_name, slot):
+        """Lepas slot disk cache (sekali) saat driver di-quit atau di-garbage collect"""
+        if slot is None:
+            return
+        release = weakref.finalize(driver, DriverFactory._release_cache_slot, browser_name, slot)
+        original_quit = driver.quit
+        
+        def quit_and_release():
+            try:
+                original_quit()
+            finally:
+                release()
+        
+        driver.quit = quit_and_release
+    
+    @staticmethod
+    def _resolve_driver_path(browser_name, manager_cls):
+        """
+        Resolve path driver binary melalui DriverBinaryCache
+        
+        Args:
+            browser_name (str): Name browser (chrome, firefox, edge)
+            manager_cls: Class webdriver_manager untuk browser tersebut
+            
+        Returns:
+            str: Path ke driver binary
+        """
+        return DriverBinaryCache().resolve(browser_name, lambda: manager_cls().install())
+    
+    @staticmethod
+    def set_blocking_profile(driver, profile):
+        """
+        Aktifkan resource blocking profile pada driver
+        
+        Chromium memakai CDP Network.setBlockedURLs dan bisa diganti per test.
+        Firefox hanya mendukung profile yang dipilih saat launch (Config.BLOCKING_PROFILE).
+        
+        Args:
+            driver: WebDriver instance
+            profile (str): Nama profile di BLOCKING_PROFILES, None untuk tanpa blocking
+        """
+        profile = profile or "none"
+        if profile not in DriverFactory.BLOCKING_PROFILES:
+            raise ValueError(f"Blocking profile '{profile}' tidak dikenal. Gunakan: {', '.join(DriverFactory.BLOCKING_PROFILES)}")
+        
+        if isinstance(driver, ChromiumDriver):
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": DriverFactory.BLOCKING_PROFILES[profile]})
+        elif profile != (Config.BLOCKING_PROFILE or "none"):
+            logging.getLogger(__name__).warning(
+                "Blocking profile '%s' per test tidak didukung di %s, tetap memakai '%s'",
+                profile, driver.name, Config.BLOCKING_PROFILE or "none",
+            )
+            return
+        logging.getLogger(__name__).debug("Blocking profile aktif: %s", profile)
+    
+    @staticmethod
+    def _enable_network_log(options):
+        """Aktifkan performance log (CDP Network events) untuk statistik resource blocking"""
+        if Config.BLOCKING_PROFILE or Config.BLOCKING_STATS:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+            options.set_capability("ms:loggingPrefs", {"performance": "ALL"})
+    
     @staticmethod
     def _configure_driver(driver):
-        driver.implicitly_wait(Config.IMPLICIT_WAIT)
         driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
+        # Observer wait (execute_async_script) bisa menunggu selama timeout terpanjang
+        driver.set_script_timeout(Config.PAGE_LOAD_TIMEOUT + 5)
         driver.maximize_window()
-    
-    
\ No newline at end of file
+        if Config.BLOCKING_PROFILE and isinstance(driver, ChromiumDriver):
+            DriverFactory.set_blocking_profile(driver, Config.BLOCKING_PROFILE)
+
+
+class DriverPool:
+    """
+    Pool of pre-warmed WebDriver sessions
+
+    Browser dijalankan sekali lalu dipakai ulang oleh beberapa test class.
+    Setiap session di-reset saat dikembalikan (cookies, storage, windows,
+    about:blank, lihat _reset) dan di-evict jika crash atau sudah mencapai max reuse.
+    """
+
+    def __init__(self, browser_name=None, size=None, max_reuse=None):
+        """
+        Initialize DriverPool
+
+        Args:
+            browser_name (str): Name browser (chrome, firefox, edge)
+            size (int): Jumlah maksimal session yang hidup bersamaan
+            max_reuse (int): Berapa kali satu session boleh dipakai sebelum di-evict
+        """
+        self.browser_name = (browser_name or Config.BROWSER).lower()
+        self.size = size or Config.DRIVER_POOL_SIZE
+        self.max_reuse = max_reuse or Config.DRIVER_POOL_MAX_REUSE
+        self.logger = logging.getLogger(__name__)
+
+        self._idle = queue.LifoQueue()
+        self._usage = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def warm_up(self, count=None):
+        """
+        Launch browser sebelum dibutuhkan
+
+        Args:
+            count (int): Jumlah session yang di-launch (default: size pool)
+        """
+        count = self.size if count is None else min(count, self.size)
+        while len(self._usage) < count:
+            driver = self._launch()
+            if driver is None:
+                break
+            self._idle.put(driver)
+        self.logger.info("Driver pool warmed up: %s %s session(s)", len(self._usage), self.browser_name)
+
+    def checkout(self, timeout=None):
+        """
+        Ambil driver dari pool
+
+        Args:
+            timeout (int): Berapa lama menunggu jika semua session sedang dipakai
+
+        Returns:
+            WebDriver: Driver yang siap dipakai (halaman about:blank)
+        """
+        if self._closed:
+            raise RuntimeError("Driver pool sudah ditutup")
+
+        wait_time = timeout if timeout else Config.DRIVER_POOL_CHECKOUT_TIMEOUT
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._launch()
+                if driver is None:
+                    try:
+                        driver = self._idle.get(timeout=wait_time)
+                    except queue.Empty:
+                        raise TimeoutError(f"Tidak ada driver tersedia setelah {wait_time}s (pool size {self.size})")
+
+            if self._is_alive(driver):
+                with self._lock:
+                    self._usage[id(driver)] += 1
+                    uses = self._usage[id(driver)]
+                self.logger.debug("Checked out driver %s (use #%s)", id(driver), uses)
+                return driver
+
+            self.logger.warning("Driver %s crashed, evicting", id(driver))
+            self._evict(driver)
+
+    def checkin(self, driver):
+        """
+        Kembalikan driver ke pool
+
+        Args:
+            driver: WebDriver yang sebelumnya di-checkout
+        """
+        if id(driver) not in self._usage:
+            self.logger.warning("Driver %s bukan milik pool ini, quit", id(driver))
+            self._quit(driver)
+            return
+
+        if self._closed:
+            self._evict(driver)
+        elif self._usage[id(driver)] >= self.max_reuse:
+            self.logger.info("Driver %s reached max reuse (%s), evicting", id(driver), self.max_reuse)
+            self._evict(driver)
+        elif not self._reset(driver):
+            self.logger.warning("Driver %s gagal di-reset, evicting", id(driver))
+            self._evict(driver)
+        else:
+            self._idle.put(driver)
+            self.logger.debug("Checked in driver %s", id(driver))
+
+    def close(self):
+        """Quit semua session di pool"""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._evict(driver)
+        self.logger.info("Driver pool closed")
+
+    # ========== Internal ==========
+
+    def _launch(self):
+        """Launch session baru jika pool belum penuh, return None jika penuh"""
+        with self._lock:
+            if len(self._usage) >= self.size:
+                return None
+            # Reserve slot sebelum launch agar thread lain tidak melebihi size
+            placeholder = object()
+            self._usage[id(placeholder)] = 0
+
+        try:
+            driver = DriverFactory.get_driver(self.browser_name)
+        except Exception:
+            with self._lock:
+                del self._usage[id(placeholder)]
+            raise
+
+        with self._lock:
+            del self._usage[id(placeholder)]
+            self._usage[id(driver)] = 0
+        self.logger.debug("Launched pooled driver %s", id(driver))
+        return driver
+
+    def _evict(self, driver):
+        with self._lock:
+            self._usage.pop(id(driver), None)
+        self._quit(driver)
+
+    def _quit(self, driver):
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.debug("Error saat quit driver: %s", e)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def _reset(self, driver):
+        """
+        Reset state browser: windows, storage, cookies, about:blank
+
+        Tab utama dipertahankan (blocking profile CDP berlaku per tab), tab lain
+        ditutup. Chrome/Edge: localStorage, IndexedDB, cache storage dan service
+        worker dihapus lewat CDP untuk setiap origin di history semua tab, cookies
+        untuk semua domain. Browser lain: localStorage dan cookies hanya dihapus
+        untuk origin yang sedang dibuka di setiap tab. sessionStorage hanya
+        dihapus untuk origin yang sedang dibuka di tab utama. Buffer event streams
+        dikosongkan agar test berikutnya tidak melihat event test sebelumnya.
+
+        Returns:
+            bool: True jika reset berhasil
+        """
+        cdp = self.browser_name in ("chrome", "edge")
+        try:
+            handles = driver.window_handles
+            main_handle = handles[0]
+            origins = set()
+            for handle in handles[1:] + [main_handle]:
+                driver.switch_to.window(handle)
+                if cdp:
+                    origins.update(self._visited_origins(driver))
+                else:
+                    driver.delete_all_cookies()
+                driver.execute_script(_CLEAR_STORAGE_JS)
+                if handle != main_handle:
+                    driver.close()
+
+            if cdp:
+                for origin in sorted(origins):
+                    driver.execute_cdp_cmd(
+                        "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": _CLEARED_STORAGE_TYPES}
+                    )
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+
+            driver.get("about:blank")
+            streams = EventStreams.for_driver(driver)
+            if streams:
+                streams.clear()
+            return True
+        except WebDriverException as e:
+            self.logger.debug("Reset driver gagal: %s", e)
+            return False
+
+    @staticmethod
+    def _visited_origins(driver):
+        """Origin http(s) di history tab saat ini (CDP Page.getNavigationHistory)"""
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})
+        origins = set()
+        for entry in history.get("entries", []):
+            parts = urlsplit(entry.get("url", ""))
+            if parts.scheme in ("http", "https"):
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
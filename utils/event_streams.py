@@ -0,0 +1,223 @@
+"""
+Event stream dari browser lewat WebDriver BiDi, disimpan di ring buffer per driver
+
+Channel:
+    console     log.entryAdded (console.* dan JavaScript error)
+    network     request, response dan fetch error
+    navigation  navigation started, DOMContentLoaded, load, fragment navigation
+
+Setiap event berupa dict dengan key "seq" (urutan datang), "type" dan detail
+event. Test dan page object bisa menunggu event (mis. typeahead XHR selesai)
+dengan wait_for() tanpa polling DOM lewat WebDriver.
+
+Butuh capability webSocketUrl (options.enable_bidi), di-set DriverFactory saat
+Config.EVENT_STREAMS aktif.
+"""
+
+import itertools
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.bidi.common import command_builder
+from utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+_streams = weakref.WeakKeyDictionary()
+
+
+def _console_event(params):
+    return {
+        "type": params.get("type"),
+        "level": params.get("level"),
+        "text": params.get("text"),
+        "url": (params.get("source") or {}).get("url") or _stack_url(params),
+    }
+
+
+def _stack_url(params):
+    frames = (params.get("stackTrace") or {}).get("callFrames") or []
+    return frames[0].get("url") if frames else None
+
+
+def _network_event(kind):
+    def parse(params):
+        request = params.get("request") or {}
+        response = params.get("response") or {}
+        return {
+            "type": kind,
+            "request_id": request.get("request"),
+            "url": response.get("url") or request.get("url"),
+            "method": request.get("method"),
+            "status": response.get("status"),
+            "mime_type": response.get("mimeType"),
+            "initiator": (params.get("initiator") or {}).get("type"),
+            "error": params.get("errorText"),
+        }
+
+    return parse
+
+
+def _navigation_event(kind):
+    def parse(params):
+        return {"type": kind, "url": params.get("url"), "context": params.get("context")}
+
+    return parse
+
+
+# BiDi event -> (channel, parser)
+_EVENTS = {
+    "log.entryAdded": ("console", _console_event),
+    "network.beforeRequestSent": ("network", _network_event("request")),
+    "network.responseCompleted": ("network", _network_event("response")),
+    "network.fetchError": ("network", _network_event("error")),
+    "browsingContext.navigationStarted": ("navigation", _navigation_event("started")),
+    "browsingContext.domContentLoaded": ("navigation", _navigation_event("dom_content_loaded")),
+    "browsingContext.load": ("navigation", _navigation_event("load")),
+    "browsingContext.fragmentNavigated": ("navigation", _navigation_event("fragment")),
+}
+
+
+class _BiDiEvent:
+    """Adapter untuk WebSocketConnection.add_callback (butuh event_class dan from_json)"""
+
+    def __init__(self, name):
+        self.event_class = name
+
+    def from_json(self, params):
+        return self.event_class, params
+
+
+class EventStreams:
+    """Ring buffer console, network dan navigation events untuk satu driver"""
+
+    CHANNELS = ("console", "network", "navigation")
+
+    def __init__(self, maxlen=None):
+        """
+        Initialize EventStreams
+
+        Args:
+            maxlen (int): Jumlah event maksimal per channel (default: Config.EVENT_BUFFER_SIZE)
+        """
+        maxlen = maxlen or Config.EVENT_BUFFER_SIZE
+        self.buffers = {channel: deque(maxlen=maxlen) for channel in self.CHANNELS}
+        self._seq = itertools.count(1)
+        self._last_seq = 0
+        self._condition = threading.Condition()
+
+    @staticmethod
+    def attach(driver):
+        """
+        Subscribe ke BiDi events driver dan simpan streams-nya
+
+        Args:
+            driver: WebDriver yang dibuat dengan enable_bidi
+
+        Returns:
+            EventStreams: Streams driver, atau None jika browser tidak mendukung BiDi
+        """
+        streams = EventStreams()
+        try:
+            if not driver._websocket_connection:
+                driver._start_bidi()
+            connection = driver._websocket_connection
+            for name in _EVENTS:
+                connection.add_callback(_BiDiEvent(name), streams._on_event)
+            connection.execute(command_builder("session.subscribe", {"events": list(_EVENTS)}))
+        except (WebDriverException, AttributeError) as e:
+            logger.warning("BiDi event streams tidak tersedia: %s", e)
+            return None
+        _streams[driver] = streams
+        logger.debug("Subscribed to %s BiDi events", len(_EVENTS))
+        return streams
+
+    @staticmethod
+    def for_driver(driver):
+        """Return EventStreams yang sudah di-attach ke driver, atau None"""
+        return _streams.get(driver)
+
+    def _on_event(self, item):
+        name, params = item
+        channel, parse = _EVENTS[name]
+        event = parse(params)
+        event["timestamp"] = params.get("timestamp")
+        with self._condition:
+            event["seq"] = self._last_seq = next(self._seq)
+            self.buffers[channel].append(event)
+            self._condition.notify_all()
+
+    def mark(self):
+        """
+        Return seq event terakhir, dipakai sebagai titik awal wait_for
+
+        Returns:
+            int: Seq terakhir
+        """
+        with self._condition:
+            return self._last_seq
+
+    def events(self, channel, predicate=None, after=0):
+        """
+        Return event di buffer channel
+
+        Args:
+            channel (str): console, network, atau navigation
+            predicate (callable): Filter event (dict -> bool)
+            after (int): Hanya event dengan seq lebih besar
+
+        Returns:
+            list: Event yang cocok, urut dari yang paling lama
+        """
+        with self._condition:
+            return [
+                event for event in self.buffers[channel]
+                if event["seq"] > after and (predicate is None or predicate(event))
+            ]
+
+    def wait_for(self, channel, predicate, timeout=None, after=None, description=None):
+        """
+        Wait hingga event yang cocok masuk ke channel
+
+        Args:
+            channel (str): console, network, atau navigation
+            predicate (callable): Condition event (dict -> bool)
+            timeout (float): Custom timeout (default: Config.EXPLICIT_WAIT)
+            after (int): Seq dari mark(), event sebelumnya diabaikan (default: event yang sudah ada ikut dicek)
+            description (str): Keterangan untuk error message
+
+        Returns:
+            dict: Event pertama yang cocok
+
+        Raises:
+            TimeoutException: Jika tidak ada event yang cocok sebelum timeout
+        """
+        wait_time = Config.EXPLICIT_WAIT if timeout is None else timeout
+        deadline = time.monotonic() + wait_time
+        after = after or 0
+        with self._condition:
+            while True:
+                for event in self.buffers[channel]:
+                    if event["seq"] > after and predicate(event):
+                        return event
+                # Semua event sampai seq terakhir sudah dicek
+                after = self._last_seq
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(f"Timed out after {wait_time}s waiting for {description or channel} event")
+                self._condition.wait(remaining)
+
+    def console_errors(self, after=0):
+        """Return console error dan JavaScript exception"""
+        return self.events("console", lambda event: event["level"] == "error", after)
+
+    def clear(self):
+        """Kosongkan semua buffer"""
+        with self._condition:
+            for buffer in self.buffers.values():
+                buffer.clear()
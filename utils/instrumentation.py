@@ -0,0 +1,173 @@
+"""
+Instrumentation untuk WebDriver remote commands
+
+CommandRecorder membungkus driver.execute sehingga setiap command
+(findElement, getElementText, executeScript, get, ...) dihitung dan diukur
+waktunya. Setiap command diatribusikan ke method page object terluar yang
+memanggilnya (mis. HomePage.verify_homepage_loaded) dan ke test yang sedang
+berjalan.
+"""
+
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+
+logger = logging.getLogger(__name__)
+
+
+def _new_stats():
+    return {"count": 0, "time": 0.0}
+
+
+class CommandRecorder:
+    """Count dan timing setiap WebDriver command per caller dan per test"""
+
+    def __init__(self):
+        self.current_test = None
+        self.total_commands = 0
+        self.callers = defaultdict(lambda: defaultdict(_new_stats))
+        self.tests = defaultdict(_new_stats)
+        self._lock = threading.Lock()
+
+    def instrument(self, driver):
+        """
+        Bungkus driver.execute agar setiap command tercatat
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            WebDriver: Driver yang sama (sudah di-instrument)
+        """
+        if getattr(driver, "_command_recorder", None) is self:
+            return driver
+
+        original_execute = driver.execute
+
+        def recorded_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return original_execute(driver_command, params)
+            finally:
+                self.record(driver_command, time.perf_counter() - start, self._find_caller())
+
+        driver.execute = recorded_execute
+        driver._command_recorder = self
+        return driver
+
+    def record(self, command, elapsed, caller):
+        """
+        Catat satu command
+
+        Args:
+            command (str): Nama WebDriver command
+            elapsed (float): Durasi dalam detik
+            caller (str): Method page object, mis. HomePage.open
+        """
+        test = self.current_test or "<no test>"
+        with self._lock:
+            self.total_commands += 1
+            for stats in (self.callers[caller][command], self.tests[test]):
+                stats["count"] += 1
+                stats["time"] += elapsed
+
+    @staticmethod
+    def _find_caller():
+        """Method page object terluar di call stack, atau nama function test/helper"""
+        from pages.base_page import BasePage
+
+        caller = None
+        frame = sys._getframe(2)
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if isinstance(owner, BasePage):
+                caller = f"{type(owner).__name__}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return caller or "<direct driver call>"
+
+    def caller_rows(self):
+        """
+        Return statistik per caller, diurutkan dari total waktu terbesar
+
+        Returns:
+            list: List of (caller, count, time, {command: stats})
+        """
+        rows = []
+        for caller, commands in self.callers.items():
+            count = sum(stats["count"] for stats in commands.values())
+            total = sum(stats["time"] for stats in commands.values())
+            rows.append((caller, count, total, dict(commands)))
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def format_report(self, limit=15):
+        """
+        Format report teks untuk terminal summary
+
+        Args:
+            limit (int): Jumlah baris per bagian
+
+        Returns:
+            list: Baris report
+        """
+        lines = [f"{'caller':<48}{'commands':>10}{'time s':>10}  top commands"]
+        for caller, count, total, commands in self.caller_rows()[:limit]:
+            top = sorted(commands.items(), key=lambda item: item[1]["count"], reverse=True)[:3]
+            summary = ", ".join(f"{name}x{stats['count']}" for name, stats in top)
+            lines.append(f"{caller:<48}{count:>10}{total:>10.2f}  {summary}")
+
+        lines.append("")
+        lines.append(f"{'test':<70}{'commands':>10}{'time s':>10}")
+        tests = sorted(self.tests.items(), key=lambda item: item[1]["time"], reverse=True)
+        for test, stats in tests[:limit]:
+            lines.append(f"{test[-70:]:<70}{stats['count']:>10}{stats['time']:>10.2f}")
+        return lines
+
+    def merge(self, path):
+        """
+        Tambahkan count dan timing dari file hasil save(), mis. report parallel worker
+
+        Args:
+            path (str): Path file JSON
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        merged = [
+            (self.callers[caller][command], stats)
+            for caller, entry in data["callers"].items()
+            for command, stats in entry["commands"].items()
+        ]
+        merged += [(self.tests[test], stats) for test, stats in data["tests"].items()]
+        with self._lock:
+            self.total_commands += data["total_commands"]
+            for target, stats in merged:
+                target["count"] += stats["count"]
+                target["time"] += stats["time"]
+
+    def save(self, path):
+        """
+        Simpan report sebagai JSON artifact
+
+        Args:
+            path (str): Path file output
+        """
+        data = {
+            "total_commands": self.total_commands,
+            "callers": {
+                caller: {"count": count, "time": total, "commands": commands}
+                for caller, count, total, commands in self.caller_rows()
+            },
+            "tests": dict(self.tests),
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        logger.info("WebDriver command report saved: %s", path)
+
+
+# Recorder yang dipakai DriverFactory saat Config.INSTRUMENT_COMMANDS aktif
+command_recorder = CommandRecorder()
@@ -0,0 +1,244 @@
+"""
+Local HTTP stand-in untuk Wikipedia dengan recorded fixtures
+
+Setiap host Wikipedia di-mount di bawah /_h/<host>/ pada server lokal, jadi
+https://en.wikipedia.org/wiki/Python dilayani sebagai
+http://127.0.0.1:<port>/_h/en.wikipedia.org/wiki/Python. Link absolut di body
+(HTML, JSON, JS, CSS) dan header Location di-rewrite ke server lokal saat
+dilayani. Link root-relative (/wiki/...) diarahkan ke host yang benar
+berdasarkan header Referer.
+
+Mode replay hanya melayani response yang sudah direkam (request lain 404).
+Mode record mengambil response dari Wikipedia sekali dan menyimpannya ke
+Config.LOCAL_RECORDINGS_PATH.
+
+Recordings yang di-commit adalah set minimal (portal, Special:Search dengan
+dan tanpa hasil, artikel Config.POPULAR_ARTICLES dengan TOC, typeahead JSON)
+untuk check struktural offline. Halaman lain bisa direkam dengan --target=local --record.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from utils.config import Config
+
+DEFAULT_HOST = "www.wikipedia.org"
+
+_HOST_PATTERN = r"[a-z0-9-]+(?:\.[a-z0-9-]+)*\.(?:wikipedia|wikimedia|wikidata|mediawiki)\.org"
+_ABSOLUTE_URL_RE = re.compile(r"(?:https?:)?(//|\\/\\/)(" + _HOST_PATTERN + r")")
+_MOUNTED_PATH_RE = re.compile(r"^/_h/(" + _HOST_PATTERN + r")(/.*)?$")
+_TEXT_TYPES = ("text/", "application/json", "application/javascript", "application/x-javascript")
+
+# Header yang disimpan saat recording
+_RECORDED_HEADERS = ("content-type", "location")
+
+
+logger = logging.getLogger(__name__)
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Simpan redirect apa adanya, browser yang akan mengikutinya"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class RecordingStore:
+    """Penyimpanan response yang direkam, satu file meta + satu file body per request"""
+
+    def __init__(self, path=None):
+        self.path = path or Config.LOCAL_RECORDINGS_PATH
+
+    def _files(self, host, path):
+        key = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+        base = os.path.join(self.path, host, key)
+        return f"{base}.json", f"{base}.body"
+
+    def load(self, host, path):
+        """
+        Return (status, headers, body) untuk request yang direkam, atau None
+        """
+        meta_file, body_file = self._files(host, path)
+        try:
+            with open(meta_file, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_file, "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+        return meta["status"], meta["headers"], body
+
+    def save(self, host, path, status, headers, body):
+        meta_file, body_file = self._files(host, path)
+        os.makedirs(os.path.dirname(meta_file), exist_ok=True)
+        meta = {"url": f"https://{host}{path}", "status": status, "headers": headers}
+        for target, data, mode in ((body_file, body, "wb"), (meta_file, json.dumps(meta, indent=2), "w")):
+            tmp_file = f"{target}.tmp"
+            with open(tmp_file, mode) as f:
+                f.write(data)
+            os.replace(tmp_file, target)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    server_version = "WikipediaStandIn/1.0"
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _serve(self, send_body):
+        match = _MOUNTED_PATH_RE.match(urlsplit(self.path).path)
+        if not match:
+            self._redirect_root_relative()
+            return
+
+        host = match.group(1)
+        path = self.path[len(f"/_h/{host}"):] or "/"
+        response = self.server.stand_in.fetch(host, path)
+        if response is None:
+            self._send(404, {"content-type": "text/plain"}, f"Not recorded: https://{host}{path}".encode(), send_body)
+            return
+
+        status, headers, body = response
+        headers = dict(headers)
+        content_type = headers.get("content-type", "")
+        if content_type.startswith(_TEXT_TYPES):
+            body = self.server.stand_in.rewrite(body.decode("utf-8", "replace")).encode("utf-8")
+        if "location" in headers:
+            headers["location"] = self.server.stand_in.rewrite_location(host, headers["location"])
+        self._send(status, headers, body, send_body)
+
+    def _redirect_root_relative(self):
+        """Link /wiki/... dari halaman yang dilayani: arahkan ke host halaman tersebut"""
+        referer = urlsplit(self.headers.get("Referer", "")).path
+        match = _MOUNTED_PATH_RE.match(referer)
+        host = match.group(1) if match else DEFAULT_HOST
+        self._send(302, {"location": f"/_h/{host}{self.path}"}, b"", True)
+
+    def _send(self, status, headers, body, send_body):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+
+class WikipediaStandIn:
+    """Local HTTP server yang me-replay (atau merekam) halaman Wikipedia"""
+
+    def __init__(self, recordings_path=None, record=False, port=0):
+        """
+        Initialize WikipediaStandIn
+
+        Args:
+            recordings_path (str): Folder recorded fixtures
+            record (bool): Jika True, request yang belum direkam diambil dari Wikipedia
+            port (int): Port lokal, 0 untuk port bebas
+        """
+        self.store = RecordingStore(recordings_path)
+        self.record = record
+        self.port = port
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def url_for(self, host, path="/"):
+        """
+        Return URL lokal untuk halaman Wikipedia
+
+        Args:
+            host (str): Host Wikipedia, mis. en.wikipedia.org
+            path (str): Path di host tersebut
+
+        Returns:
+            str: URL di stand-in server
+        """
+        return f"{self.base_url}/_h/{host}{path}"
+
+    def start(self):
+        """Start server di background thread"""
+        self._server = ThreadingHTTPServer(("127.0.0.1", self.port), _StandInHandler)
+        self._server.daemon_threads = True
+        self._server.stand_in = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        mode = "record" if self.record else "replay"
+        logger.info("Wikipedia stand-in (%s) listening on %s", mode, self.base_url)
+        return self
+
+    def stop(self):
+        """Stop server"""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            logger.info("Wikipedia stand-in stopped")
+
+    def is_recorded(self, host, path):
+        """
+        Return True jika request bisa dilayani: sudah direkam, atau record mode
+        """
+        return self.record or self.store.load(host, path) is not None
+
+    def fetch(self, host, path):
+        """
+        Return (status, headers, body) dari recording, rekam dulu jika record mode
+        """
+        response = self.store.load(host, path)
+        if response is None and self.record:
+            response = self._record(host, path)
+        return response
+
+    def rewrite(self, text):
+        """Rewrite URL absolut Wikipedia di body ke server lokal"""
+        def replace(match):
+            slashes = match.group(1)
+            prefix = self.base_url.replace("/", "\\/") if slashes != "//" else self.base_url
+            separator = "\\/" if slashes != "//" else "/"
+            return f"{prefix}{separator}_h{separator}{match.group(2)}"
+
+        return _ABSOLUTE_URL_RE.sub(replace, text)
+
+    def rewrite_location(self, host, location):
+        """Rewrite header Location (absolut atau root-relative) ke server lokal"""
+        if location.startswith("/") and not location.startswith("//"):
+            return f"/_h/{host}{location}"
+        return self.rewrite(location)
+
+    def _record(self, host, path):
+        request = urllib.request.Request(
+            f"https://{host}{path}",
+            headers={"User-Agent": "learn-selenium-recorder/1.0 (test fixtures)"},
+        )
+        opener = urllib.request.build_opener(_NoRedirect)
+        try:
+            with opener.open(request, timeout=Config.PAGE_LOAD_TIMEOUT) as upstream:
+                status, raw_headers, body = upstream.status, upstream.headers, upstream.read()
+        except urllib.error.HTTPError as e:
+            status, raw_headers, body = e.code, e.headers, e.read()
+        except urllib.error.URLError as e:
+            logger.error("Recording gagal https://%s%s: %s", host, path, e)
+            return None
+
+        headers = {name: raw_headers[name] for name in _RECORDED_HEADERS if raw_headers.get(name)}
+        self.store.save(host, path, status, headers, body)
+        logger.info("Recorded %s https://%s%s", status, host, path)
+        return status, headers, body
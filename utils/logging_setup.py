@@ -0,0 +1,227 @@
+"""
+Logging lewat queue, formatting dan I/O di background thread
+
+Handler di root logger hanya memasukkan LogRecord ke queue. Message belum
+di-format (argument %-style dibiarkan apa adanya selama nilainya immutable),
+jadi thread test tidak membangun string maupun menulis file. QueueListener
+menulis ke log file, console, dan (opsional) JSON lines.
+
+Di parallel worker setiap worker menulis ke file sendiri
+(mis. logs/test_execution.gw0.log). Di akhir session proses utama
+menggabungkan semua file worker ke log utama, urut berdasarkan waktu.
+"""
+
+import copy
+import heapq
+import json
+import logging
+import os
+import queue
+import re
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from utils.config import Config
+from utils.parallel import get_worker_id, worker_files
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+WORKER_LOG_FORMAT = "%(asctime)s - %(worker)s - %(name)s - %(levelname)s - %(message)s"
+
+# Argument yang aman di-format belakangan di listener thread
+_IMMUTABLE_ARGS = (str, int, float, bool, type(None), tuple, frozenset, bytes)
+
+_TIMESTAMP = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2},\d{3}")
+
+_listener = None
+_queue_handler = None
+# Ukuran log utama saat session dimulai, bagian setelahnya yang di-merge
+_session_offsets = {}
+
+
+class LazyQueueHandler(QueueHandler):
+    """QueueHandler yang tidak memformat message di thread pemanggil"""
+
+    def prepare(self, record):
+        if record.args and not _is_immutable(record.args):
+            # Argument bisa berubah sebelum listener sempat memformat
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _is_immutable(args):
+    if not isinstance(args, tuple):
+        return False
+    return all(isinstance(arg, _IMMUTABLE_ARGS) and (not isinstance(arg, tuple) or _is_immutable(arg)) for arg in args)
+
+
+class WorkerFilter(logging.Filter):
+    """Tambahkan worker id ke setiap record"""
+
+    def __init__(self, worker_id):
+        super().__init__()
+        self.worker_id = worker_id
+
+    def filter(self, record):
+        record.worker = self.worker_id
+        return True
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Satu JSON object per record"""
+
+    def format(self, record):
+        data = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "created": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker", None),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+def worker_log_path(path, worker_id=None):
+    """
+    Return path log file untuk worker, path asli di proses utama
+
+    Args:
+        path (str): Path log utama, mis. Config.LOG_FILE
+        worker_id (str): Worker id (default: worker process ini)
+
+    Returns:
+        str: mis. logs/test_execution.gw0.log
+    """
+    worker_id = worker_id or get_worker_id()
+    if not worker_id:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{worker_id}{ext}"
+
+
+def setup_logging(level=None, json_lines=None):
+    """
+    Pasang QueueHandler di root logger dan jalankan QueueListener
+
+    Args:
+        level (str): Log level (default: Config.LOG_LEVEL)
+        json_lines (bool): Tulis juga Config.LOG_JSON_FILE (default: Config.LOG_JSON)
+
+    Returns:
+        QueueListener: Listener yang sedang berjalan
+    """
+    global _listener, _queue_handler
+    stop_logging()
+
+    worker_id = get_worker_id()
+    json_lines = Config.LOG_JSON if json_lines is None else json_lines
+    formatter = logging.Formatter(WORKER_LOG_FORMAT if worker_id else LOG_FORMAT)
+    # Worker file selalu baru, proses utama append seperti sebelumnya
+    mode = "w" if worker_id else "a"
+
+    paths = [Config.LOG_FILE] + ([Config.LOG_JSON_FILE] if json_lines else [])
+    for path in paths:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        if not worker_id:
+            _session_offsets[path] = os.path.getsize(path) if os.path.exists(path) else 0
+
+    file_handler = logging.FileHandler(worker_log_path(Config.LOG_FILE), mode=mode, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    handlers = [file_handler, stream_handler]
+    if json_lines:
+        json_handler = logging.FileHandler(worker_log_path(Config.LOG_JSON_FILE), mode=mode, encoding="utf-8")
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    _queue_handler = LazyQueueHandler(queue.SimpleQueue())
+    if worker_id:
+        _queue_handler.addFilter(WorkerFilter(worker_id))
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, (level or Config.LOG_LEVEL).upper()))
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(_queue_handler.queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging():
+    """Tulis semua record yang masih di queue, lalu lepas handler dan tutup file"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+    _queue_handler = None
+
+
+def merge_worker_logs():
+    """
+    Gabungkan log file semua worker ke log utama, urut berdasarkan waktu
+
+    Dipanggil di proses utama setelah stop_logging(). File worker dihapus
+    setelah digabung.
+
+    Returns:
+        int: Jumlah file worker yang digabung
+    """
+    merged = 0
+    for path, key in ((Config.LOG_FILE, _text_key), (Config.LOG_JSON_FILE, _json_key)):
+        files = worker_files(path)
+        if not files:
+            continue
+
+        offset = _session_offsets.get(path, 0)
+        streams = [_read_records(worker_file, 0, key) for worker_file in files]
+        if os.path.exists(path):
+            streams.append(_read_records(path, offset, key))
+
+        with open(path, "a+b") as f:
+            f.truncate(offset)
+            for _, record in heapq.merge(*streams, key=lambda item: item[0]):
+                f.write(record)
+
+        for worker_file in files:
+            os.remove(worker_file)
+        merged += len(files)
+    return merged
+
+
+def _read_records(path, offset, key):
+    """Return list (sort key, bytes) per record, baris lanjutan (traceback) ikut record sebelumnya"""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        lines = f.read().splitlines(keepends=True)
+
+    records = []
+    for line in lines:
+        sort_key = key(line)
+        if sort_key is None and records:
+            records[-1][1] += line
+        else:
+            records.append([sort_key or "", line])
+    return [(sort_key, bytes(record)) for sort_key, record in records]
+
+
+def _text_key(line):
+    match = _TIMESTAMP.match(line.decode("utf-8", "replace"))
+    return match.group(0) if match else None
+
+
+def _json_key(line):
+    try:
+        created = json.loads(line)["created"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    return datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S,%f")
@@ -0,0 +1,177 @@
+"""
+Statistik request dan bytes yang dihemat oleh resource blocking profile
+
+Dibaca dari Chromium performance log (CDP Network events). Bytes untuk request
+yang diblokir diambil dari ukuran URL yang sama saat pernah ter-load tanpa
+blocking di session ini. Jika belum pernah ter-load (kasus umum dengan
+--blocking-profile global), ukurannya diambil dari Content-Length HEAD request
+di luar browser, sekali per URL. URL tanpa Content-Length dihitung tanpa bytes.
+"""
+
+import json
+import logging
+import os
+import urllib3
+from selenium.common.exceptions import WebDriverException
+from utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+# Client untuk HEAD request ukuran resource yang diblokir
+_http = urllib3.PoolManager(
+    num_pools=8,
+    timeout=urllib3.Timeout(total=Config.PAGE_LOAD_TIMEOUT),
+    retries=urllib3.Retry(total=None, connect=1, read=1, redirect=5),
+    # Ukuran terkompresi, sama seperti yang akan ditransfer browser
+    headers={"User-Agent": "learn-selenium-stats/1.0", "Accept-Encoding": "gzip, deflate, br"},
+)
+
+
+class BlockingStats:
+    """Kumpulan statistik resource blocking per test"""
+
+    def __init__(self):
+        self.tests = {}
+        self._known_sizes = {}
+
+    def collect(self, driver, test_id, profile):
+        """
+        Baca (dan kosongkan) performance log driver, simpan statistik untuk test
+
+        Args:
+            driver: WebDriver instance
+            test_id (str): Pytest node id
+            profile (str): Blocking profile yang aktif
+
+        Returns:
+            dict: Statistik test, atau None jika browser tidak mendukung performance log
+        """
+        if not hasattr(driver, "get_log"):
+            return None
+        try:
+            entries = driver.get_log("performance")
+        except WebDriverException as e:
+            logger.debug("Performance log tidak tersedia: %s", e)
+            return None
+
+        urls = {}
+        record = {
+            "profile": profile,
+            "requests": 0,
+            "transferred_bytes": 0,
+            "blocked_requests": 0,
+            "saved_bytes": 0,
+        }
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method, params = message["method"], message.get("params", {})
+
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFinished":
+                size = int(params.get("encodedDataLength", 0))
+                record["requests"] += 1
+                record["transferred_bytes"] += size
+                url = urls.get(params["requestId"])
+                if url:
+                    self._known_sizes[url] = size
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                record["blocked_requests"] += 1
+                record["saved_bytes"] += self._blocked_size(urls.get(params["requestId"]))
+
+        self.tests[test_id] = record
+        logger.debug(
+            "Blocking stats %s: %s blocked, %s bytes transferred",
+            test_id, record["blocked_requests"], record["transferred_bytes"],
+        )
+        return record
+
+    def _blocked_size(self, url):
+        """
+        Return ukuran resource yang diblokir dalam bytes
+
+        Args:
+            url (str): URL request yang diblokir
+
+        Returns:
+            int: Ukuran dari load tanpa blocking sebelumnya, atau Content-Length HEAD request
+        """
+        if not url or not url.startswith(("http://", "https://")):
+            return 0
+        size = self._known_sizes.get(url)
+        if size is None:
+            size = self._known_sizes[url] = self._head_size(url)
+        return size
+
+    @staticmethod
+    def _head_size(url):
+        """Content-Length dari HEAD request, 0 jika gagal atau tidak ada"""
+        try:
+            response = _http.request("HEAD", url)
+        except urllib3.exceptions.HTTPError as e:
+            logger.debug("HEAD %s gagal: %s", url, e)
+            return 0
+        if response.status >= 400:
+            return 0
+        try:
+            return int(response.headers.get("Content-Length", 0))
+        except ValueError:
+            return 0
+
+    def totals(self):
+        """
+        Return total statistik semua test
+
+        Returns:
+            dict: Jumlah requests, transferred_bytes, blocked_requests, saved_bytes
+        """
+        keys = ("requests", "transferred_bytes", "blocked_requests", "saved_bytes")
+        return {key: sum(record[key] for record in self.tests.values()) for key in keys}
+
+    def format_report(self):
+        """
+        Format report teks per blocking profile untuk terminal summary
+
+        Returns:
+            list: Baris report
+        """
+        keys = ("requests", "transferred_bytes", "blocked_requests", "saved_bytes")
+        profiles = {}
+        for record in self.tests.values():
+            row = profiles.setdefault(record["profile"], dict.fromkeys(("tests",) + keys, 0))
+            row["tests"] += 1
+            for key in keys:
+                row[key] += record[key]
+
+        lines = [f"{'profile':<16}{'tests':>8}{'requests':>10}{'KiB':>10}{'blocked':>10}{'saved KiB':>12}"]
+        for profile, row in sorted(profiles.items()):
+            lines.append(
+                f"{profile:<16}{row['tests']:>8}{row['requests']:>10}{row['transferred_bytes'] / 1024:>10.0f}"
+                f"{row['blocked_requests']:>10}{row['saved_bytes'] / 1024:>12.0f}"
+            )
+        return lines
+
+    def merge(self, path):
+        """
+        Tambahkan statistik dari file hasil save(), mis. report parallel worker
+
+        Args:
+            path (str): Path file JSON
+        """
+        with open(path, encoding="utf-8") as f:
+            self.tests.update(json.load(f)["tests"])
+
+    def save(self, path):
+        """
+        Simpan statistik ke file JSON
+
+        Args:
+            path (str): Path file output
+        """
+        if not self.tests:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"totals": self.totals(), "tests": self.tests}, f, indent=2)
+        logger.info("Blocking stats saved: %s %s", path, self.totals())
@@ -0,0 +1,251 @@
+"""
+Parallel test execution dengan satu browser per worker
+
+Proses utama membagi test ke beberapa worker (subprocess pytest). Test dalam
+satu class selalu ada di worker yang sama agar class-scoped driver fixture
+tidak terpecah. Class yang paling lama (dari TestHistory) dibagikan duluan
+ke worker dengan beban paling kecil. Setiap worker mengirim report-nya
+kembali sebagai JSON lines, lalu di-replay di proses utama sehingga output
+terminal, summary, dan plugin report tetap bekerja seperti run biasa.
+"""
+
+import glob
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from utils.config import Config
+from utils.test_history import TestHistory
+
+WORKER_ID_ENV = "WIKI_WORKER_ID"
+WORKER_REPORT_ENV = "WIKI_WORKER_REPORT"
+
+# Option yang tidak diteruskan ke worker (report dibuat di proses utama)
+_MAIN_ONLY_OPTIONS = ("--workers", "--html", "--junitxml", "--junit-xml", "--alluredir")
+_MAIN_ONLY_FLAGS = ("--self-contained-html",)
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_worker_id():
+    """
+    Return id worker saat ini, atau None jika bukan worker process
+    """
+    return os.environ.get(WORKER_ID_ENV)
+
+
+def worker_files(path):
+    """
+    Return file yang ditulis parallel worker untuk path, urut berdasarkan worker id
+
+    Args:
+        path (str): Path file di proses utama, mis. Config.BLOCKING_STATS_FILE
+
+    Returns:
+        list: mis. ["reports/blocking_stats.gw0.json", "reports/blocking_stats.gws0.json"]
+    """
+    root, ext = os.path.splitext(path)
+    return sorted(glob.glob(f"{glob.escape(root)}.gw*{ext}"))
+
+
+def resolve_worker_count(value):
+    """
+    Convert value option --workers ke jumlah worker
+
+    Args:
+        value (str): Angka, atau "auto" untuk jumlah CPU core
+
+    Returns:
+        int: Jumlah worker
+    """
+    if value in (None, ""):
+        return 1
+    if value == "auto":
+        return os.cpu_count() or 1
+    return max(int(value), 1)
+
+
+def group_key(item):
+    """
+    Key untuk mengelompokkan test yang harus berada di worker yang sama
+
+    Test dalam satu class berbagi class-scoped driver fixture.
+    """
+    parts = item.nodeid.split("::")
+    if item.cls is not None:
+        return "::".join(parts[:2])
+    return parts[0]
+
+
+def shard_items(items, workers, history=None, keep_order=False):
+    """
+    Bagi test ke worker berdasarkan durasi dari run sebelumnya
+
+    Args:
+        items (list): Pytest items
+        workers (int): Jumlah worker
+        history (TestHistory): Sumber durasi
+        keep_order (bool): Urutan group di setiap worker mengikuti urutan items
+                           (default: group paling lama duluan)
+
+    Returns:
+        list: List of list nodeid, satu per worker
+    """
+    history = history or TestHistory()
+
+    groups = {}
+    for item in items:
+        groups.setdefault(group_key(item), []).append(item.nodeid)
+
+    def group_duration(nodeids):
+        return sum(history.duration(nodeid, Config.PARALLEL_DEFAULT_DURATION) for nodeid in nodeids)
+
+    targets = {}
+    loads = [0.0] * workers
+    for key, nodeids in sorted(groups.items(), key=lambda group: group_duration(group[1]), reverse=True):
+        target = targets[key] = loads.index(min(loads))
+        loads[target] += group_duration(nodeids)
+
+    shards = [[] for _ in range(workers)]
+    ordered = groups if keep_order else sorted(groups, key=lambda key: group_duration(groups[key]), reverse=True)
+    for key in ordered:
+        shards[targets[key]].extend(groups[key])
+
+    return [shard for shard in shards if shard]
+
+
+class WorkerReporter:
+    """Plugin di worker process: tulis setiap report sebagai JSON line"""
+
+    def __init__(self, config, report_path):
+        self.config = config
+        self.file = open(report_path, "a", encoding="utf-8")
+
+    def pytest_runtest_logreport(self, report):
+        data = self.config.hook.pytest_report_to_serializable(config=self.config, report=report)
+        self.file.write(json.dumps(data) + "\n")
+        self.file.flush()
+
+    def pytest_unconfigure(self, config):
+        self.file.close()
+
+
+class ParallelRunner:
+    """Plugin di proses utama: jalankan worker dan replay report-nya"""
+
+    def __init__(self, config, workers, keep_order=False):
+        self.config = config
+        self.workers = workers
+        self.keep_order = keep_order
+        self.output_dir = os.path.join(Config.REPORT_PATH, "workers")
+
+    def pytest_runtestloop(self, session):
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            return None
+        if session.config.option.collectonly or not session.items:
+            return None
+
+        self.run_items(session, session.items, keep_order=self.keep_order)
+        return True
+
+    def run_items(self, session, items, prefix="gw", extra_args=(), keep_order=False):
+        """
+        Jalankan items di worker process dan replay report-nya ke session
+
+        Args:
+            session: Pytest session
+            items (list): Pytest items
+            prefix (str): Prefix worker id
+            extra_args (tuple): Argumen tambahan untuk worker, mis. ("--browser", "chrome")
+            keep_order (bool): Pertahankan urutan items di setiap worker
+        """
+        shards = shard_items(items, self.workers, keep_order=keep_order)
+        os.makedirs(self.output_dir, exist_ok=True)
+        logger.info("Running %s tests on %s worker(s)", len(items), len(shards))
+
+        procs = [
+            self._start_worker(f"{prefix}{index}", nodeids, extra_args)
+            for index, nodeids in enumerate(shards)
+        ]
+        offsets = {proc["report"]: 0 for proc in procs}
+
+        while True:
+            running = [proc for proc in procs if proc["process"].poll() is None]
+            for proc in procs:
+                offsets[proc["report"]] = self._replay(proc["report"], offsets[proc["report"]])
+            if not running:
+                break
+            time.sleep(0.2)
+
+        for proc in procs:
+            proc["log"].close()
+            code = proc["process"].returncode
+            if code not in (0, 1, 5):
+                session.testsfailed += 1
+                self.config.get_terminal_writer().line(
+                    f"worker {proc['id']} exited with code {code}, see {proc['log'].name}", red=True
+                )
+
+    def _start_worker(self, worker_id, nodeids, extra_args=()):
+        args_file = os.path.join(self.output_dir, f"{worker_id}.args")
+        report_file = os.path.join(self.output_dir, f"{worker_id}.jsonl")
+        # Path absolut agar tetap valid walau pytest dijalankan dari luar rootdir
+        rootdir = str(self.config.rootpath)
+        with open(args_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(os.path.join(rootdir, nodeid) for nodeid in nodeids))
+        open(report_file, "w").close()
+
+        env = dict(os.environ)
+        env[WORKER_ID_ENV] = worker_id
+        env[WORKER_REPORT_ENV] = os.path.abspath(report_file)
+
+        cmd = [sys.executable, "-m", "pytest", *self._worker_args(), *extra_args, f"@{args_file}"]
+        log = open(os.path.join(self.output_dir, f"{worker_id}.log"), "w", encoding="utf-8")
+        process = subprocess.Popen(
+            cmd, cwd=str(self.config.invocation_params.dir), env=env, stdout=log, stderr=subprocess.STDOUT
+        )
+        logger.debug("Started worker %s with %s tests", worker_id, len(nodeids))
+        return {"id": worker_id, "process": process, "report": report_file, "log": log}
+
+    def _worker_args(self):
+        """Argumen command line asli tanpa path test dan option khusus proses utama"""
+        args = []
+        skip_next = False
+        for arg in self.config.invocation_params.args:
+            if skip_next:
+                skip_next = False
+                continue
+            if arg in _MAIN_ONLY_FLAGS:
+                continue
+            if arg in _MAIN_ONLY_OPTIONS:
+                skip_next = True
+                continue
+            if arg.split("=", 1)[0] in _MAIN_ONLY_OPTIONS:
+                continue
+            if not arg.startswith("-") and os.path.exists(
+                os.path.join(str(self.config.invocation_params.dir), arg.split("::")[0])
+            ):
+                continue
+            args.append(arg)
+        return args
+
+    def _replay(self, report_file, offset):
+        """Replay report baru dari worker, return offset terakhir yang dibaca"""
+        with open(report_file, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+
+        # Session plugin ikut menerima logreport, jadi testsfailed terhitung otomatis
+        hook = self.config.hook
+        for line in complete.decode("utf-8").splitlines():
+            report = hook.pytest_report_from_serializable(config=self.config, data=json.loads(line))
+            if report.when == "setup":
+                hook.pytest_runtest_logstart(nodeid=report.nodeid, location=report.location)
+            hook.pytest_runtest_logreport(report=report)
+            if report.when == "teardown":
+                hook.pytest_runtest_logfinish(nodeid=report.nodeid, location=report.location)
+        return offset + len(complete)
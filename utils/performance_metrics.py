@@ -0,0 +1,124 @@
+"""
+Browser performance metrics per navigasi, dengan budget per page object
+
+Metrics (ms kecuali disebut lain) diambil dari Navigation Timing, Paint Timing,
+LCP dan layout-shift entries dalam satu execute_async_script call:
+    ttfb, dom_content_loaded, load, fcp, lcp, cls (tanpa satuan),
+    resources (jumlah), transfer_size (bytes)
+"""
+
+import json
+import logging
+import os
+
+
+logger = logging.getLogger(__name__)
+
+
+class PerformanceMetrics:
+    """Metrics navigasi per test dan budget violations"""
+
+    def __init__(self):
+        self.current_test = None
+        self.tests = {}
+        self.violations = {}
+        self._time_origins = {}
+
+    def last_time_origin(self, driver):
+        """Return performance.timeOrigin dokumen terakhir yang diukur untuk driver"""
+        return self._time_origins.get(id(driver))
+
+    def record(self, driver, page, metrics, budget=None):
+        """
+        Simpan metrics satu navigasi dan check terhadap budget
+
+        Args:
+            driver: WebDriver instance yang melakukan navigasi
+            page (str): Nama page object, mis. ArticlePage
+            metrics (dict): Hasil PERFORMANCE_METRICS_JS
+            budget (dict): Batas per metric, mis. {"lcp": 2500}
+
+        Returns:
+            dict: Record yang disimpan, termasuk daftar violations
+        """
+        self._time_origins[id(driver)] = metrics.get("time_origin")
+        test = self.current_test or "<no test>"
+
+        violations = []
+        for metric, limit in (budget or {}).items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{page} {metric}={value} > budget {limit} ({metrics.get('url')})")
+
+        record = dict(metrics, page=page, violations=violations)
+        self.tests.setdefault(test, []).append(record)
+        if violations:
+            self.violations.setdefault(test, []).extend(violations)
+            logger.warning("Performance budget exceeded: %s", "; ".join(violations))
+        else:
+            logger.debug("Performance metrics %s: lcp=%s cls=%s", page, metrics.get("lcp"), metrics.get("cls"))
+        return record
+
+    def format_report(self, limit=15):
+        """
+        Format report teks untuk terminal summary: metrics per page object dan budget violations
+
+        Args:
+            limit (int): Jumlah violations yang ditampilkan
+
+        Returns:
+            list: Baris report
+        """
+        pages = {}
+        for records in self.tests.values():
+            for record in records:
+                pages.setdefault(record["page"], []).append(record)
+
+        lines = [f"{'page':<24}{'navigations':>12}{'max ttfb':>10}{'max lcp':>10}{'max cls':>10}"]
+        for page, records in sorted(pages.items()):
+            worst = {
+                metric: max((record[metric] for record in records if record.get(metric) is not None), default=None)
+                for metric in ("ttfb", "lcp", "cls")
+            }
+            cells = "".join(f"{'-' if value is None else round(value, 3):>10}" for value in worst.values())
+            lines.append(f"{page:<24}{len(records):>12}{cells}")
+
+        violations = [(test, violation) for test, items in self.violations.items() for violation in items]
+        if violations:
+            lines.append("")
+            lines.append(f"Budget violations ({len(violations)}):")
+            for test, violation in violations[:limit]:
+                lines.append(f"  {test}: {violation}")
+        return lines
+
+    def merge(self, path):
+        """
+        Tambahkan metrics dari file hasil save(), mis. report parallel worker
+
+        Args:
+            path (str): Path file JSON
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for test, records in data["tests"].items():
+            self.tests.setdefault(test, []).extend(records)
+        for test, violations in data["violations"].items():
+            self.violations.setdefault(test, []).extend(violations)
+
+    def save(self, path):
+        """
+        Simpan metrics semua test ke file JSON
+
+        Args:
+            path (str): Path file output
+        """
+        if not self.tests:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"tests": self.tests, "violations": self.violations}, f, indent=2)
+        logger.info("Performance metrics saved: %s", path)
+
+
+# Store yang dipakai BasePage dan pytest hooks
+performance_metrics = PerformanceMetrics()
@@ -0,0 +1,167 @@
+"""
+Smoke-first scheduling dengan fail-fast gate
+
+Test dibagi menjadi dua tier: smoke (marker @pytest.mark.smoke) dan sisanya
+(regression dan test tanpa marker). Tier smoke dijalankan duluan di worker
+process dengan browser tercepat yang terinstall dan launch profile "fast".
+Jika ada smoke test yang gagal, run berhenti sebelum tier regression dimulai.
+Jika salah satu tier kosong, gate dilewati dan test dijalankan seperti biasa;
+hasil gate (passed, failed, skipped) ditampilkan di terminal summary.
+
+Di dalam setiap tier, test yang paling mungkin gagal dijalankan duluan
+(gagal di run terakhir, lalu failure rate dari TestHistory), kemudian yang
+paling cepat. Test dalam satu class tetap berurutan agar class-scoped driver
+fixture dipakai ulang.
+"""
+
+import logging
+
+import pytest
+
+from utils.config import Config
+from utils.driver_cache import get_browser_version
+from utils.parallel import ParallelRunner, group_key
+from utils.test_history import TestHistory
+
+
+logger = logging.getLogger(__name__)
+
+
+def fastest_browser(candidates=None):
+    """
+    Return browser pertama dari candidates yang terinstall
+
+    Args:
+        candidates (list): Browser urut dari yang paling cepat start (default: Config.SMOKE_BROWSERS)
+
+    Returns:
+        str: Nama browser, atau Config.BROWSER jika tidak ada yang terdeteksi
+    """
+    for browser in candidates or Config.SMOKE_BROWSERS:
+        if get_browser_version(browser):
+            return browser
+    return Config.BROWSER
+
+
+def prioritize(items, history=None):
+    """
+    Urutkan items: yang paling mungkin gagal duluan, lalu yang paling cepat
+
+    Test dalam satu class (group_key) tetap berdekatan, group diurutkan
+    dengan test prioritas tertingginya.
+
+    Args:
+        items (list): Pytest items
+        history (TestHistory): Sumber durasi dan hasil run sebelumnya
+
+    Returns:
+        list: Items yang sudah diurutkan
+    """
+    history = history or TestHistory()
+
+    def test_key(item):
+        return (
+            not history.last_failed(item.nodeid),
+            -history.failure_rate(item.nodeid),
+            history.duration(item.nodeid, Config.PARALLEL_DEFAULT_DURATION),
+        )
+
+    groups = {}
+    for item in items:
+        groups.setdefault(group_key(item), []).append(item)
+    for group in groups.values():
+        group.sort(key=test_key)
+
+    def group_sort_key(group):
+        first = test_key(group[0])
+        return first[:2] + (sum(test_key(item)[2] for item in group),)
+
+    return [item for group in sorted(groups.values(), key=group_sort_key) for item in group]
+
+
+class SmokeGateScheduler:
+    """Pytest plugin: jalankan tier smoke duluan, hentikan run jika ada yang gagal"""
+
+    def __init__(self, config, workers=1, browser=None, history=None):
+        """
+        Initialize SmokeGateScheduler
+
+        Args:
+            config: Pytest config
+            workers (int): Jumlah worker untuk tier smoke
+            browser (str): Browser untuk tier smoke (default: fastest_browser())
+            history (TestHistory): Sumber durasi dan hasil run sebelumnya
+        """
+        self.config = config
+        self.workers = workers
+        self.browser = browser
+        self.history = history or TestHistory()
+        self.smoke = []
+        self.regression = []
+        # Hasil gate untuk terminal summary: (message, warna)
+        self.outcome = None
+
+    @property
+    def skip_reason(self):
+        """Alasan gate dilewati (salah satu tier kosong), None jika gate dijalankan"""
+        if not self.smoke:
+            return "no smoke tests"
+        if not self.regression:
+            return "no regression tests"
+        return None
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        smoke = [item for item in items if item.get_closest_marker(Config.SMOKE_MARKER)]
+        smoke_ids = {item.nodeid for item in smoke}
+        regression = [item for item in items if item.nodeid not in smoke_ids]
+        self.smoke = prioritize(smoke, self.history)
+        self.regression = prioritize(regression, self.history)
+        items[:] = self.smoke + self.regression
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        tiers = f"{len(self.smoke)} smoke, {len(self.regression)} regression tests"
+        if self.skip_reason:
+            return f"smoke gate: skipped ({self.skip_reason}), {tiers}"
+        return f"smoke gate: {tiers}"
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        if session.testsfailed and not session.config.option.continue_on_collection_errors:
+            return None
+        if session.config.option.collectonly:
+            return None
+        if self.skip_reason:
+            # Tanpa gate: semua test dijalankan runtestloop berikutnya dengan browser biasa
+            self.outcome = (f"Smoke gate skipped: {self.skip_reason}, {len(session.items)} tests run without gate", "yellow")
+            logger.info(self.outcome[0])
+            return None
+
+        browser = self.browser or fastest_browser()
+        logger.info("Smoke tier: %s tests on %s (%s profile)", len(self.smoke), browser, Config.SMOKE_LAUNCH_PROFILE)
+        runner = ParallelRunner(self.config, self.workers)
+        runner.run_items(
+            session, self.smoke, prefix="gws",
+            extra_args=("--browser", browser, "--launch-profile", Config.SMOKE_LAUNCH_PROFILE),
+            keep_order=True,
+        )
+
+        if session.testsfailed:
+            self.outcome = (
+                f"Smoke gate failed: {session.testsfailed} smoke test(s) failed, "
+                f"{len(self.regression)} regression tests not started",
+                "red",
+            )
+            logger.error(self.outcome[0])
+            return True
+
+        self.outcome = (f"Smoke gate passed: {len(self.smoke)} smoke tests on {browser}", "green")
+        logger.info(self.outcome[0])
+        # Tier regression dijalankan runtestloop berikutnya (ParallelRunner atau in-process)
+        session.items = self.regression
+        return None
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.outcome:
+            message, color = self.outcome
+            terminalreporter.write_line(message, **{color: True})
@@ -0,0 +1,127 @@
+"""
+Riwayat durasi dan hasil test dari run sebelumnya
+
+Dipakai untuk scheduling (test class yang paling lama dijalankan duluan).
+File dibagi antar proses, jadi setiap save di-merge di bawah file lock.
+"""
+
+import json
+import os
+from utils.config import Config
+from utils.driver_cache import file_lock
+
+
+class TestHistory:
+    """Durasi per test (nodeid) dari run sebelumnya"""
+
+    __test__ = False  # bukan test class untuk pytest
+
+    def __init__(self, path=None):
+        """
+        Initialize TestHistory
+
+        Args:
+            path (str): Path file JSON history
+        """
+        self.path = path or Config.TEST_HISTORY_FILE
+        self.lock_file = f"{self.path}.lock"
+        self.entries = self._load()
+        self._pending = {}
+
+    def duration(self, nodeid, default=None):
+        """
+        Get durasi terakhir dari test
+
+        Args:
+            nodeid (str): Pytest node id
+            default (float): Nilai jika test belum pernah dijalankan
+
+        Returns:
+            float: Durasi dalam detik
+        """
+        entry = self.entries.get(nodeid)
+        return entry["duration"] if entry else default
+
+    def failure_rate(self, nodeid, default=0.0):
+        """
+        Get rasio run yang gagal dari semua run test
+
+        Args:
+            nodeid (str): Pytest node id
+            default (float): Nilai jika test belum pernah dijalankan
+
+        Returns:
+            float: 0.0 sampai 1.0
+        """
+        entry = self.entries.get(nodeid)
+        if not entry or not entry.get("runs"):
+            return default
+        return entry.get("failures", 0) / entry["runs"]
+
+    def last_failed(self, nodeid):
+        """Return True jika run terakhir test gagal"""
+        entry = self.entries.get(nodeid)
+        return bool(entry) and entry["outcome"] == "failed"
+
+    def record(self, nodeid, duration, outcome):
+        """
+        Catat hasil test (disimpan saat save() dipanggil)
+
+        Args:
+            nodeid (str): Pytest node id
+            duration (float): Total durasi setup + call + teardown
+            outcome (str): passed, failed, atau skipped
+        """
+        self._pending[nodeid] = {"duration": duration, "outcome": outcome}
+
+    def save(self):
+        """Merge hasil baru ke file history"""
+        if not self._pending:
+            return
+        with file_lock(self.lock_file):
+            entries = self._load()
+            for nodeid, result in self._pending.items():
+                entries[nodeid] = self._merge(entries.get(nodeid), result)
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_file = f"{self.path}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.path)
+        self.entries = entries
+        self._pending = {}
+
+    @staticmethod
+    def _merge(entry, result):
+        entry = dict(entry or {"runs": 0})
+        entry["runs"] += 1
+        entry["failures"] = entry.get("failures", 0) + (result["outcome"] == "failed")
+        entry["duration"] = result["duration"]
+        entry["outcome"] = result["outcome"]
+        return entry
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class HistoryRecorder:
+    """Pytest plugin yang mencatat durasi dan hasil setiap test ke TestHistory"""
+
+    def __init__(self, history=None):
+        self.history = history or TestHistory()
+        self._durations = {}
+        self._outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        self._durations[report.nodeid] = self._durations.get(report.nodeid, 0.0) + report.duration
+        if report.when == "call" or report.outcome != "passed":
+            self._outcomes.setdefault(report.nodeid, report.outcome)
+        if report.when == "teardown":
+            outcome = self._outcomes.pop(report.nodeid, "passed")
+            self.history.record(report.nodeid, self._durations.pop(report.nodeid), outcome)
+
+    def pytest_sessionfinish(self, session):
+        self.history.save()
@@ -0,0 +1,350 @@
+"""
+Test-impact selection: jalankan hanya test yang terpengaruh file yang berubah
+
+Saat run dengan --record-impact, setiap function call di file repo dicatat
+(sys.setprofile) selama test function dan fixture-nya berjalan: page object,
+BasePage, utils, dan test file itu sendiri. Hook pytest (tracing, history)
+tidak ikut dicatat. Call di fixture class/session scope (mis. driver,
+driver_pool) dicatat per fixture, karena hanya terjadi di test pertama yang
+memakainya. Map disimpan di Config.TEST_IMPACT_FILE.
+
+File yang hanya berisi data tidak pernah "dipanggil", jadi ikut dicatat lewat
+dua jalur lain:
+    - module repo yang di-import langsung oleh file yang tercatat
+      (mis. pages/scripts.py lewat pages/base_page.py)
+    - file repo yang dibuka untuk dibaca selama test (audit hook "open"),
+      mis. recordings stand-in server dan test data
+
+Dengan --impact, file yang berubah sejak Config.IMPACT_BASE (git) dicocokkan
+dengan map. Test yang tidak terpengaruh di-deselect. Semua test dijalankan
+jika map belum ada, git tidak tersedia, atau file di Config.IMPACT_GLOBAL_FILES
+berubah (mis. utils/config.py, Config dibaca semua test tanpa function call).
+Test yang belum ada di map (test baru) selalu dijalankan.
+"""
+
+import ast
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+import pytest
+
+from utils.config import Config
+from utils.driver_cache import file_lock
+
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class ImpactMap:
+    """Dependency map test -> file repo, dan fixture -> file repo"""
+
+    def __init__(self, path=None):
+        """
+        Initialize ImpactMap
+
+        Args:
+            path (str): Path file JSON map (default: Config.TEST_IMPACT_FILE)
+        """
+        self.path = path or Config.TEST_IMPACT_FILE
+        self.lock_file = f"{self.path}.lock"
+        data = self._load()
+        self.tests = data.get("tests", {})
+        self.fixtures = data.get("fixtures", {})
+        self._pending_tests = {}
+        self._pending_fixtures = {}
+
+    def __bool__(self):
+        return bool(self.tests)
+
+    def record_test(self, nodeid, files, fixtures):
+        """
+        Catat file yang dipakai test (disimpan saat save() dipanggil)
+
+        Args:
+            nodeid (str): Pytest node id
+            files (iterable): Path file relatif ke rootdir
+            fixtures (iterable): Nama fixture yang dipakai test
+        """
+        self._pending_tests[nodeid] = {"files": sorted(files), "fixtures": sorted(fixtures)}
+
+    def record_fixture(self, name, files):
+        """Catat file yang dipakai saat setup fixture class/session scope"""
+        self._pending_fixtures[name] = sorted(set(self._pending_fixtures.get(name, ())) | set(files))
+
+    def files_for(self, nodeid):
+        """
+        Return semua file yang mempengaruhi test, termasuk lewat fixture-nya
+
+        Returns:
+            set: Path file, atau None jika test belum ada di map
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            return None
+        files = set(entry["files"])
+        for name in entry["fixtures"]:
+            files.update(self.fixtures.get(name, ()))
+        return files
+
+    def save(self):
+        """Merge hasil baru ke file map"""
+        if not self._pending_tests and not self._pending_fixtures:
+            return
+        with file_lock(self.lock_file):
+            data = self._load()
+            data.setdefault("tests", {}).update(self._pending_tests)
+            data.setdefault("fixtures", {}).update(self._pending_fixtures)
+            data["recorded_at"] = datetime.now().isoformat(timespec="seconds")
+            data["commit"] = _git("rev-parse", "HEAD")
+            tmp_file = f"{self.path}.tmp"
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, self.path)
+        self.tests = data["tests"]
+        self.fixtures = data["fixtures"]
+        self._pending_tests = {}
+        self._pending_fixtures = {}
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+def _git(*args, cwd=None):
+    """Jalankan git command, return stdout atau None jika gagal"""
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def changed_files(base=None, cwd=None):
+    """
+    Return file yang berubah sejak base: commit di branch, staged, unstaged, dan untracked
+
+    Args:
+        base (str): Git ref pembanding, mis. HEAD atau origin/main (default: Config.IMPACT_BASE)
+        cwd (str): Directory repo, path hasil relatif ke directory ini
+
+    Returns:
+        set: Path file (separator "/"), atau None jika git tidak tersedia
+    """
+    base = base or Config.IMPACT_BASE
+    # Bandingkan dengan merge base agar perubahan baru di base branch tidak ikut
+    merge_base = _git("merge-base", base, "HEAD", cwd=cwd) or base
+    diff = _git("diff", "--name-only", "--relative", merge_base, cwd=cwd)
+    untracked = _git("ls-files", "--others", "--exclude-standard", cwd=cwd)
+    if diff is None or untracked is None:
+        return None
+    return {path for path in (diff + "\n" + untracked).splitlines() if path}
+
+
+class ImpactRecorder:
+    """Pytest plugin yang merekam file repo yang dipakai setiap test ke ImpactMap"""
+
+    def __init__(self, rootdir, impact_map=None):
+        self.rootdir = os.path.join(os.path.abspath(str(rootdir)), "")
+        self.impact_map = impact_map or ImpactMap()
+        self._paths = {}
+        self._imports = {}
+        self._current = None
+        # Set file yang sedang diisi: test atau fixture class/session scope
+        self._buckets = []
+        self._auditing = False
+
+    def pytest_sessionstart(self, session):
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+        # Audit hook tidak bisa dilepas, dinonaktifkan lewat _auditing
+        sys.addaudithook(self._audit)
+        self._auditing = True
+
+    def pytest_sessionfinish(self, session):
+        sys.setprofile(None)
+        threading.setprofile(None)
+        self._auditing = False
+        self.impact_map.save()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self._current = {self._relative(str(item.path))}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        files = self._with_imports(self._current or set())
+        self._current = None
+        self.impact_map.record_test(item.nodeid, files, item.fixturenames)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_pyfunc_call(self, pyfuncitem):
+        with self._recording(self._current):
+            yield
+
+    # trylast: wrapper paling dalam, span fixture dari conftest tidak ikut dicatat
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if fixturedef.scope == "function":
+            with self._recording(self._current):
+                yield
+            return
+        files = set()
+        with self._recording(files):
+            yield
+        self.impact_map.record_fixture(fixturedef.argname, self._with_imports(files))
+
+    @contextmanager
+    def _recording(self, bucket):
+        if bucket is None:
+            yield
+            return
+        self._buckets.append(bucket)
+        try:
+            yield
+        finally:
+            self._buckets.pop()
+
+    def _profile(self, frame, event, arg):
+        if event != "call" or not self._buckets:
+            return
+        bucket = self._buckets[-1]
+        filename = frame.f_code.co_filename
+        path = self._paths.get(filename, _MISSING)
+        if path is _MISSING:
+            path = self._paths[filename] = self._relative(filename)
+        if path:
+            bucket.add(path)
+
+    def _audit(self, event, args):
+        if event != "open" or not self._auditing or not self._buckets:
+            return
+        path, mode, flags = args
+        if isinstance(path, bytes):
+            path = os.fsdecode(path)
+        if not isinstance(path, str) or "__pycache__" in path:
+            return
+        # Hanya file yang dibaca; log dan report yang ditulis bukan dependency
+        writing = ("w" in mode or "a" in mode or "+" in mode or "x" in mode) if mode else flags & (os.O_WRONLY | os.O_RDWR)
+        if writing:
+            return
+        relative = self._relative(path)
+        if relative:
+            self._buckets[-1].add(relative)
+
+    def _with_imports(self, files):
+        """Tambahkan module repo yang di-import langsung oleh file Python yang tercatat"""
+        result = set(files)
+        for path in files:
+            # File global (mis. tests/conftest.py) sudah menjalankan semua test, import-nya tidak perlu
+            if path.endswith(".py") and path not in Config.IMPACT_GLOBAL_FILES:
+                result.update(self.imports_of(path))
+        return result
+
+    def imports_of(self, path):
+        """
+        Return file repo yang di-import langsung oleh path
+
+        Args:
+            path (str): Path file Python relatif ke rootdir
+
+        Returns:
+            set: Path file relatif ke rootdir
+        """
+        cached = self._imports.get(path)
+        if cached is not None:
+            return cached
+        cached = self._imports[path] = set()
+        # Membaca source di sini bukan dependency test yang sedang berjalan
+        auditing, self._auditing = self._auditing, False
+        try:
+            with open(os.path.join(self.rootdir, path), encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+        except (OSError, SyntaxError, ValueError):
+            return cached
+        finally:
+            self._auditing = auditing
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                # "from pages import scripts" mengimport module pages.scripts
+                names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            for name in names:
+                filename = getattr(sys.modules.get(name), "__file__", None)
+                relative = self._relative(filename) if filename else None
+                if relative and relative != path:
+                    cached.add(relative)
+        return cached
+
+    def _relative(self, filename):
+        """Path relatif ke rootdir untuk file repo, None untuk stdlib dan site-packages"""
+        if filename.startswith("<") or filename == __file__:
+            # <frozen ...>, <string>, dan recorder ini sendiri
+            return None
+        filename = os.path.abspath(filename)
+        if not filename.startswith(self.rootdir) or "site-packages" in filename:
+            return None
+        return os.path.relpath(filename, self.rootdir).replace(os.sep, "/")
+
+
+class ImpactSelector:
+    """Pytest plugin yang men-deselect test yang tidak terpengaruh perubahan"""
+
+    def __init__(self, base=None, impact_map=None):
+        self.base = base or Config.IMPACT_BASE
+        self.impact_map = impact_map or ImpactMap()
+        self.summary = None
+
+    def pytest_collection_modifyitems(self, session, config, items):
+        changed = changed_files(self.base, cwd=str(config.rootpath))
+        reason = self._run_all_reason(changed)
+        if reason:
+            self.summary = f"impact: {reason}, running all {len(items)} tests"
+            logger.warning(self.summary)
+            return
+
+        selected, deselected = [], []
+        for item in items:
+            files = self.impact_map.files_for(item.nodeid)
+            if files is None or files & changed:
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self.summary = (
+            f"impact: {len(changed)} changed file(s) since {self.base}, "
+            f"{len(selected)}/{len(selected) + len(deselected)} tests selected"
+        )
+        logger.info(self.summary)
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        return self.summary
+
+    def _run_all_reason(self, changed):
+        if not self.impact_map:
+            return f"no impact map at {self.impact_map.path} (record one with --record-impact)"
+        if changed is None:
+            return f"git diff against {self.base} failed"
+        changed_global = sorted(changed & set(Config.IMPACT_GLOBAL_FILES))
+        if changed_global:
+            return f"{', '.join(changed_global)} changed"
+        return None
@@ -0,0 +1,186 @@
+"""
+Timeline per test dalam format Chrome trace-event (buka di https://ui.perfetto.dev)
+
+Span yang dicatat:
+    pytest      setup/call/teardown phase
+    fixture     setup fixture, mis. driver dan driver_pool
+    driver      DriverFactory.get_driver (browser startup)
+    page        setiap call method page object, mis. HomePage.open
+    wait        setiap wait_until/observe_until, dengan child span per poll
+    navigation  WebDriver get/back/forward/refresh
+    webdriver   WebDriver command lainnya
+
+Span yang nested (page -> wait -> poll -> webdriver) tampil bertumpuk di thread
+yang sama, jadi terlihat apakah waktu test habis di wait, navigasi atau startup.
+"""
+
+import functools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import nullcontext
+from utils.config import Config
+
+
+logger = logging.getLogger(__name__)
+
+_NAVIGATION_COMMANDS = {"get", "goBack", "goForward", "refresh"}
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager yang menambahkan complete event ("ph": "X") saat selesai"""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.events.append({
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start * 1e6,
+            "dur": (end - self.start) * 1e6,
+            "pid": self.tracer.pid,
+            "tid": threading.get_ident(),
+            "args": self.args,
+        })
+        return False
+
+
+class Tracer:
+    """Kumpulan trace events untuk test yang sedang berjalan"""
+
+    def __init__(self):
+        self.enabled = False
+        self.current_test = None
+        self.events = []
+        self.pid = os.getpid()
+
+    def span(self, name, category, **args):
+        """
+        Context manager untuk satu span, tidak mencatat apa pun saat tracing nonaktif
+
+        Args:
+            name (str): Nama span di timeline
+            category (str): Category (page, wait, navigation, ...)
+            **args: Detail yang ditampilkan saat span dipilih
+
+        Returns:
+            Context manager
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+
+    def instrument(self, driver):
+        """
+        Bungkus driver.execute agar setiap WebDriver command menjadi span
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            WebDriver: Driver yang sama
+        """
+        if getattr(driver, "_tracer", None) is self:
+            return driver
+
+        original_execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            if not self.enabled:
+                return original_execute(driver_command, params)
+            if driver_command in _NAVIGATION_COMMANDS:
+                span = self.span(driver_command, "navigation", url=(params or {}).get("url"))
+            else:
+                span = self.span(driver_command, "webdriver")
+            with span:
+                return original_execute(driver_command, params)
+
+        driver.execute = traced_execute
+        driver._tracer = self
+        return driver
+
+    def start_test(self, nodeid):
+        """Mulai timeline baru untuk test"""
+        self.current_test = nodeid
+        self.events = []
+
+    def finish_test(self, trace_dir=None):
+        """
+        Simpan timeline test yang sedang berjalan
+
+        Args:
+            trace_dir (str): Folder output (default: Config.TRACE_PATH)
+
+        Returns:
+            str: Path file trace, atau None jika tidak ada events
+        """
+        events, nodeid = self.events, self.current_test
+        self.events, self.current_test = [], None
+        if not events or nodeid is None:
+            return None
+
+        trace_dir = trace_dir or Config.TRACE_PATH
+        os.makedirs(trace_dir, exist_ok=True)
+        path = os.path.join(trace_dir, f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', nodeid)[-150:]}.json")
+
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": nodeid}},
+        ]
+        for tid in {event["tid"] for event in events}:
+            name = "main" if tid == threading.main_thread().ident else f"thread-{tid}"
+            metadata.append({"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}})
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+        logger.debug("Trace saved: %s (%s events)", path, len(events))
+        return path
+
+
+def trace_methods(cls, category="page", exclude=()):
+    """
+    Bungkus method public yang didefinisikan di cls agar setiap call menjadi span
+
+    Nama span memakai class instance, mis. HomePage.open atau SearchResult.get_title.
+
+    Args:
+        cls: Class page object
+        category (str): Category span
+        exclude (iterable): Nama method yang tidak dibungkus (mis. yang mencatat span sendiri)
+    """
+    for name, value in list(vars(cls).items()):
+        if name.startswith("_") or name in exclude or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+            continue
+        setattr(cls, name, _traced(value, category))
+
+
+def _traced(method, category):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not tracer.enabled:
+            return method(*args, **kwargs)
+        with tracer.span(f"{type(args[0]).__name__}.{method.__name__}", category):
+            return method(*args, **kwargs)
+
+    return wrapper
+
+
+# Tracer yang dipakai pytest hooks, DriverFactory dan page objects
+tracer = Tracer()